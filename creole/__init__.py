@@ -13,16 +13,9 @@
 """
 
 
+import importlib
 import warnings
 
-from creole.emitter.creol2html_emitter import HtmlEmitter
-from creole.emitter.html2creole_emitter import CreoleEmitter
-from creole.emitter.html2markdown_emitter import MarkdownEmitter
-from creole.emitter.html2rest_emitter import ReStructuredTextEmitter
-from creole.emitter.html2textile_emitter import TextileEmitter
-from creole.parser.creol2html_parser import CreoleParser
-from creole.parser.html_parser import HtmlParser
-
 
 __version__ = "1.5.0.rc3"
 __api__ = "1.0"  # Creole 1.0 spec - http://wikicreole.org/
@@ -31,6 +24,41 @@ VERSION_STRING = __version__  # remove in future
 API_STRING = __api__  # remove in future
 
 
+# The parsers, emitters and the async API are imported on first use (PEP 562),
+# so "import creole" doesn't import (and compile the regexes of) all of them:
+LAZY_ATTRIBUTES = {
+    "Creole2HtmlConverter": "creole.converter",
+    "HtmlEmitter": "creole.emitter.creol2html_emitter",
+    "CreoleEmitter": "creole.emitter.html2creole_emitter",
+    "MarkdownEmitter": "creole.emitter.html2markdown_emitter",
+    "ReStructuredTextEmitter": "creole.emitter.html2rest_emitter",
+    "TextileEmitter": "creole.emitter.html2textile_emitter",
+    "CreoleParser": "creole.parser.creol2html_parser",
+    "HtmlParser": "creole.parser.html_parser",
+    # async API, see: creole.aio
+    "acreole2html": "creole.aio",
+    "ahtml2creole": "creole.aio",
+    "ahtml2markdown": "creole.aio",
+    "ahtml2rest": "creole.aio",
+    "ahtml2textile": "creole.aio",
+}
+
+
+def __getattr__(name):
+    try:
+        module_name = LAZY_ATTRIBUTES[name]
+    except KeyError:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}") from None
+
+    value = getattr(importlib.import_module(module_name), name)
+    globals()[name] = value  # __getattr__ is not called again for this name
+    return value
+
+
+def __dir__():
+    return sorted(set(globals()) | set(LAZY_ATTRIBUTES))
+
+
 def creole2html(markup_string, debug=False,
                 block_rules=None, blog_line_breaks=True,
                 macros=None, verbose=None, stderr=None,
@@ -43,32 +71,56 @@ def creole2html(markup_string, debug=False,
     '<p>This is <strong>creole <i>markup</i></strong>!</p>'
 
     Info: parser_kwargs and emitter_kwargs are deprecated
+
+    Use Creole2HtmlConverter to convert many documents with the same options.
     """
     assert isinstance(markup_string, str), "given markup_string must be unicode!"
+    from creole.converter import Creole2HtmlConverter
 
-    # Create document tree from creole markup
-    document = CreoleParser(
-        markup_string,
+    converter = Creole2HtmlConverter(
         block_rules=block_rules,
         blog_line_breaks=blog_line_breaks,
-        debug=debug
-    ).parse()
-    if debug:
-        document.debug()
+        macros=macros,
+        verbose=verbose,
+        stderr=stderr,
+        strict=strict,
+        debug=debug,
+    )
+    return converter(markup_string)
 
-    # Build html code from document tree
-    return HtmlEmitter(
-        document,
+
+def iter_creole2html(markup_string, debug=False,
+                     block_rules=None, blog_line_breaks=True,
+                     macros=None, verbose=None, stderr=None,
+                     strict=False,
+                     ):
+    """
+    convert creole markup into html code and yield the html of
+    every top-level block, as soon as it's ready.
+
+    >>> list(iter_creole2html('This is **creole //markup//**!'))
+    ['<p>This is <strong>creole <i>markup</i></strong>!</p>']
+
+    See: Creole2HtmlConverter.iter_convert()
+    """
+    from creole.converter import Creole2HtmlConverter
+
+    converter = Creole2HtmlConverter(
+        block_rules=block_rules,
+        blog_line_breaks=blog_line_breaks,
         macros=macros,
         verbose=verbose,
         stderr=stderr,
-        strict=strict
-    ).emit()
+        strict=strict,
+        debug=debug,
+    )
+    return converter.iter_convert(markup_string)
 
 
 def parse_html(html_string, debug=False):
     """ create the document tree from html code """
     assert isinstance(html_string, str), "given html_string must be unicode!"
+    from creole.parser.html_parser import HtmlParser
 
     h2c = HtmlParser(debug=debug)
     document_tree = h2c.feed(html_string)
@@ -89,6 +141,8 @@ def html2creole(
     >>> html2creole('<p>This is <strong>creole <i>markup</i></strong>!</p>')
     'This is **creole //markup//**!'
     """
+    from creole.emitter.html2creole_emitter import CreoleEmitter
+
     document_tree = parse_html(html_string, debug=debug)
 
     # create creole markup from the document tree
@@ -105,6 +159,8 @@ def html2textile(html_string, debug=False,
     >>> html2textile('<p>This is <strong>textile <i>markup</i></strong>!</p>')
     'This is *textile __markup__*!'
     """
+    from creole.emitter.html2textile_emitter import TextileEmitter
+
     document_tree = parse_html(html_string, debug=debug)
 
     # create textile markup from the document tree
@@ -119,6 +175,8 @@ def html2markdown(html_string, debug=False, unknown_emit=None):
     >>> html2markdown('<p>This is <strong>markdown <i>markup</i></strong>!</p>')
     'This is **markdown _markup_**!'
     """
+    from creole.emitter.html2markdown_emitter import MarkdownEmitter
+
     document_tree = parse_html(html_string, debug=debug)
 
     # create markdown markup from the document tree
@@ -135,6 +193,8 @@ def html2rest(html_string, debug=False,
     >>> html2rest('<p>This is <strong>ReStructuredText</strong> <em>markup</em>!</p>')
     'This is **ReStructuredText** *markup*!'
     """
+    from creole.emitter.html2rest_emitter import ReStructuredTextEmitter
+
     document_tree = parse_html(html_string, debug=debug)
 
     # create ReStructuredText markup from the document tree
@@ -0,0 +1,112 @@
+"""
+    python-creole async API
+    ~~~~~~~~~~~~~~~~~~~~~~~
+
+    Coroutines that run the converter in an executor, so a large document
+    doesn't block the event loop:
+
+        from creole import acreole2html
+
+        async def handler(request):
+            html = await acreole2html(await request.text())
+
+    Small documents are converted directly, without the executor overhead.
+    The executor can be set with configure(), e.g. a ProcessPoolExecutor
+    (Then all arguments, e.g. the macros, must be picklable).
+
+    If the awaiting task is cancelled, the conversion would be removed from
+    the executor queue. A conversion that is already running can't be
+    stopped, but its result is discarded.
+
+    :copyleft: 2026 by python-creole team, see AUTHORS for more details.
+    :license: GNU GPL v3 or above, see LICENSE for more details.
+"""
+
+
+import asyncio
+import functools
+
+from creole import creole2html, html2creole, html2markdown, html2rest, html2textile
+
+
+# Documents with less characters are converted in the event loop:
+INLINE_THRESHOLD = 16 * 1024
+
+
+class AsyncConverter:
+    """
+    Run convert functions in the given executor, None is the default
+    executor of the event loop (a ThreadPoolExecutor).
+
+    >>> converter = AsyncConverter(inline_threshold=0)
+    >>> asyncio.run(converter.run(creole2html, "**bold**"))
+    '<p><strong>bold</strong></p>'
+    """
+
+    def __init__(self, executor=None, inline_threshold=INLINE_THRESHOLD):
+        self.executor = executor
+        self.inline_threshold = inline_threshold
+
+    async def run(self, convert_func, source, **kwargs):
+        if len(source) < self.inline_threshold:
+            return convert_func(source, **kwargs)
+
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(
+            self.executor, functools.partial(convert_func, source, **kwargs)
+        )
+
+
+# The shared converter, used by acreole2html() etc.
+default_converter = AsyncConverter()
+
+
+def configure(executor=None, inline_threshold=INLINE_THRESHOLD):
+    """
+    Set the executor and the inline threshold for acreole2html() etc.
+    The executor is not shut down by python-creole.
+    """
+    default_converter.executor = executor
+    default_converter.inline_threshold = inline_threshold
+
+
+async def acreole2html(markup_string, **kwargs):
+    """
+    async creole2html(), the keyword arguments are the same.
+
+    >>> asyncio.run(acreole2html('This is **creole //markup//**!'))
+    '<p>This is <strong>creole <i>markup</i></strong>!</p>'
+    """
+    return await default_converter.run(creole2html, markup_string, **kwargs)
+
+
+async def ahtml2creole(html_string, **kwargs):
+    """
+    >>> asyncio.run(ahtml2creole('<p>This is <strong>creole <i>markup</i></strong>!</p>'))
+    'This is **creole //markup//**!'
+    """
+    return await default_converter.run(html2creole, html_string, **kwargs)
+
+
+async def ahtml2textile(html_string, **kwargs):
+    """
+    >>> asyncio.run(ahtml2textile('<p>This is <strong>textile <i>markup</i></strong>!</p>'))
+    'This is *textile __markup__*!'
+    """
+    return await default_converter.run(html2textile, html_string, **kwargs)
+
+
+async def ahtml2markdown(html_string, **kwargs):
+    """
+    >>> asyncio.run(ahtml2markdown('<p>This is <strong>markdown <i>markup</i></strong>!</p>'))
+    'This is **markdown _markup_**!'
+    """
+    return await default_converter.run(html2markdown, html_string, **kwargs)
+
+
+async def ahtml2rest(html_string, **kwargs):
+    """
+    >>> asyncio.run(ahtml2rest('<p>This is <strong>ReStructuredText</strong> <em>markup</em>!</p>'))
+    'This is **ReStructuredText** *markup*!'
+    """
+    return await default_converter.run(html2rest, html_string, **kwargs)
@@ -0,0 +1,239 @@
+"""
+    python-creole batch conversion
+    ~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~
+
+    Convert many documents in parallel with a pool of worker processes:
+
+        from creole.batch import convert_many
+
+        for result in convert_many(pages, direction="creole2html", workers=4):
+            if result.error is None:
+                save(result.index, result.output)
+
+    Every worker creates its converter only once (see: get_converter())
+    and converts the documents in chunks. The regular expressions etc. are
+    compiled only once per worker, too.
+
+    :copyleft: 2026 by python-creole team, see AUTHORS for more details.
+    :license: GNU GPL v3 or above, see LICENSE for more details.
+"""
+
+
+import functools
+import os
+from collections import deque, namedtuple
+from concurrent.futures import FIRST_COMPLETED, Future, ProcessPoolExecutor, wait
+from concurrent.futures.process import BrokenProcessPool
+
+from creole import html2creole, html2markdown, html2rest, html2textile
+from creole.converter import Creole2HtmlConverter
+
+
+DIRECTIONS = {
+    "creole2html": Creole2HtmlConverter,
+    "html2creole": html2creole,
+    "html2markdown": html2markdown,
+    "html2rest": html2rest,
+    "html2textile": html2textile,
+}
+
+# The result for one document. output is None if the conversion failed and
+# error is None if not, otherwise it's the error message.
+BatchResult = namedtuple("BatchResult", "index output error")
+
+
+def get_converter(direction, options=None):
+    """
+    Returns a callable that converts one document with the given options.
+
+    >>> convert = get_converter("creole2html", {"blog_line_breaks": False})
+    >>> convert("one\\ntwo")
+    '<p>one two</p>'
+    >>> get_converter("html2creole")("<p><strong>bold</strong></p>")
+    '**bold**'
+    """
+    try:
+        converter = DIRECTIONS[direction]
+    except KeyError:
+        raise ValueError(f"Unknown direction {direction!r}, choose from: {', '.join(DIRECTIONS)}")
+
+    if options is None:
+        options = {}
+
+    if converter is Creole2HtmlConverter:
+        return converter(**options)
+    elif options:
+        return functools.partial(converter, **options)
+    return converter
+
+
+def convert_chunk(convert, chunk):
+    """
+    Convert a chunk of (index, document) tuples and returns a list of
+    BatchResult. A error is stored in the result and doesn't stop the
+    conversion of the other documents:
+
+    >>> convert_chunk(get_converter("creole2html"), [(0, "**bold**"), (1, None)])
+    [BatchResult(index=0, output='<p><strong>bold</strong></p>', error=None), \
+BatchResult(index=1, output=None, error='AssertionError: given markup_string must be unicode!')]
+    """
+    results = []
+    for index, document in chunk:
+        try:
+            output = convert(document)
+        except Exception as err:
+            results.append(BatchResult(index, None, f"{err.__class__.__name__}: {err}"))
+        else:
+            results.append(BatchResult(index, output, None))
+    return results
+
+
+def iter_chunks(iterable, chunksize):
+    """
+    >>> list(iter_chunks(range(5), 2))
+    [[0, 1], [2, 3], [4]]
+    """
+    chunk = []
+    for item in iterable:
+        chunk.append(item)
+        if len(chunk) >= chunksize:
+            yield chunk
+            chunk = []
+    if chunk:
+        yield chunk
+
+
+# The converter of the current worker process, see: _init_worker()
+_worker_convert = None
+
+
+def _init_worker(direction, options):
+    global _worker_convert
+    _worker_convert = get_converter(direction, options)
+
+
+def _convert_chunk_in_worker(chunk):
+    return convert_chunk(_worker_convert, chunk)
+
+
+def _chunk_results(future, chunk):
+    """
+    Returns the result list of the finished future. If the whole chunk
+    failed, e.g. with a BrokenProcessPool or a document that can't be
+    pickled, every document of the chunk gets the error as result.
+    """
+    try:
+        return future.result()
+    except Exception as err:
+        error = f"{err.__class__.__name__}: {err}"
+        return [BatchResult(index, None, error) for index, document in chunk]
+
+
+def _iter_pool(chunks, direction, options, workers, ordered):
+    """
+    Convert the chunks in the worker pool and yield the result lists.
+    Only 2 chunks per worker are submitted in advance, so the documents
+    are not read completely into memory.
+    """
+    max_pending = workers * 2
+    if ordered:
+        pending = deque()
+    else:
+        pending = set()
+    pending_chunks = {}  # future -> chunk
+
+    def collect():
+        if ordered:
+            done = (pending.popleft(),)
+        else:
+            done, not_done = wait(pending, return_when=FIRST_COMPLETED)
+            pending.difference_update(done)
+        for future in done:
+            yield _chunk_results(future, pending_chunks.pop(future))
+
+    with ProcessPoolExecutor(
+        max_workers=workers, initializer=_init_worker, initargs=(direction, options)
+    ) as executor:
+        try:
+            for chunk in chunks:
+                try:
+                    future = executor.submit(_convert_chunk_in_worker, chunk)
+                except BrokenProcessPool as err:
+                    # A worker died: the following chunks fail, too
+                    future = Future()
+                    future.set_exception(err)
+                pending_chunks[future] = chunk
+                if ordered:
+                    pending.append(future)
+                else:
+                    pending.add(future)
+                if len(pending) >= max_pending:
+                    yield from collect()
+
+            while pending:
+                yield from collect()
+        finally:
+            # e.g.: the generator was closed before all results are consumed
+            for future in pending:
+                future.cancel()
+
+
+def convert_many(documents, direction="creole2html", workers=None, chunksize=16,
+                 ordered=True, progress=None, **options):
+    """
+    Convert all documents and returns a iterator over the BatchResult of
+    every document.
+
+    The documents are converted in a pool of worker processes, workers=None
+    uses one per CPU and workers=1 converts all documents in this process:
+
+    >>> results = convert_many(["**one**", "//two//"], workers=1)
+    >>> [result.output for result in results]
+    ['<p><strong>one</strong></p>', '<p><i>two</i></p>']
+
+    All other keyword arguments are passed to the converter, e.g.:
+
+    >>> results = convert_many(
+    ...     ["<p><i>html</i></p>"], direction="html2rest", workers=1, debug=False
+    ... )
+    >>> list(results)
+    [BatchResult(index=0, output='*html*', error=None)]
+
+    The options must be picklable, so macros must be module level functions.
+    If a chunk of documents can't be converted in a worker process, e.g.
+    the worker process died, all documents of the chunk get the error.
+
+    With ordered=False the results are yielded as soon as a chunk is ready,
+    use result.index to get the position in the documents.
+    progress(done, total) would be called for every finished document. total
+    is None if the documents have no len(), e.g. a generator.
+    """
+    if direction not in DIRECTIONS:
+        raise ValueError(f"Unknown direction {direction!r}, choose from: {', '.join(DIRECTIONS)}")
+
+    if workers is None:
+        workers = os.cpu_count() or 1
+
+    try:
+        total = len(documents)
+    except TypeError:
+        total = None
+
+    chunks = iter_chunks(enumerate(documents), chunksize)
+    if workers <= 1:
+        convert = get_converter(direction, options)
+        chunk_results = (convert_chunk(convert, chunk) for chunk in chunks)
+    else:
+        chunk_results = _iter_pool(chunks, direction, options, workers, ordered)
+
+    return _iter_results(chunk_results, progress, total)
+
+
+def _iter_results(chunk_results, progress, total):
+    done = 0
+    for results in chunk_results:
+        for result in results:
+            done += 1
+            if progress is not None:
+                progress(done, total)
+            yield result
@@ -0,0 +1,35 @@
+"""
+    python-creole benchmarks
+    ~~~~~~~~~~~~~~~~~~~~~~~~
+
+    Small performance checks, not run by the unittests. e.g.:
+
+        python -m creole.benchmarks.inline_parser
+
+    The suite over all converter directions (see: creole.benchmarks.suite):
+
+        creole-bench --help
+
+    :copyleft: 2026 by python-creole team, see AUTHORS for more details.
+    :license: GNU GPL v3 or above, see LICENSE for more details.
+"""
+
+
+import timeit
+
+
+def best_time(func, number=10, repeat=5):
+    """
+    Returns the best time in seconds for one call of func()
+
+    >>> best_time(lambda: None, number=1, repeat=1) < 1
+    True
+    """
+    return min(timeit.repeat(func, number=number, repeat=repeat)) / number
+
+
+def print_result(title, seconds, reference=None):
+    if reference is None:
+        print(f"{title:>40}: {seconds * 1000:9.3f} ms")
+    else:
+        print(f"{title:>40}: {seconds * 1000:9.3f} ms (x{reference / seconds:.1f})")
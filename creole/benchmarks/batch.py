@@ -0,0 +1,55 @@
+"""
+    Benchmark: batch conversion
+    ~~~~~~~~~~~~~~~~~~~~~~~~~~~
+
+    Convert many small documents with a creole2html() loop and with
+    creole.batch.convert_many() with a different number of workers.
+
+        python -m creole.benchmarks.batch
+
+    :copyleft: 2026 by python-creole team, see AUTHORS for more details.
+    :license: GNU GPL v3 or above, see LICENSE for more details.
+"""
+
+
+import os
+
+from creole import creole2html
+from creole.batch import convert_many
+from creole.benchmarks import best_time, print_result
+from creole.benchmarks.corpora import get_corpora
+
+
+def get_documents(count=2000, size=4 * 1024):
+    """
+    count documents, made from the creole corpora with the given size.
+
+    >>> len(get_documents(count=10, size=100))
+    10
+    """
+    corpora = [
+        corpus.get("creole") for corpus in get_corpora(size) if corpus.get("creole") is not None
+    ]
+    return [corpora[no % len(corpora)] for no in range(count)]
+
+
+def main():
+    documents = get_documents()
+    print(f"Convert {len(documents)} documents:")
+
+    reference = best_time(
+        lambda: [creole2html(document) for document in documents], number=1, repeat=3
+    )
+    print_result("creole2html() loop", reference)
+
+    workers = 1
+    while workers <= (os.cpu_count() or 1):
+        seconds = best_time(
+            lambda: list(convert_many(documents, workers=workers)), number=1, repeat=3
+        )
+        print_result(f"convert_many(workers={workers})", seconds, reference)
+        workers *= 2
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,45 @@
+"""
+    Benchmark: Creole2HtmlConverter vs. creole2html()
+    ~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~
+
+        python -m creole.benchmarks.converter
+
+    :copyleft: 2026 by python-creole team, see AUTHORS for more details.
+    :license: GNU GPL v3 or above, see LICENSE for more details.
+"""
+
+
+from creole import Creole2HtmlConverter, creole2html
+from creole.benchmarks import best_time, print_result
+from creole.shared import example_macros
+
+
+COMMENTS = [
+    "Thanks, **great** post!",
+    "I don't agree, see [[http://www.example.com|this page]].",
+    "* one\n* two\n* three",
+    "Use {{{creole2html()}}} //or// the converter object.",
+]
+
+
+def convert_comments(convert):
+    for comment in COMMENTS:
+        convert(comment)
+
+
+def main():
+    macros = {"html": example_macros.html, "pre": example_macros.pre}
+    conv = Creole2HtmlConverter(macros=macros)
+
+    print(f"Convert {len(COMMENTS)} short comments:")
+    function_time = best_time(
+        lambda: convert_comments(lambda text: creole2html(text, macros=macros)),
+        number=1000,
+    )
+    converter_time = best_time(lambda: convert_comments(conv), number=1000)
+    print_result("creole2html()", function_time)
+    print_result("Creole2HtmlConverter()", converter_time, reference=function_time)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,137 @@
+"""
+    Synthetic benchmark corpora
+    ~~~~~~~~~~~~~~~~~~~~~~~~~~~
+
+    Every corpus repeats a small creole (or html) unit until the
+    document has the requested size.
+
+    :copyleft: 2026 by python-creole team, see AUTHORS for more details.
+    :license: GNU GPL v3 or above, see LICENSE for more details.
+"""
+
+
+from creole import creole2html, html2rest
+from creole.shared import example_macros
+
+
+MACROS = {
+    "html": example_macros.html,
+    "pre": example_macros.pre,
+}
+
+PARAGRAPH = (
+    "Lorem ipsum dolor sit amet, consectetur adipisici elit, sed eiusmod"
+    " tempor incidunt ut labore et dolore magna aliqua. Ut enim ad minim"
+    " veniam, quis **nostrud** exercitation ullamco laboris nisi ut aliquid"
+    " ex ea commodi consequat. See //also// [[http://www.example.com|example]].\n"
+    "\n"
+)
+
+TABLE = (
+    "|= Name |= Value |= Comment |\n"
+    + "| **bold** | 123 | //italic// and [[/link/|a link]] |\n" * 10
+    + "\n"
+)
+
+LIST = (
+    "* first item\n"
+    "** second level with **bold** text\n"
+    "*** third level with a [[/link/|link]]\n"
+    "* another item\n"
+    "\n"
+    "# numbered item\n"
+    "## numbered //sub// item\n"
+    "\n"
+)
+
+MACRO = (
+    "Text with a inline <<pre>>pre macro<</pre>> and <<html>><b>html</b><</html>>.\n"
+    "\n"
+    "<<pre>>\n"
+    "A preformatted block\n"
+    "  with more than one line.\n"
+    "<</pre>>\n"
+    "\n"
+)
+
+NESTED_DEPTH = 50
+NESTED_HTML = (
+    "<div><span>" * NESTED_DEPTH
+    + "<p>deep <strong>nested</strong> text</p>"
+    + "</span></div>" * NESTED_DEPTH
+    + "\n"
+)
+
+
+def repeat(unit, size):
+    """
+    Repeat the unit until the text has at least size bytes.
+
+    >>> repeat("abc", size=7)
+    'abcabcabc'
+    """
+    count, rest = divmod(size, len(unit.encode("utf-8")))
+    if rest:
+        count += 1
+    return unit * max(count, 1)
+
+
+class Corpus:
+    """
+    A synthetic document in the markups that are needed for all
+    converter directions. A markup is None if the corpus doesn't
+    exist in this markup (e.g.: deep nested html has no creole source)
+
+    >>> corpus = Corpus.from_creole("paragraphs", PARAGRAPH, size=0)
+    >>> print(corpus.html)  # doctest: +ELLIPSIS
+    <p>Lorem ipsum ... <a href="http://www.example.com">example</a>.</p>
+    """
+
+    def __init__(self, name, creole=None, html=None, rest=None):
+        self.name = name
+        self.creole = creole
+        self.html = html
+        self.rest = rest
+
+    @classmethod
+    def from_creole(cls, name, unit, size):
+        creole = repeat(unit, size)
+        html = creole2html(creole, macros=MACROS)
+        return cls(name, creole=creole, html=html, rest=html2rest(html))
+
+    @classmethod
+    def from_html(cls, name, unit, size):
+        return cls(name, html=repeat(unit, size))
+
+    def get(self, markup):
+        return getattr(self, markup)
+
+
+CORPORA = {
+    "paragraphs": (Corpus.from_creole, PARAGRAPH),
+    "tables": (Corpus.from_creole, TABLE),
+    "lists": (Corpus.from_creole, LIST),
+    "macros": (Corpus.from_creole, MACRO),
+    "nested": (Corpus.from_html, NESTED_HTML),
+}
+
+
+def get_corpora(size, names=None):
+    """
+    returns the corpora with the given size in bytes.
+
+    >>> [corpus.name for corpus in get_corpora(size=1024)]
+    ['paragraphs', 'tables', 'lists', 'macros', 'nested']
+    >>> corpus = get_corpora(size=10 * 1024, names=["nested"])[0]
+    >>> corpus.html.count("<div>")
+    450
+    >>> corpus.creole is None
+    True
+    """
+    if names is None:
+        names = CORPORA.keys()
+    corpora = []
+    for name in names:
+        factory, unit = CORPORA[name]
+        corpora.append(factory(name, unit, size))
+    return corpora
@@ -0,0 +1,57 @@
+"""
+    Benchmark: replace html entities in <pre> blocks
+    ~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~
+
+    Compare Deentity.replace_all() against the old version, that looked up
+    every named entity in html.entities.name2codepoint and had no fast
+    path for texts without entities.
+
+        python -m creole.benchmarks.deentity
+
+    :copyleft: 2026 by python-creole team, see AUTHORS for more details.
+    :license: GNU GPL v3 or above, see LICENSE for more details.
+"""
+
+
+from html import entities
+
+from creole.benchmarks import best_time, print_result
+from creole.html_tools.deentity import Deentity, entities_regex
+
+
+class OldDeentity(Deentity):
+    def replace_named(self, text):
+        if text == "nbsp":
+            return " "
+        return chr(entities.name2codepoint[text])
+
+    def replace_all(self, content):
+        replace_methods = self._replace_methods
+
+        def replace_entity(match):
+            name = match.lastgroup
+            return replace_methods[name](self, match[name])
+
+        return entities_regex.sub(replace_entity, content)
+
+
+def main(blocks=2000):
+    code = "for i in range(10):\n    print(i)\n"
+    for title, contents in (
+        ("without entities", [code] * blocks),
+        ("with entities", [code.replace("(", "&#40;").replace("i)", "i&gt;&amp;&lt;)")] * blocks),
+    ):
+        print(f"Replace the entities in {blocks} <pre> blocks {title}:")
+        reference = best_time(
+            lambda: [OldDeentity().replace_all(content) for content in contents], number=3
+        )
+        print_result("old Deentity", reference)
+        deentity = Deentity()
+        seconds = best_time(
+            lambda: [deentity.replace_all(content) for content in contents], number=3
+        )
+        print_result("Deentity", seconds, reference)
+
+
+if __name__ == "__main__":
+    main()
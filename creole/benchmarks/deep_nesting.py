@@ -0,0 +1,64 @@
+"""
+    Benchmark: emit deep nested document trees
+    ~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~
+
+    The emitters don't use recursion, so the nesting depth is not limited
+    by sys.getrecursionlimit(). The time per node should stay the same for
+    a shallow and a deep tree.
+
+        python -m creole.benchmarks.deep_nesting
+
+    :copyleft: 2026 by python-creole team, see AUTHORS for more details.
+    :license: GNU GPL v3 or above, see LICENSE for more details.
+"""
+
+
+from creole import html2creole
+from creole.benchmarks import best_time
+from creole.emitter.creol2html_emitter import HtmlEmitter
+from creole.shared.document_tree import DocNode
+
+
+def nested_html(depth):
+    """
+    >>> nested_html(depth=2)
+    '<div><div>deep</div></div>'
+    """
+    return f"{'<div>' * depth}deep{'</div>' * depth}"
+
+
+def nested_typeface_tree(depth):
+    """
+    Create a creole2html document tree with nested typefaces.
+
+    >>> HtmlEmitter(nested_typeface_tree(depth=3)).emit()
+    '<p><strong><i><strong>deep</strong></i></strong></p>'
+    """
+    root = DocNode("document")
+    root.used_macros = set()
+    node = DocNode("paragraph", parent=root)
+    for level in range(depth):
+        node = DocNode(("strong", "emphasis")[level % 2], parent=node)
+    DocNode("text", parent=node, content="deep")
+    return root
+
+
+def print_level_time(title, seconds, depth):
+    print(f"{title:>20}: {seconds * 1000:9.3f} ms ({seconds / depth * 1e6:.2f} µs per level)")
+
+
+def main():
+    for depth in (100, 10000):
+        print(f"Nesting depth {depth}:")
+
+        document = nested_typeface_tree(depth)
+        seconds = best_time(lambda: HtmlEmitter(document).emit(), number=1, repeat=3)
+        print_level_time("HtmlEmitter", seconds, depth)
+
+        html = nested_html(depth)
+        seconds = best_time(lambda: html2creole(html), number=1, repeat=3)
+        print_level_time("html2creole()", seconds, depth)
+
+
+if __name__ == "__main__":
+    main()
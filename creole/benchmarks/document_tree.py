@@ -0,0 +1,64 @@
+"""
+    Benchmark: memory of the document tree
+    ~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~
+
+    Peak memory of a parsed, big html document.
+
+        python -m creole.benchmarks.document_tree
+
+    :copyleft: 2026 by python-creole team, see AUTHORS for more details.
+    :license: GNU GPL v3 or above, see LICENSE for more details.
+"""
+
+
+import time
+import tracemalloc
+
+from creole import parse_html
+
+
+def big_html_document(paragraphs=5000):
+    """
+    >>> print(big_html_document(paragraphs=1))
+    <p>Text with <strong>bold</strong>, <i>italic</i> &amp; a <a href="/link/">link</a>.<br />
+    Next line</p>
+    <BLANKLINE>
+    """
+    paragraph = (
+        '<p>Text with <strong>bold</strong>, <i>italic</i> &amp;'
+        ' a <a href="/link/">link</a>.<br />\n'
+        'Next line</p>\n'
+    )
+    return paragraph * paragraphs
+
+
+def count_nodes(node):
+    count = 0
+    stack = [node]
+    while stack:
+        node = stack.pop()
+        count += 1
+        stack.extend(node.children)
+    return count
+
+
+def main():
+    html = big_html_document()
+
+    tracemalloc.start()
+    start = time.perf_counter()
+    document = parse_html(html)
+    duration = time.perf_counter() - start
+    size = tracemalloc.get_traced_memory()[0]
+    tracemalloc.stop()
+
+    nodes = count_nodes(document)
+    print(f"Parse {len(html) / 1024:.0f} KB html into {nodes} nodes in {duration * 1000:.0f} ms")
+    print(
+        f"Memory of the document tree: {size / 1024 / 1024:.1f} MB"
+        f" ({size / nodes:.0f} bytes per node)"
+    )
+
+
+if __name__ == "__main__":
+    main()
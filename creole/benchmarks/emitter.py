@@ -0,0 +1,58 @@
+"""
+    Benchmark: html2* emitters
+    ~~~~~~~~~~~~~~~~~~~~~~~~~~
+
+    Emit a parsed html document tree and compare against the lookup of
+    the emit method via getattr() for every node.
+
+        python -m creole.benchmarks.emitter
+
+    :copyleft: 2026 by python-creole team, see AUTHORS for more details.
+    :license: GNU GPL v3 or above, see LICENSE for more details.
+"""
+
+
+from creole import creole2html
+from creole.benchmarks import best_time, print_result
+from creole.benchmarks.inline_parser import text_heavy_document
+from creole.emitter.html2creole_emitter import CreoleEmitter
+from creole.emitter.html2markdown_emitter import MarkdownEmitter
+from creole.emitter.html2rest_emitter import ReStructuredTextEmitter
+from creole.parser.html_parser import HtmlParser
+
+
+class GetattrCreoleEmitter(CreoleEmitter):
+    """
+    Reference: lookup the emit method for every node
+    """
+
+    def _emit_node(self, node):
+        self.debug_msg("emit_node", f"{node.kind}: {node.content!r}")
+        emit_method = getattr(self, f"{node.kind}_emit", None)
+        if emit_method is None:
+            content = self._unknown_emit(self, node)
+        else:
+            content = emit_method(node)
+        if not isinstance(content, str):
+            return self._emit_generator(node, emit_method, content)
+        self.last = node
+        return content
+
+
+def main():
+    html = creole2html(text_heavy_document(paragraphs=500))
+    print(f"Emit a parsed html document with {len(html) / 1024:.0f} KB:")
+
+    def emit(emitter_class):
+        document = HtmlParser().feed(html)
+        return lambda: emitter_class(document).emit()
+
+    reference = best_time(emit(GetattrCreoleEmitter), number=3)
+    print_result("getattr() per node (CreoleEmitter)", reference)
+    print_result("CreoleEmitter", best_time(emit(CreoleEmitter), number=3), reference)
+    print_result("ReStructuredTextEmitter", best_time(emit(ReStructuredTextEmitter), number=3))
+    print_result("MarkdownEmitter", best_time(emit(MarkdownEmitter), number=3))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,65 @@
+"""
+    Benchmark: html escaping in the HtmlEmitter
+    ~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~
+
+    Emit text heavy documents and compare against html.escape() for
+    every text node.
+
+        python -m creole.benchmarks.escaping
+
+    :copyleft: 2026 by python-creole team, see AUTHORS for more details.
+    :license: GNU GPL v3 or above, see LICENSE for more details.
+"""
+
+
+from html import escape
+
+from creole.benchmarks import best_time, print_result
+from creole.benchmarks.inline_parser import text_heavy_document
+from creole.emitter.creol2html_emitter import HtmlEmitter
+from creole.parser.creol2html_parser import CreoleParser
+from creole.shared.utils import html_escape
+
+
+def iter_texts(node):
+    if node.content:
+        yield node.content
+    for child in node.children:
+        yield from iter_texts(child)
+
+
+class StdlibEscapeHtmlEmitter(HtmlEmitter):
+    """
+    Reference: escape every text with html.escape()
+    """
+
+    def html_escape(self, text):
+        return escape(text, quote=False)
+
+    def attr_escape(self, text):
+        return escape(text)
+
+
+def main():
+    documents = (
+        ("plain text", text_heavy_document(paragraphs=500)),
+        ("with special characters", text_heavy_document(paragraphs=500).replace(" and ", " & ")),
+    )
+    for title, markup in documents:
+        document = CreoleParser(markup).parse()
+        print(f"Emit {len(markup) / 1024:.0f} KB creole markup, {title}:")
+
+        texts = list(iter_texts(document))
+        reference = best_time(lambda: [escape(text, quote=False) for text in texts], number=3)
+        print_result(f"html.escape() {len(texts)} texts", reference)
+        seconds = best_time(lambda: [html_escape(text) for text in texts], number=3)
+        print_result(f"html_escape() {len(texts)} texts", seconds, reference)
+
+        reference = best_time(lambda: StdlibEscapeHtmlEmitter(document).emit(), number=3)
+        print_result("html.escape()", reference)
+        seconds = best_time(lambda: HtmlEmitter(document).emit(), number=3)
+        print_result("HtmlEmitter", seconds, reference)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,41 @@
+"""
+    Benchmark: IncrementalCreole2HtmlConverter
+    ~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~
+
+    Convert a document again, after one paragraph was changed.
+
+        python -m creole.benchmarks.incremental
+
+    :copyleft: 2026 by python-creole team, see AUTHORS for more details.
+    :license: GNU GPL v3 or above, see LICENSE for more details.
+"""
+
+
+import itertools
+
+from creole.benchmarks import best_time, print_result
+from creole.benchmarks.inline_parser import text_heavy_document
+from creole.converter import Creole2HtmlConverter, IncrementalCreole2HtmlConverter
+
+
+def main():
+    paragraphs = text_heavy_document(paragraphs=200).split("\n\n")
+    counter = itertools.count()
+
+    def edited_document():
+        paragraphs[100] = f"Edit number {next(counter)}"
+        return "\n\n".join(paragraphs)
+
+    conv = Creole2HtmlConverter()
+    incremental = IncrementalCreole2HtmlConverter()
+    incremental(edited_document())  # fill the cache
+
+    print(f"Convert a document with {len(paragraphs)} paragraphs, after one was changed:")
+    full = best_time(lambda: conv(edited_document()))
+    changed = best_time(lambda: incremental(edited_document()))
+    print_result("Creole2HtmlConverter", full)
+    print_result("IncrementalCreole2HtmlConverter", changed, reference=full)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,65 @@
+"""
+    Benchmark: inline parsing of text heavy documents
+    ~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~
+
+    Compare the CreoleParser against the old inline rules,
+    that matched plain text one character at a time.
+
+        python -m creole.benchmarks.inline_parser
+
+    :copyleft: 2026 by python-creole team, see AUTHORS for more details.
+    :license: GNU GPL v3 or above, see LICENSE for more details.
+"""
+
+
+import re
+
+from creole.benchmarks import best_time, print_result
+from creole.parser.creol2html_parser import CreoleParser
+from creole.parser.creol2html_rules import INLINE_FLAGS, INLINE_RULES, InlineRules
+
+
+PER_CHAR_RULE = r'(?P<char> . )'
+
+
+class PerCharCreoleParser(CreoleParser):
+    """
+    CreoleParser with the old "one match per character" plain text rule.
+    """
+    link_re = re.compile(
+        '|'.join([InlineRules.image, InlineRules.linebreak, PER_CHAR_RULE]),
+        re.VERBOSE | re.UNICODE
+    )
+    inline_re = re.compile(
+        '|'.join(INLINE_RULES[:-1] + (PER_CHAR_RULE,)), INLINE_FLAGS
+    )
+
+
+def text_heavy_document(paragraphs=200):
+    """
+    >>> print(text_heavy_document(paragraphs=1)[:54])
+    Lorem ipsum dolor sit amet, consectetur adipisici elit
+    """
+    paragraph = (
+        "Lorem ipsum dolor sit amet, consectetur adipisici elit, sed eiusmod"
+        " tempor incidunt ut labore et dolore magna aliqua. Ut enim ad minim"
+        " veniam, quis **nostrud** exercitation ullamco laboris nisi ut aliquid"
+        " ex ea commodi consequat. Quis aute iure reprehenderit in voluptate"
+        " velit esse cillum dolore eu fugiat nulla pariatur. See //also//"
+        " [[http://www.example.com|example]] and http://www.example.org\n"
+    )
+    return "\n".join(paragraph for _ in range(paragraphs))
+
+
+def main():
+    document = text_heavy_document()
+    print(f"Parse a text heavy document with {len(document)} characters:")
+
+    old = best_time(lambda: PerCharCreoleParser(document).parse())
+    new = best_time(lambda: CreoleParser(document).parse())
+    print_result("per character inline rule", old)
+    print_result("plain text runs", new, reference=old)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,50 @@
+"""
+    Benchmark: parse a long paragraph
+    ~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~
+
+    The parse time of a single paragraph must grow linear with its size.
+    (The text nodes are built from collected parts, see:
+    CreoleParser._add_text())
+
+        python -m creole.benchmarks.long_paragraph
+
+    :copyleft: 2026 by python-creole team, see AUTHORS for more details.
+    :license: GNU GPL v3 or above, see LICENSE for more details.
+"""
+
+
+from creole.benchmarks import best_time
+from creole.parser.creol2html_parser import CreoleParser
+
+
+def long_paragraph(size):
+    """
+    A paragraph in one line with size bytes of unformatted text.
+
+    >>> long_paragraph(size=12)
+    'word word wo'
+    """
+    text = "word " * (size // 5 + 1)
+    return text[:size]
+
+
+def parse_time(size, number=1, repeat=3):
+    """ returns the parse time in seconds of a long paragraph with the given size """
+    paragraph = long_paragraph(size)
+    return best_time(lambda: CreoleParser(paragraph).parse(), number=number, repeat=repeat)
+
+
+def main():
+    reference = None
+    for size_kb in (64, 128, 256, 512, 1024):
+        seconds = parse_time(size_kb * 1024)
+        if reference is None:
+            reference = seconds / size_kb
+        print(
+            f"{size_kb:>5} KB paragraph: {seconds * 1000:9.3f} ms"
+            f" (x{seconds / size_kb / reference:.2f} time per KB)"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,86 @@
+"""
+    Benchmark: cut out the <pre> areas in the HtmlParser
+    ~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~
+
+    Compare cut_pre_areas() against the old two re.sub() passes with the
+    "(\\n|.)*?" patterns, on documents with many code blocks.
+    cut_pre_areas() finds all areas in one scan over the "<pre>" tags.
+
+        python -m creole.benchmarks.pre_areas
+
+    :copyleft: 2026 by python-creole team, see AUTHORS for more details.
+    :license: GNU GPL v3 or above, see LICENSE for more details.
+"""
+
+
+import re
+
+from creole.benchmarks import best_time, print_result
+from creole.parser.html_parser import cut_pre_areas
+
+
+old_block_re = re.compile(r'''
+    ^<pre> \s* $
+    (?P<pre_block>
+        (\n|.)*?
+    )
+    ^</pre> \s* $
+    [\s\n]*
+''', re.VERBOSE | re.UNICODE | re.MULTILINE)
+
+old_inline_re = re.compile(r'''
+    <pre>
+    (?P<pre_inline>
+        (\n|.)*?
+    )
+    </pre>
+''', re.VERBOSE | re.UNICODE)
+
+
+def old_cut_pre_areas(data, cut_block, cut_inline):
+    """
+    >>> data = code_blocks_document(1)
+    >>> def cut(start, end):
+    ...     return data[start:end].upper()
+    >>> old_cut_pre_areas(data, str.upper, str.upper) == cut_pre_areas(data, cut, cut)
+    True
+    """
+    data = old_block_re.sub(lambda match: cut_block(match["pre_block"]), data)
+    return old_inline_re.sub(lambda match: cut_inline(match["pre_inline"]), data)
+
+
+def code_blocks_document(blocks):
+    """
+    html code with the given number of <pre> blocks and inline <pre> areas
+    """
+    code = "\n".join(f"for i in range({no}):\n    print('<b>&amp;</b>', i)" for no in range(20))
+    part = (
+        "<h2>Example</h2>\n"
+        "<p>Use <pre>creole2html()</pre> like this:</p>\n"
+        f"<pre>\n{code}\n</pre>\n"
+        "<p>and see the result.</p>\n"
+    )
+    return part * blocks
+
+
+def main(blocks=500):
+    def old_cut(content):
+        return "<blockdata />"
+
+    def cut(start, end):
+        return "<blockdata />"
+
+    for title, html in (
+        (f"{blocks} code blocks", code_blocks_document(blocks)),
+        (f"{blocks} unclosed <pre>", "<pre>\ntext\n" * blocks),
+    ):
+        assert cut_pre_areas(html, cut, cut) == old_cut_pre_areas(html, old_cut, old_cut)
+        print(f"Cut out the <pre> areas of {len(html) / 1024:.0f} KB html code, {title}:")
+        reference = best_time(lambda: old_cut_pre_areas(html, old_cut, old_cut), number=1, repeat=3)
+        print_result("two re.sub() passes", reference)
+        seconds = best_time(lambda: cut_pre_areas(html, cut, cut), number=1, repeat=3)
+        print_result("cut_pre_areas()", seconds, reference)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,48 @@
+"""
+    Benchmark: parse with source span tracking
+    ~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~
+
+    Compare the parse time and the memory of the document tree with and
+    without CreoleParser(track_spans=True)
+
+        python -m creole.benchmarks.source_spans
+
+    :copyleft: 2026 by python-creole team, see AUTHORS for more details.
+    :license: GNU GPL v3 or above, see LICENSE for more details.
+"""
+
+
+from creole.benchmarks import best_time, print_result
+from creole.benchmarks.corpora import get_corpora
+from creole.benchmarks.suite import peak_memory
+from creole.parser.creol2html_parser import CreoleParser
+
+
+def creole_corpus(size):
+    """
+    All creole corpora with the given size in bytes joined together.
+
+    >>> len(creole_corpus(1024)) > 1024
+    True
+    """
+    return "\n\n".join(
+        corpus.get("creole") for corpus in get_corpora(size) if corpus.get("creole") is not None
+    )
+
+
+def main(size=64 * 1024):
+    text = creole_corpus(size)
+    print(f"Parse {len(text) / 1024:.0f} KB creole markup:")
+
+    reference = best_time(lambda: CreoleParser(text).parse(), number=3)
+    print_result("without spans", reference)
+    seconds = best_time(lambda: CreoleParser(text, track_spans=True).parse(), number=3)
+    print_result("track_spans=True", seconds, reference)
+
+    for track_spans in (False, True):
+        memory = peak_memory(lambda: CreoleParser(text, track_spans=track_spans).parse())
+        print(f"track_spans={track_spans}: {memory / 1024 / 1024:.1f} MB peak memory")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,73 @@
+"""
+    Benchmark: startup time
+    ~~~~~~~~~~~~~~~~~~~~~~~
+
+    Measure the import time with "python -X importtime" in a new
+    interpreter. "import creole" should not import the parsers and
+    emitters, they are imported on first use (see: creole.__getattr__)
+
+        python -m creole.benchmarks.startup
+
+    :copyleft: 2026 by python-creole team, see AUTHORS for more details.
+    :license: GNU GPL v3 or above, see LICENSE for more details.
+"""
+
+
+import subprocess
+import sys
+
+
+STATEMENTS = (
+    "import creole",
+    "from creole import creole2html; creole2html('x')",
+    "from creole import html2creole; html2creole('x')",
+)
+
+
+def import_times(statement):
+    """
+    Run the statement in a new interpreter and returns a list of
+    (module name, cumulative import time in microseconds, nesting level)
+    of every imported module.
+
+    >>> modules = [module_name for module_name, cumulative, level in import_times("import creole")]
+    >>> "creole" in modules and "creole.parser.html_parser" not in modules
+    True
+    """
+    process = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", statement],
+        stdout=subprocess.PIPE,
+        stderr=subprocess.PIPE,
+        universal_newlines=True,
+        check=True,
+    )
+    times = []
+    for line in process.stderr.splitlines():
+        if not line.startswith("import time:"):
+            continue
+        self_time, cumulative, module_name = line[len("import time:"):].split("|")
+        try:
+            cumulative = int(cumulative)
+        except ValueError:
+            continue  # the header line
+        level = (len(module_name) - len(module_name.lstrip()) - 1) // 2
+        times.append((module_name.strip(), cumulative, level))
+    return times
+
+
+def creole_import_time(statement):
+    """ returns the import time of all top-level imported creole modules in microseconds """
+    return sum(
+        cumulative for module_name, cumulative, level in import_times(statement)
+        if level == 0 and module_name.split(".")[0] == "creole"
+    )
+
+
+def main(repeat=5):
+    for statement in STATEMENTS:
+        microseconds = min(creole_import_time(statement) for _ in range(repeat))
+        print(f"{statement:>50}: {microseconds / 1000:6.1f} ms import time")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,51 @@
+"""
+    Benchmark: iter_creole2html() vs. creole2html()
+    ~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~
+
+    Time to the first html chunk and peak memory for a big document.
+
+        python -m creole.benchmarks.streaming
+
+    :copyleft: 2026 by python-creole team, see AUTHORS for more details.
+    :license: GNU GPL v3 or above, see LICENSE for more details.
+"""
+
+
+import time
+import tracemalloc
+
+from creole import creole2html, iter_creole2html
+from creole.benchmarks.inline_parser import text_heavy_document
+
+
+def measure(func):
+    """ returns: time to first result, total time, peak memory in bytes """
+    tracemalloc.start()
+    start = time.perf_counter()
+    first = None
+    for _ in func():
+        if first is None:
+            first = time.perf_counter() - start
+    total = time.perf_counter() - start
+    peak = tracemalloc.get_traced_memory()[1]
+    tracemalloc.stop()
+    return first, total, peak
+
+
+def main():
+    document = text_heavy_document(paragraphs=2000)
+    print(f"Convert a document with {len(document) / 1024 / 1024:.1f} MB:")
+
+    for title, func in (
+        ("creole2html()", lambda: [creole2html(document)]),
+        ("iter_creole2html()", lambda: iter_creole2html(document)),
+    ):
+        first, total, peak = measure(func)
+        print(
+            f"{title:>20}: first chunk after {first * 1000:8.1f} ms"
+            f" - total {total * 1000:8.1f} ms - peak memory {peak / 1024 / 1024:6.1f} MB"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,94 @@
+"""
+    Benchmark: strip_html()
+    ~~~~~~~~~~~~~~~~~~~~~~~
+
+    Compare strip_html() against the old implementation, that matched
+    the tags with ".*?" and checked the whitespace with str methods.
+
+        python -m creole.benchmarks.strip_html
+
+    :copyleft: 2026 by python-creole team, see AUTHORS for more details.
+    :license: GNU GPL v3 or above, see LICENSE for more details.
+"""
+
+
+import re
+
+from creole.benchmarks import best_time, print_result
+from creole.benchmarks.corpora import get_corpora
+from creole.html_tools.strip_html import strip_html
+from creole.parser.html_parser import HtmlParser
+from creole.parser.html_parser_config import BLOCK_TAGS
+
+
+old_strip_html_regex = re.compile(
+    r"""
+        \s*
+        <
+            (?P<end>/{0,1})       # end tag e.g.: </end>
+            (?P<tag>[^ >]+)       # tag name
+            .*?
+            (?P<startend>/{0,1})  # closed tag e.g.: <closed />
+        >
+        \s*
+    """,
+    re.VERBOSE | re.MULTILINE | re.UNICODE
+)
+
+
+def old_strip_tag(match):
+    block = match.group(0)
+    end_tag = match.group("end") in ("/", "/")
+    startend_tag = match.group("startend") in ("/", "/")
+    tag = match.group("tag")
+
+    if tag in BLOCK_TAGS:
+        return block.strip()
+
+    space_start = block.startswith(" ")
+    space_end = block.endswith(" ")
+
+    result = block.strip()
+
+    if end_tag:
+        if space_start or space_end:
+            result += " "
+    elif startend_tag:
+        if space_start:
+            result = " " + result
+        if space_end:
+            result += " "
+    else:
+        if space_start or space_end:
+            result = " " + result
+
+    return result
+
+
+def old_strip_html(html_code):
+    """
+    >>> old_strip_html(' <p>  one  \\n two  </p>') == strip_html(' <p>  one  \\n two  </p>')
+    True
+    """
+    data = html_code.strip()
+    clean_data = " ".join(line.strip() for line in data.split("\n"))
+    return old_strip_html_regex.sub(old_strip_tag, clean_data)
+
+
+def main(size=256 * 1024):
+    html = "\n".join(
+        corpus.get("html") for corpus in get_corpora(size) if corpus.get("html") is not None
+    )
+    assert strip_html(html) == old_strip_html(html)
+    print(f"Strip {len(html) / 1024:.0f} KB html code:")
+
+    reference = best_time(lambda: old_strip_html(html), number=1)
+    print_result("old strip_html()", reference)
+    print_result("strip_html()", best_time(lambda: strip_html(html), number=1), reference)
+    print_result(
+        "HtmlParser.feed() (for comparison)", best_time(lambda: HtmlParser().feed(html), number=1)
+    )
+
+
+if __name__ == "__main__":
+    main()
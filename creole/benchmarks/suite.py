@@ -0,0 +1,200 @@
+"""
+    python-creole benchmark suite
+    ~~~~~~~~~~~~~~~~~~~~~~~~~~~~~
+
+    Time every converter direction with the synthetic corpora and
+    report the throughput and the peak memory as JSON, e.g.:
+
+        creole-bench --size 256 --output 1.5.0.json
+        creole-bench --size 256 --compare 1.5.0.json
+
+    :copyleft: 2026 by python-creole team, see AUTHORS for more details.
+    :license: GNU GPL v3 or above, see LICENSE for more details.
+"""
+
+
+import argparse
+import json
+import platform
+import sys
+import tracemalloc
+
+from creole import VERSION_STRING, creole2html, html2creole, html2markdown, html2rest, html2textile
+from creole.benchmarks import best_time
+from creole.benchmarks.corpora import CORPORA, MACROS, get_corpora
+from creole.rest_tools.clean_writer import rest2html
+
+
+# direction name -> (source markup, convert function)
+DIRECTIONS = {
+    "creole2html": ("creole", lambda text: creole2html(text, macros=MACROS)),
+    "html2creole": ("html", html2creole),
+    "html2rest": ("html", html2rest),
+    "html2textile": ("html", html2textile),
+    "html2markdown": ("html", html2markdown),
+    "rest2html": ("rest", rest2html),
+}
+
+
+def peak_memory(func):
+    """
+    returns the peak of the memory allocated while func() runs in bytes
+
+    >>> peak_memory(lambda: "x" * 1024 * 1024) >= 1024 * 1024
+    True
+    """
+    tracemalloc.start()
+    try:
+        func()
+        return tracemalloc.get_traced_memory()[1]
+    finally:
+        tracemalloc.stop()
+
+
+def bench(direction, corpus, number=3, repeat=3):
+    """
+    returns the result dict for one direction and corpus or None if the
+    corpus doesn't exist in the source markup of the direction.
+    """
+    markup, convert = DIRECTIONS[direction]
+    source = corpus.get(markup)
+    if source is None:
+        return None
+
+    size = len(source.encode("utf-8"))
+    seconds = best_time(lambda: convert(source), number=number, repeat=repeat)
+    return {
+        "direction": direction,
+        "corpus": corpus.name,
+        "bytes": size,
+        "seconds": seconds,
+        "mb_per_second": size / 1024 / 1024 / seconds,
+        "docs_per_second": 1 / seconds,
+        "peak_memory": peak_memory(lambda: convert(source)),
+    }
+
+
+def run_suite(size=64, directions=None, corpora=None, number=3, repeat=3):
+    """
+    Run the benchmarks and returns the report as JSON serializable dict.
+    size is the size of every corpus in KB.
+
+    >>> report = run_suite(
+    ...     size=1, directions=["creole2html"], corpora=["lists", "nested"], number=1, repeat=1
+    ... )
+    >>> [(result["direction"], result["corpus"]) for result in report["results"]]
+    [('creole2html', 'lists')]
+    >>> sorted(report["results"][0])
+    ['bytes', 'corpus', 'direction', 'docs_per_second', 'mb_per_second', 'peak_memory', 'seconds']
+    """
+    if directions is None:
+        directions = list(DIRECTIONS)
+
+    results = []
+    for corpus in get_corpora(size * 1024, names=corpora):
+        for direction in directions:
+            result = bench(direction, corpus, number=number, repeat=repeat)
+            if result is not None:
+                results.append(result)
+
+    return {
+        "python_creole": VERSION_STRING,
+        "python": f"{platform.python_implementation()} {platform.python_version()}",
+        "platform": platform.platform(),
+        "size_kb": size,
+        "number": number,
+        "repeat": repeat,
+        "results": results,
+    }
+
+
+def print_report(report, reference=None, file=None):
+    """
+    Print the results as table. With a reference report (e.g.: from a
+    older release) the speedup will be added.
+    """
+    if file is None:
+        file = sys.stdout
+
+    reference_results = {}
+    if reference is not None:
+        print(
+            f"Compare python-creole v{report['python_creole']}"
+            f" with v{reference['python_creole']}",
+            file=file,
+        )
+        for result in reference["results"]:
+            reference_results[(result["direction"], result["corpus"])] = result
+
+    for result in report["results"]:
+        line = (
+            f"{result['direction']:>14} {result['corpus']:<11}"
+            f" {result['mb_per_second']:8.2f} MB/s"
+            f" {result['docs_per_second']:9.1f} docs/s"
+            f" {result['peak_memory'] / 1024 / 1024:8.1f} MB peak"
+        )
+        old = reference_results.get((result["direction"], result["corpus"]))
+        if old is not None:
+            line += f" (x{old['seconds'] / result['seconds']:.2f})"
+        print(line, file=file)
+
+
+def cli_bench(argv=None):
+    parser = argparse.ArgumentParser(
+        description="Benchmark all python-creole converter directions."
+    )
+    parser.add_argument(
+        "--size", type=int, default=64,
+        help="Size of every corpus in KB (default: 64)"
+    )
+    parser.add_argument(
+        "--direction", action="append", choices=list(DIRECTIONS), dest="directions",
+        help="Converter direction to benchmark, can be given more than once (default: all)"
+    )
+    parser.add_argument(
+        "--corpus", action="append", choices=list(CORPORA), dest="corpora",
+        help="Corpus to use, can be given more than once (default: all)"
+    )
+    parser.add_argument(
+        "--number", type=int, default=3,
+        help="Number of conversions per timing (default: 3)"
+    )
+    parser.add_argument(
+        "--repeat", type=int, default=3,
+        help="Number of timings, the best one is used (default: 3)"
+    )
+    parser.add_argument(
+        "--output",
+        help="Write the JSON report into this file (default: print it)"
+    )
+    parser.add_argument(
+        "--compare",
+        help="JSON report (e.g. of a older release) to compare with"
+    )
+    args = parser.parse_args(argv)
+
+    report = run_suite(
+        size=args.size,
+        directions=args.directions,
+        corpora=args.corpora,
+        number=args.number,
+        repeat=args.repeat,
+    )
+
+    reference = None
+    if args.compare:
+        with open(args.compare, encoding="utf-8") as f:
+            reference = json.load(f)
+
+    if args.output:
+        with open(args.output, "w", encoding="utf-8") as f:
+            json.dump(report, f, indent=4)
+        print_report(report, reference)
+    elif reference is not None:
+        print_report(report, reference)
+    else:
+        print(json.dumps(report, indent=4))
+
+
+if __name__ == "__main__":
+    cli_bench()
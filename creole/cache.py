@@ -0,0 +1,438 @@
+"""
+    python-creole render cache
+    ~~~~~~~~~~~~~~~~~~~~~~~~~~
+
+    Cache the results of creole2html() and the html2*() functions:
+
+        from creole.cache import RenderCache, SqliteBackend
+
+        cache = RenderCache(max_bytes=16 * 1024 * 1024, ttl=3600)
+        html = cache.creole2html(markup, macros=macros)
+
+        # persistent:
+        cache = RenderCache(backend=SqliteBackend("render_cache.sqlite"))
+
+    The cache key is a hash of the source and of the options (callables,
+    e.g. the macros, are identified by their module and name, instances
+    by their attributes). Conversions with options that have no stable
+    fingerprint (e.g. lambdas and closures) are not cached.
+
+    A macro that returns a different result for the same input (e.g. the
+    current time) must be marked with @uncacheable: Pages that use it are
+    never stored in the cache.
+
+    :copyleft: 2026 by python-creole team, see AUTHORS for more details.
+    :license: GNU GPL v3 or above, see LICENSE for more details.
+"""
+
+
+import functools
+import hashlib
+import shelve
+import sqlite3
+import threading
+import time
+import types
+from collections import OrderedDict
+
+import creole
+from creole.converter import Creole2HtmlConverter
+
+
+def uncacheable(macro):
+    """
+    Decorator for macros, whose result can't be cached:
+
+    >>> @uncacheable
+    ... def now(text):
+    ...     return time.ctime()
+    >>> is_cacheable(now)
+    False
+    """
+    macro.cacheable = False
+    return macro
+
+
+def is_cacheable(macro):
+    return getattr(macro, "cacheable", True)
+
+
+def get_macro(macros, name):
+    """ The macro lookup of the HtmlEmitter: macros is a dict or e.g. a module """
+    if isinstance(macros, dict):
+        return macros.get(name)
+    return getattr(macros, name, None)
+
+
+class UnstableFingerprint(TypeError):
+    """ The options contain a value, that can't be identified by a fingerprint """
+
+
+def fingerprint(value):
+    """
+    A stable string for the conversion options, also in other processes.
+
+    >>> fingerprint({"b": [1, True], "a": None})
+    "{'a':None,'b':[1,True]}"
+    >>> fingerprint({"macro": is_cacheable})
+    "{'macro':creole.cache.is_cacheable}"
+    >>> fingerprint(creole)
+    'creole'
+
+    Partials, bound methods and instances are identified by their state:
+
+    >>> fingerprint(functools.partial(get_macro, name="foo"))
+    "functools.partial(creole.cache.get_macro,[],{'name':'foo'})"
+    >>> fingerprint(MemoryBackend().clear)
+    "creole.cache.MemoryBackend({'entries':{},'size':0}).clear"
+
+    Functions that can't be imported by their name, e.g. lambdas, and
+    closures have no stable fingerprint: The result may depend on values,
+    that are not part of the name.
+
+    >>> fingerprint(lambda: None)
+    Traceback (most recent call last):
+        ...
+    creole.cache.UnstableFingerprint: No fingerprint for the local function or closure <lambda>
+    """
+    return _fingerprint(value, frozenset())
+
+
+def _fingerprint(value, parents):
+    if isinstance(value, dict):
+        items = ",".join(
+            f"{key!r}:{_fingerprint(value[key], parents)}" for key in sorted(value, key=repr)
+        )
+        return f"{{{items}}}"
+    elif isinstance(value, (list, tuple)):
+        return f"[{','.join(_fingerprint(item, parents) for item in value)}]"
+    elif isinstance(value, (set, frozenset)):
+        return f"{{{','.join(sorted(_fingerprint(item, parents) for item in value))}}}"
+    elif isinstance(value, (str, bytes, int, float, bool, type(None))):
+        return repr(value)
+    elif isinstance(value, types.ModuleType):
+        return value.__name__
+
+    if id(value) in parents:
+        raise UnstableFingerprint(f"Recursive reference to {value!r}")
+    parents |= {id(value)}
+
+    if isinstance(value, functools.partial):
+        func = _fingerprint(value.func, parents)
+        args = _fingerprint(value.args, parents)
+        keywords = _fingerprint(value.keywords, parents)
+        return f"functools.partial({func},{args},{keywords})"
+
+    owner = getattr(value, "__self__", None)
+    if owner is not None and not isinstance(owner, types.ModuleType):
+        # A bound method, e.g.: instance.method or "abc".upper
+        return f"{_fingerprint(owner, parents)}.{value.__name__}"
+
+    name = getattr(value, "__qualname__", None) or getattr(value, "__name__", None)
+    if name is None:
+        # A instance: the result may depend on all attributes
+        try:
+            state = vars(value)
+        except TypeError:
+            raise UnstableFingerprint(f"No fingerprint for the state of {value!r}")
+        cls = type(value)
+        if "<" in cls.__qualname__:
+            raise UnstableFingerprint(f"No fingerprint for the local class {cls.__qualname__}")
+        return f"{cls.__module__}.{cls.__qualname__}({_fingerprint(state, parents)})"
+
+    if "<" in name or getattr(value, "__closure__", None):
+        # e.g.: "<lambda>", "function.<locals>.macro" or a decorated function
+        raise UnstableFingerprint(f"No fingerprint for the local function or closure {name}")
+
+    module = getattr(value, "__module__", None) or type(value).__module__
+    return f"{module}.{name}"
+
+
+class MemoryBackend:
+    """
+    Stores the entries in a dict, in LRU order.
+    An entry is a (value, expires, size) tuple.
+    """
+
+    def __init__(self):
+        self.entries = OrderedDict()
+        self.size = 0  # of all values in bytes
+
+    def __len__(self):
+        return len(self.entries)
+
+    def get(self, key):
+        entry = self.entries.get(key)
+        if entry is not None:
+            self.entries.move_to_end(key)
+        return entry
+
+    def set(self, key, entry):
+        self.delete(key)
+        self.entries[key] = entry
+        self.size += entry[2]
+
+    def delete(self, key):
+        entry = self.entries.pop(key, None)
+        if entry is not None:
+            self.size -= entry[2]
+
+    def pop_oldest(self):
+        """ Remove the least recently used entry """
+        key, entry = self.entries.popitem(last=False)
+        self.size -= entry[2]
+
+    def clear(self):
+        self.entries.clear()
+        self.size = 0
+
+    def close(self):
+        pass
+
+
+class ShelveBackend:
+    """
+    Stores the entries in a shelve file. The LRU order is stored by the
+    last access time in every entry, so pop_oldest() must read all entries.
+    """
+
+    def __init__(self, filename):
+        self.shelf = shelve.open(filename)
+        self.size = sum(entry[2] for entry in self.shelf.values())
+
+    def __len__(self):
+        return len(self.shelf)
+
+    def get(self, key):
+        entry = self.shelf.get(key)
+        if entry is None:
+            return None
+        self.shelf[key] = entry[:3] + (time.time(),)
+        return entry[:3]
+
+    def set(self, key, entry):
+        self.delete(key)
+        self.shelf[key] = tuple(entry) + (time.time(),)
+        self.size += entry[2]
+
+    def delete(self, key):
+        entry = self.shelf.pop(key, None)
+        if entry is not None:
+            self.size -= entry[2]
+
+    def pop_oldest(self):
+        key = min(self.shelf, key=lambda key: self.shelf[key][3])
+        self.delete(key)
+
+    def clear(self):
+        self.shelf.clear()
+        self.size = 0
+
+    def close(self):
+        self.shelf.close()
+
+
+class SqliteBackend:
+    """
+    Stores the entries in a SQLite database.
+    """
+
+    def __init__(self, filename):
+        self.connection = sqlite3.connect(filename, check_same_thread=False, isolation_level=None)
+        self.connection.execute(
+            "CREATE TABLE IF NOT EXISTS render_cache ("
+            " key TEXT PRIMARY KEY, value TEXT, expires REAL, size INTEGER, accessed REAL"
+            ")"
+        )
+        self.connection.execute(
+            "CREATE INDEX IF NOT EXISTS render_cache_accessed ON render_cache (accessed)"
+        )
+        # Running total, so that the eviction loop doesn't need a SUM() per pass:
+        self.size = self.connection.execute(
+            "SELECT COALESCE(SUM(size), 0) FROM render_cache"
+        ).fetchone()[0]
+
+    def __len__(self):
+        return self.connection.execute("SELECT COUNT(*) FROM render_cache").fetchone()[0]
+
+    def _get_size(self, key):
+        entry = self.connection.execute(
+            "SELECT size FROM render_cache WHERE key = ?", (key,)
+        ).fetchone()
+        return 0 if entry is None else entry[0]
+
+    def get(self, key):
+        entry = self.connection.execute(
+            "SELECT value, expires, size FROM render_cache WHERE key = ?", (key,)
+        ).fetchone()
+        if entry is not None:
+            self.connection.execute(
+                "UPDATE render_cache SET accessed = ? WHERE key = ?", (time.time(), key)
+            )
+        return entry
+
+    def set(self, key, entry):
+        value, expires, size = entry
+        self.size -= self._get_size(key)
+        self.connection.execute(
+            "INSERT OR REPLACE INTO render_cache VALUES (?, ?, ?, ?, ?)",
+            (key, value, expires, size, time.time())
+        )
+        self.size += size
+
+    def delete(self, key):
+        self.size -= self._get_size(key)
+        self.connection.execute("DELETE FROM render_cache WHERE key = ?", (key,))
+
+    def pop_oldest(self):
+        oldest = self.connection.execute(
+            "SELECT key, size FROM render_cache ORDER BY accessed LIMIT 1"
+        ).fetchone()
+        if oldest is not None:
+            key, size = oldest
+            self.connection.execute("DELETE FROM render_cache WHERE key = ?", (key,))
+            self.size -= size
+
+    def clear(self):
+        self.connection.execute("DELETE FROM render_cache")
+        self.size = 0
+
+    def close(self):
+        self.connection.close()
+
+
+class RenderCache:
+    """
+    Cache the converted documents in the backend (default: MemoryBackend).
+    If there are more than max_entries entries or the values are bigger
+    than max_bytes, the least recently used entries would be removed.
+    Entries are expired after ttl seconds (None: never).
+
+    >>> cache = RenderCache()
+    >>> cache.creole2html("**bold**")
+    '<p><strong>bold</strong></p>'
+    >>> cache.creole2html("**bold**")
+    '<p><strong>bold</strong></p>'
+    >>> cache.hits, cache.misses
+    (1, 1)
+    """
+
+    def __init__(self, backend=None, max_entries=None, max_bytes=64 * 1024 * 1024, ttl=None):
+        if backend is None:
+            backend = MemoryBackend()
+        self.backend = backend
+        self.max_entries = max_entries
+        self.max_bytes = max_bytes
+        self.ttl = ttl
+
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self.uncacheable = 0  # conversions with uncacheable macros or options
+
+    def get_key(self, direction, source, options):
+        source_hash = hashlib.sha1(source.encode("utf-8")).hexdigest()
+        options_hash = hashlib.sha1(fingerprint(options).encode("utf-8")).hexdigest()
+        return f"{direction}:{source_hash}:{options_hash}"
+
+    def get(self, key):
+        """ Returns the cached value or None """
+        with self._lock:
+            entry = self.backend.get(key)
+            if entry is not None:
+                value, expires, size = entry
+                if expires is None or expires > time.time():
+                    self.hits += 1
+                    return value
+                self.backend.delete(key)
+            self.misses += 1
+            return None
+
+    def set(self, key, value):
+        size = len(value.encode("utf-8"))
+        if self.max_bytes is not None and size > self.max_bytes:
+            return
+        expires = None if self.ttl is None else time.time() + self.ttl
+        with self._lock:
+            self.backend.set(key, (value, expires, size))
+            while (
+                (self.max_entries is not None and len(self.backend) > self.max_entries)
+                or (self.max_bytes is not None and self.backend.size > self.max_bytes)
+            ):
+                self.backend.pop_oldest()
+                self.evictions += 1
+
+    def creole2html(self, markup_string, **kwargs):
+        """ cached creole2html(), the keyword arguments are the same """
+        assert isinstance(markup_string, str), "given markup_string must be unicode!"
+        key = self._get_key("creole2html", markup_string, kwargs)
+        if key is not None:
+            html = self.get(key)
+            if html is not None:
+                return html
+
+        converter = Creole2HtmlConverter(**kwargs)
+        document = converter.parse(markup_string)
+        html = converter.get_emitter(document).emit()
+
+        if key is None:
+            return html
+
+        macros = converter.macros
+        if all(is_cacheable(get_macro(macros, name)) for name in document.used_macros):
+            self.set(key, html)
+        else:
+            with self._lock:
+                self.uncacheable += 1
+        return html
+
+    def _get_key(self, direction, source, options):
+        """ get_key() or None, if the options have no stable fingerprint """
+        try:
+            return self.get_key(direction, source, options)
+        except UnstableFingerprint:
+            with self._lock:
+                self.uncacheable += 1
+            return None
+
+    def _convert_html(self, direction, html_string, kwargs):
+        key = self._get_key(direction, html_string, kwargs)
+        if key is None:
+            return getattr(creole, direction)(html_string, **kwargs)
+        markup = self.get(key)
+        if markup is None:
+            markup = getattr(creole, direction)(html_string, **kwargs)
+            self.set(key, markup)
+        return markup
+
+    def html2creole(self, html_string, **kwargs):
+        return self._convert_html("html2creole", html_string, kwargs)
+
+    def html2markdown(self, html_string, **kwargs):
+        return self._convert_html("html2markdown", html_string, kwargs)
+
+    def html2rest(self, html_string, **kwargs):
+        return self._convert_html("html2rest", html_string, kwargs)
+
+    def html2textile(self, html_string, **kwargs):
+        return self._convert_html("html2textile", html_string, kwargs)
+
+    def stats(self):
+        with self._lock:
+            return {
+                "hits": self.hits,
+                "misses": self.misses,
+                "evictions": self.evictions,
+                "uncacheable": self.uncacheable,
+                "entries": len(self.backend),
+                "bytes": self.backend.size,
+            }
+
+    def clear(self):
+        with self._lock:
+            self.backend.clear()
+
+    def close(self):
+        with self._lock:
+            self.backend.close()
@@ -9,10 +9,231 @@
 
 import argparse
 import codecs
+import glob
+import hashlib
+import json
+import os
+import sys
+import tempfile
+import time
 
 from creole import VERSION_STRING, creole2html, html2creole, html2rest, html2textile
 
 
+# Default glob pattern for the source files in a directory
+# and the file extension for the output files:
+BULK_DEFAULTS = {
+    "creole2html": ("*.creole", ".html"),
+    "html2creole": ("*.html", ".creole"),
+    "html2rest": ("*.html", ".rst"),
+    "html2textile": ("*.html", ".textile"),
+}
+
+
+# --separator choices for multi document streams:
+SEPARATORS = {
+    "nul": "\0",
+    "formfeed": "\f",
+}
+
+
+def iter_stream_documents(stream, separator, encoding="utf-8", chunk_size=64 * 1024):
+    """
+    Read the binary stream and yield the separated documents as soon as
+    they are complete. (Read only the available bytes, if possible, so
+    a document can be converted before the stream is closed)
+
+    >>> import io
+    >>> list(iter_stream_documents(io.BytesIO(b"one\\0two\\0\\0three"), "\\0", chunk_size=2))
+    ['one', 'two', '', 'three']
+    """
+    read = getattr(stream, "read1", stream.read)
+    decoder = codecs.getincrementaldecoder(encoding)()
+    parts = []
+    while True:
+        data = read(chunk_size)
+        text = decoder.decode(data, final=not data)
+        *documents, rest = text.split(separator)
+        if documents:
+            parts.append(documents[0])
+            yield "".join(parts)
+            yield from documents[1:]
+            parts = []
+        if rest:
+            parts.append(rest)
+        if not data:
+            break
+    if parts:
+        yield "".join(parts)
+
+
+def write_atomic(filepath, content, encoding):
+    """
+    Write into a temporary file and rename it, so the file would be never
+    written half.
+    """
+    dirname = os.path.dirname(filepath) or "."
+    os.makedirs(dirname, exist_ok=True)
+    fd, temp_path = tempfile.mkstemp(dir=dirname, prefix=".tmp-", suffix=os.path.basename(filepath))
+    try:
+        with open(fd, "w", encoding=encoding, newline="") as outfile:
+            outfile.write(content)
+        # mkstemp() creates the file only readable for the owner:
+        umask = os.umask(0)
+        os.umask(umask)
+        os.chmod(temp_path, 0o666 & ~umask)
+        os.replace(temp_path, filepath)
+    except BaseException:
+        os.remove(temp_path)
+        raise
+
+
+def file_hash(filepath):
+    with open(filepath, "rb") as f:
+        return hashlib.sha1(f.read()).hexdigest()
+
+
+class BulkConvert:
+    """
+    Convert all files of a directory (recursive) or a glob pattern into
+    the destination directory, with the same relative paths.
+
+    Unchanged files would be skipped: With skip="mtime" if the output file
+    is newer than the source file, with skip="hash" if the source content
+    has the same hash as on the last run (stored in the HASH_FILENAME file
+    in the destination directory).
+    """
+    HASH_FILENAME = ".creole-hashes.json"
+
+    def __init__(self, direction, destination, encoding="utf-8", pattern=None, extension=None,
+                 skip="mtime", jobs=1, stdout=None, stderr=None):
+        default_pattern, default_extension = BULK_DEFAULTS[direction]
+        self.direction = direction
+        self.destination = destination
+        self.encoding = encoding
+        self.pattern = pattern or default_pattern
+        self.extension = extension or default_extension
+        self.skip = skip
+        self.jobs = jobs
+        self.stdout = stdout or sys.stdout
+        self.stderr = stderr or sys.stderr
+
+        self.hash_filepath = os.path.join(destination, self.HASH_FILENAME)
+        self.hashes = {}
+
+    def find_sources(self, source):
+        """
+        Returns a sorted list of (source path, relative path) of all files
+        in the source directory or all files that matched the glob pattern.
+        """
+        if os.path.isdir(source):
+            base = source
+            pattern = os.path.join(source, "**", self.pattern)
+        else:
+            # The relative paths starts after the last directory without wildcards:
+            base = ""
+            for part in source.split(os.sep)[:-1]:
+                if glob.has_magic(part):
+                    break
+                base = os.path.join(base, part) if base else (part or os.sep)
+            pattern = source
+
+        sources = []
+        for path in sorted(glob.glob(pattern, recursive=True)):
+            if os.path.isfile(path):
+                sources.append((path, os.path.relpath(path, base or ".")))
+        return sources
+
+    def get_destination(self, relpath):
+        return os.path.join(self.destination, os.path.splitext(relpath)[0] + self.extension)
+
+    def is_unchanged(self, source_path, relpath, dest_path):
+        if not os.path.exists(dest_path):
+            return False
+        if self.skip == "mtime":
+            return os.path.getmtime(dest_path) >= os.path.getmtime(source_path)
+        elif self.skip == "hash":
+            return self.hashes.get(relpath) == file_hash(source_path)
+        return False
+
+    def load_hashes(self):
+        try:
+            with open(self.hash_filepath, encoding="utf-8") as f:
+                self.hashes = json.load(f)
+        except (OSError, ValueError):
+            self.hashes = {}
+
+    def __call__(self, source):
+        """ Convert all files and returns the number of errors """
+        start_time = time.monotonic()
+        if self.skip == "hash":
+            self.load_hashes()
+
+        todo = []
+        skipped = 0
+        for source_path, relpath in self.find_sources(source):
+            dest_path = self.get_destination(relpath)
+            if self.is_unchanged(source_path, relpath, dest_path):
+                skipped += 1
+            else:
+                todo.append((source_path, relpath, dest_path))
+
+        read_errors = {}
+        source_bytes = 0
+
+        def iter_documents():
+            nonlocal source_bytes
+            for index, (source_path, relpath, dest_path) in enumerate(todo):
+                try:
+                    with open(source_path, "rb") as f:
+                        content = f.read()
+                    source_bytes += len(content)
+                    if self.skip == "hash":
+                        self.hashes[relpath] = hashlib.sha1(content).hexdigest()
+                    yield content.decode(self.encoding)
+                except (OSError, UnicodeDecodeError) as err:
+                    read_errors[index] = f"{err.__class__.__name__}: {err}"
+                    yield ""
+
+        # Imported here: multiprocessing is only needed in the bulk mode
+        from creole.batch import convert_many
+
+        converted = 0
+        errors = 0
+        results = convert_many(
+            iter_documents(), direction=self.direction, workers=self.jobs, ordered=False
+        )
+        for result in results:
+            source_path, relpath, dest_path = todo[result.index]
+            error = read_errors.get(result.index, result.error)
+            if error is None:
+                try:
+                    write_atomic(dest_path, result.output, self.encoding)
+                except OSError as err:
+                    error = f"{err.__class__.__name__}: {err}"
+
+            if error is None:
+                converted += 1
+            else:
+                errors += 1
+                self.hashes.pop(relpath, None)
+                print(f"ERROR converting {source_path!r}: {error}", file=self.stderr)
+
+        if self.skip == "hash":
+            write_atomic(
+                self.hash_filepath, json.dumps(self.hashes, indent=0, sort_keys=True), "utf-8"
+            )
+
+        duration = max(time.monotonic() - start_time, 0.001)
+        print(
+            f"{converted} files converted, {skipped} skipped, {errors} errors"
+            f" in {duration:.2f} sec. ({converted / duration:.1f} files/sec.,"
+            f" {source_bytes / 1024 / duration:.1f} KB/sec.)",
+            file=self.stdout,
+        )
+        return errors
+
+
 class CreoleCLI:
     def __init__(self, convert_func):
         self.convert_func = convert_func
@@ -27,33 +248,125 @@ class CreoleCLI:
             '--version', action='version',
             version='%%(prog)s from python-creole v%s' % VERSION_STRING  # noqa flynt
         )
-        self.parser.add_argument("sourcefile", help="source file to convert")
-        self.parser.add_argument("destination", help="Output filename")
+        self.parser.add_argument(
+            "sourcefile",
+            help="source file to convert, or a directory/glob pattern for the bulk mode"
+        )
+        self.parser.add_argument(
+            "destination",
+            help="Output filename, or the output directory in the bulk mode"
+        )
         self.parser.add_argument("--encoding",
                                  default="utf-8",
                                  help="Codec for read/write file (default encoding: utf-8)"
                                  )
 
+        self.parser.add_argument(
+            "--separator", choices=list(SEPARATORS),
+            help=(
+                "Convert a stream of documents separated by NUL or form feed characters."
+                " Every output document is terminated by the same separator."
+            )
+        )
+
+        bulk_defaults = BULK_DEFAULTS[convert_func.__name__]
+        bulk = self.parser.add_argument_group("bulk mode")
+        bulk.add_argument(
+            "--pattern",
+            help=f"Glob pattern for the files in a source directory (default: {bulk_defaults[0]})"
+        )
+        bulk.add_argument(
+            "--extension",
+            help=f"File extension of the output files (default: {bulk_defaults[1]})"
+        )
+        bulk.add_argument(
+            "--skip", choices=("mtime", "hash", "none"), default="mtime",
+            help=(
+                "Skip unchanged files: if the output file is newer (mtime)"
+                " or the source content hash is the same as on the last run (default: mtime)"
+            )
+        )
+        bulk.add_argument(
+            "--jobs", type=int, default=1,
+            help="Number of parallel worker processes (default: 1)"
+        )
+
         args = self.parser.parse_args()
 
         sourcefile = args.sourcefile
         destination = args.destination
         encoding = args.encoding
 
-        self.convert(sourcefile, destination, encoding)
+        if os.path.isdir(sourcefile) or (
+            # A file name may contain glob characters, e.g.: "n[1].creole"
+            glob.has_magic(sourcefile) and not os.path.isfile(sourcefile)
+        ):
+            bulk_convert = BulkConvert(
+                direction=convert_func.__name__,
+                destination=destination,
+                encoding=encoding,
+                pattern=args.pattern,
+                extension=args.extension,
+                skip=args.skip,
+                jobs=args.jobs,
+            )
+            if bulk_convert(sourcefile):
+                self.parser.exit(status=1)
+        else:
+            self.convert(sourcefile, destination, encoding, separator=args.separator)
 
-    def convert(self, sourcefile, destination, encoding):
+    def convert(self, sourcefile, destination, encoding, separator=None):
+        """
+        Convert sourcefile into destination, "-" means stdin and stdout.
+        """
+        # Don't mix the messages into the converted output:
+        info = sys.stderr if destination == "-" else sys.stdout
         print(
             f"Convert {sourcefile!r} to {destination!r} with {self.convert_func.__name__}"
-            f" (codec: {encoding})"
+            f" (codec: {encoding})",
+            file=info,
         )
 
-        with codecs.open(sourcefile, "r", encoding=encoding) as infile:
-            with codecs.open(destination, "w", encoding=encoding) as outfile:
-                content = infile.read()
-                converted = self.convert_func(content)
-                outfile.write(converted)
-        print(f"done. {destination!r} created.")
+        if sourcefile != "-" and destination != "-" and separator is None:
+            with codecs.open(sourcefile, "r", encoding=encoding) as infile:
+                with codecs.open(destination, "w", encoding=encoding) as outfile:
+                    content = infile.read()
+                    converted = self.convert_func(content)
+                    outfile.write(converted)
+            print(f"done. {destination!r} created.")
+            return
+
+        infile = sys.stdin.buffer if sourcefile == "-" else open(sourcefile, "rb")
+        outfile = sys.stdout.buffer if destination == "-" else open(destination, "wb")
+        try:
+            count = self.convert_stream(infile, outfile, encoding, separator)
+        finally:
+            if infile is not sys.stdin.buffer:
+                infile.close()
+            if outfile is not sys.stdout.buffer:
+                outfile.close()
+        print(f"done. {count} document(s) written to {destination!r}.", file=info)
+
+    def convert_stream(self, infile, outfile, encoding, separator=None):
+        """
+        Convert the documents from the binary infile stream into outfile
+        and returns the number of documents. With a separator every document
+        would be written (and flushed) as soon as it's read completely.
+        """
+        if separator is None:
+            documents = [infile.read().decode(encoding)]
+            terminator = b""
+        else:
+            separator = SEPARATORS[separator]
+            documents = iter_stream_documents(infile, separator, encoding)
+            terminator = separator.encode(encoding)
+
+        count = 0
+        for document in documents:
+            outfile.write(self.convert_func(document).encode(encoding) + terminator)
+            outfile.flush()
+            count += 1
+        return count
 
 
 def cli_creole2html():
@@ -72,8 +385,58 @@ def cli_html2textile():
     CreoleCLI(html2textile)
 
 
+def cli_serve(argv=None):
+    """
+    Start the conversion server, see: creole.server
+    """
+    from creole.server import make_server
+
+    parser = argparse.ArgumentParser(
+        description=(
+            "Start a python-creole conversion server: POST the document to"
+            " /creole2html, /html2creole, /html2markdown, /html2rest or /html2textile"
+            " and GET /metrics"
+        ),
+    )
+    parser.add_argument(
+        '--version', action='version',
+        version=f'%(prog)s from python-creole v{VERSION_STRING}'
+    )
+    parser.add_argument(
+        "--host", default="127.0.0.1", help="Host to listen on (default: 127.0.0.1)"
+    )
+    parser.add_argument("--port", type=int, default=8000, help="Port to listen on (default: 8000)")
+    parser.add_argument("--unix-socket", help="Listen on this Unix socket instead of host/port")
+    parser.add_argument(
+        "--workers", type=int,
+        help="Number of worker processes, 0 converts in the request threads (default: one per CPU)"
+    )
+    parser.add_argument("--verbose", action="store_true", help="Log every request to stderr")
+    args = parser.parse_args(argv)
+
+    try:
+        server = make_server(
+            host=args.host,
+            port=args.port,
+            unix_socket=args.unix_socket,
+            workers=args.workers,
+            verbose=args.verbose,
+        )
+    except OSError as err:
+        parser.error(f"Can't start the server: {err}")
+    if args.unix_socket:
+        print(f"Serving on Unix socket {args.unix_socket!r}")
+    else:
+        print(f"Serving on http://{args.host}:{server.server_address[1]}/")
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        print("Stopped.")
+    finally:
+        server.server_close()
+
+
 if __name__ == "__main__":
-    import sys
     sys.argv += ["../README.creole", "../test.html"]
     print(sys.argv)
     cli_creole2html()
@@ -0,0 +1,246 @@
+"""
+    python-creole converter
+    ~~~~~~~~~~~~~~~~~~~~~~~
+
+    Reusable converter objects: Prepare all options only once and
+    convert many documents with them.
+
+    :copyleft: 2026 by python-creole team, see AUTHORS for more details.
+    :license: GNU GPL v3 or above, see LICENSE for more details.
+"""
+
+
+import hashlib
+import re
+import sys
+import threading
+from collections import OrderedDict
+
+from creole.emitter.creol2html_emitter import HtmlEmitter
+from creole.parser.creol2html_parser import CreoleParser
+from creole.parser.creol2html_rules import BlockRules
+
+
+# Matches the start of all <<toc>> macro variants:
+toc_macro_re = re.compile(r"<<\s*toc\b", re.UNICODE)
+
+
+class Creole2HtmlConverter:
+    """
+    Convert creole markup into html code, like creole2html(), but all
+    options are prepared only once in __init__:
+
+    >>> conv = Creole2HtmlConverter()
+    >>> conv('This is **creole //markup//**!')
+    '<p>This is <strong>creole <i>markup</i></strong>!</p>'
+    >>> conv('Reuse the **same** converter.')
+    '<p>Reuse the <strong>same</strong> converter.</p>'
+
+    The converter stores nothing from a conversion, a new parser and emitter
+    are used for every document. So one instance can be used in many threads
+    at the same time, as long as the given macros are thread-safe, too.
+    """
+    parser_class = CreoleParser
+    emitter_class = HtmlEmitter
+
+    def __init__(self, block_rules=None, blog_line_breaks=True,
+                 macros=None, verbose=None, stderr=None,
+                 strict=False, debug=False, macro_runner=None,
+                 ):
+        if block_rules is None:
+            block_rules = BlockRules(blog_line_breaks=blog_line_breaks)
+        self.block_rules = block_rules
+        self.blog_line_breaks = blog_line_breaks
+
+        if callable(macros):
+            # was a DeprecationWarning in the past
+            raise TypeError("Callable macros are not supported anymore!")
+
+        if macros is None:
+            macros = {}
+        self.macros = macros
+
+        if verbose is None:
+            verbose = 1
+        self.verbose = verbose
+
+        if stderr is None:
+            stderr = sys.stderr
+        self.stderr = stderr
+
+        self.strict = strict
+        self.debug = debug
+        self.macro_runner = macro_runner  # None: creole.shared.macro_runner.default_runner
+
+    def parse(self, markup_string):
+        """ Create the document tree from creole markup """
+        assert isinstance(markup_string, str), "given markup_string must be unicode!"
+
+        document = self.parser_class(
+            markup_string,
+            block_rules=self.block_rules,
+            blog_line_breaks=self.blog_line_breaks,
+            debug=self.debug
+        ).parse()
+        if self.debug:
+            document.debug()
+        return document
+
+    def get_emitter(self, document):
+        return self.emitter_class(
+            document,
+            macros=self.macros,
+            verbose=self.verbose,
+            stderr=self.stderr,
+            strict=self.strict,
+            macro_runner=self.macro_runner,
+        )
+
+    def __call__(self, markup_string):
+        """ convert creole markup into html code """
+        document = self.parse(markup_string)
+        return self.get_emitter(document).emit()
+
+    def iter_convert(self, markup_string):
+        """
+        Generator that converts creole markup into html code block by block:
+
+        >>> conv = Creole2HtmlConverter()
+        >>> list(conv.iter_convert("= Headline\\n\\nfirst\\n\\nsecond"))
+        ['<h1>Headline</h1>', '\\n\\n<p>first</p>', '\\n\\n<p>second</p>']
+
+        Joined, the html chunks are the same as conv(markup_string).
+        Only the current top-level block is hold in memory.
+
+        A table of contents needs all headlines of the document: If the
+        markup contains a <<toc>> macro, the complete html code would be
+        created and yielded at the end.
+        """
+        if toc_macro_re.search(markup_string):
+            yield self(markup_string)
+            return
+
+        assert isinstance(markup_string, str), "given markup_string must be unicode!"
+        parser = self.parser_class(
+            markup_string,
+            block_rules=self.block_rules,
+            blog_line_breaks=self.blog_line_breaks,
+            debug=self.debug
+        )
+        emitter = self.get_emitter(parser.root)
+        yield from emitter.iter_emit(parser.iter_blocks())
+
+
+class IncrementalCreole2HtmlConverter(Creole2HtmlConverter):
+    """
+    Creole2HtmlConverter that caches the html code of every part of a
+    document between empty lines. If a changed document would be converted
+    again, only the changed parts would be parsed and emitted:
+
+    >>> conv = IncrementalCreole2HtmlConverter()
+    >>> conv("= Headline\\n\\nfirst\\n\\nsecond")
+    '<h1>Headline</h1>\\n\\n<p>first</p>\\n\\n<p>second</p>'
+    >>> conv("= Headline\\n\\nchanged\\n\\nsecond")
+    '<h1>Headline</h1>\\n\\n<p>changed</p>\\n\\n<p>second</p>'
+    >>> conv.hits, conv.misses
+    (2, 4)
+
+    The document would be split on the same empty lines ("line" block rule)
+    that separate the top-level blocks in the CreoleParser. After an empty
+    line the parser starts always at the document root, so every part can be
+    parsed on its own, with the block matches of the complete text.
+
+    Parts with macros are never cached, because the macro result may change.
+    A document with <<toc>> would be always converted completely, because the
+    table of contents depends on all headlines.
+    """
+
+    def __init__(self, *args, max_blocks=10000, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.max_blocks = max_blocks
+
+        self._cache = OrderedDict()  # key -> html code (in LRU order)
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+
+    def clear(self):
+        with self._lock:
+            self._cache.clear()
+            self.hits = 0
+            self.misses = 0
+
+    def split(self, markup_string):
+        """
+        Returns the parts of the document as a list of (source, matches) tuples.
+        Every part, except the first one, starts with an empty line.
+        """
+        parser = self.parser_class(
+            markup_string,
+            block_rules=self.block_rules,
+            blog_line_breaks=self.blog_line_breaks,
+            debug=self.debug
+        )
+        text = parser.get_text()
+
+        parts = []
+        start = 0
+        matches = []
+        for match in parser.block_re.finditer(text):
+            if match.lastgroup == "line" and matches:
+                parts.append((text[start:match.start()], matches))
+                start = match.start()
+                matches = []
+            matches.append(match)
+        parts.append((text[start:], matches))
+        return parts
+
+    def convert_part(self, matches, is_last):
+        """
+        Returns the html code and the used macros of one part of the document
+        """
+        parser = self.parser_class(
+            "",
+            block_rules=self.block_rules,
+            blog_line_breaks=self.blog_line_breaks,
+            debug=self.debug
+        )
+        document = parser.parse_matches(matches)
+        if not is_last:
+            # The empty line at the start of the next part would do this:
+            parser.close_block()
+        html = self.get_emitter(document).emit_node(document)
+        return html, document.used_macros
+
+    def __call__(self, markup_string):
+        """ convert creole markup into html code """
+        assert isinstance(markup_string, str), "given markup_string must be unicode!"
+        if toc_macro_re.search(markup_string):
+            return super().__call__(markup_string)
+
+        parts = self.split(markup_string)
+        last_index = len(parts) - 1
+        result = []
+        for index, (source, matches) in enumerate(parts):
+            is_last = index == last_index
+            key = (hashlib.sha1(source.encode("utf-8")).digest(), is_last)
+
+            with self._lock:
+                html = self._cache.get(key)
+                if html is None:
+                    self.misses += 1
+                else:
+                    self.hits += 1
+                    self._cache.move_to_end(key)
+
+            if html is None:
+                html, used_macros = self.convert_part(matches, is_last)
+                if not used_macros:
+                    with self._lock:
+                        self._cache[key] = html
+                        while len(self._cache) > self.max_blocks:
+                            self._cache.popitem(last=False)
+
+            result.append(html)
+
+        return "".join(result).strip()
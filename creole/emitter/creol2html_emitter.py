@@ -6,21 +6,27 @@
 """
 
 
-import json
 import sys
-import traceback
-from xml.sax.saxutils import escape
 
 from creole.parser.creol2html_parser import CreoleParser
-from creole.shared.utils import string2dict
+from creole.shared.base_emitter import emit_tree
+from creole.shared.macro_runner import default_runner, parse_macro_args
+from creole.shared.utils import DispatchTable, attr_escape, html_escape, slugify
 
 
 class TableOfContent:
+    """
+    The <<toc>> macro. The headlines are added before the document is
+    emitted (see: HtmlEmitter.__init__), so the html code of the table
+    of contents can be returned directly from the macro call.
+    """
+
     def __init__(self):
         self.max_depth = None
-        self.headlines = []
+        self.headlines = []  # (level, content, anchor)
+        self.anchors = set()
+        self.html = None  # The emitted table of contents
         self._created = False
-        self._current_level = 0
 
     def __call__(self, depth=None, **kwargs):
         """Called when if the macro <<toc>> is defined when it is emitted."""
@@ -31,14 +37,19 @@ class TableOfContent:
         if depth is not None:
             self.max_depth = depth
 
-        return '<<toc>>'
+        self.html = self.get_html()
+        return self.html
 
     def add_headline(self, level, content):
-        """Add the current header to the toc."""
-        if self.max_depth is None or level <= self.max_depth:
-            self.headlines.append(
-                (level, content)
-            )
+        """Add a header to the toc and returns the unique anchor name for it."""
+        anchor = slug = slugify(content)
+        number = 0
+        while anchor in self.anchors:
+            number += 1
+            anchor = f"{slug}-{number}"
+        self.anchors.add(anchor)
+        self.headlines.append((level, content, anchor))
+        return anchor
 
     def flat_list2nest_list(self, flat_list):
         # this func code based on borrowed code from EyDu, Thanks!
@@ -61,42 +72,54 @@ class TableOfContent:
 
         return tree
 
-    def nested_headlines2html(self, nested_headlines, level=0):
-        """Convert a python nested list like the one representing the toc to an html equivalent."""
+    def nested_headlines2html(self, nested_headlines, level=0, parts=None):
+        """
+        Convert a python nested list like the one representing the toc to an html equivalent.
+        The elements are (content, anchor) tuples.
+        """
+        if parts is None:
+            parts = []
+            self.nested_headlines2html(nested_headlines, level, parts)
+            return "".join(parts)
+
         indent = "\t" * level
-        if isinstance(nested_headlines, str):
-            return f'{indent}<li><a href="#{nested_headlines}">{nested_headlines}</a></li>\n'
-        elif isinstance(nested_headlines, list):
-            html = f'{indent}<ul>\n'
-            for elt in nested_headlines:
-                html += self.nested_headlines2html(elt, level + 1)
-            html += f'{indent}</ul>'
-            if level > 0:
-                html += "\n"
-            return html
-
-    def emit(self, document):
-        """Emit the toc where the <<toc>> macro was."""
-        nested_headlines = self.flat_list2nest_list(self.headlines)
-        html = self.nested_headlines2html(nested_headlines)
-
-        # FIXME: We should not use <p> here, because it doesn't match
-        #        if no newline was made before <<toc>>
-        if "<p><<toc>></p>" in document:
-            document = document.replace("<p><<toc>></p>", html, 1)
-        else:
-            document = document.replace("<<toc>>", html, 1)
+        parts.append(f"{indent}<ul>\n")
+        for element in nested_headlines:
+            if isinstance(element, list):
+                self.nested_headlines2html(element, level + 1, parts)
+            else:
+                content, anchor = element
+                parts.append(f'{indent}\t<li><a href="#{anchor}">{html_escape(content)}</a></li>\n')
+        parts.append(f"{indent}</ul>\n" if level else f"{indent}</ul>")
 
-        return document
+    def get_html(self):
+        flat_list = [
+            (level, (content, anchor))
+            for level, content, anchor in self.headlines
+            if self.max_depth is None or level <= self.max_depth
+        ]
+        return self.nested_headlines2html(self.flat_list2nest_list(flat_list))
 
 
 class HtmlEmitter:
     """
     Generate HTML output for the document
     tree consisting of DocNodes.
+
+    The *_emit methods return a string or they are generators that yield
+    the node to get the emitted children (see: base_emitter.emit_tree())
+
+    All macros are called through the macro_runner. Without one, the
+    module global creole.shared.macro_runner.default_runner is used: Its
+    memoized results of @pure macros and its statistics are shared by all
+    emitters in the process and are only removed by default_runner.clear().
+    Give every converter its own MacroRunner(), to keep them apart.
     """
+    # node.kind -> *_emit method:
+    _emit_methods = DispatchTable(suffix="_emit", exclude=("default", "iter", "macro"))
 
-    def __init__(self, root, macros=None, verbose=None, stderr=None, strict=False):
+    def __init__(self, root, macros=None, verbose=None, stderr=None, strict=False,
+                 macro_runner=None):
 
         self.root = root
 
@@ -114,17 +137,20 @@ class HtmlEmitter:
             self.toc = None
         else:
             if isinstance(self.macros, dict):
-                if "toc" in self.macros:
-                    self.toc = self.macros["toc"]
-                else:
-                    self.toc = TableOfContent()
-                    self.macros["toc"] = self.toc
+                self.toc = self.macros.get("toc")
             else:
-                try:
-                    self.toc = getattr(self.macros, "toc")
-                except AttributeError:
-                    self.toc = TableOfContent()
-                    self.macros.toc = self.toc
+                self.toc = getattr(self.macros, "toc", None)
+
+            if self.toc is None:
+                # Don't add it to the given macros: They may be
+                # used for more than one document (e.g.: in other threads)
+                self.toc = TableOfContent()
+
+            # The headlines are collected by the parser:
+            self.anchors = {
+                node: self.toc.add_headline(node.level, node.content)
+                for node in root.headlines
+            }
 
         if verbose is None:
             self.verbose = 1
@@ -138,6 +164,10 @@ class HtmlEmitter:
 
         self.strict = strict
 
+        if macro_runner is None:
+            macro_runner = default_runner
+        self.macro_runner = macro_runner
+
     def get_text(self, node):
         """Try to emit whatever text is in the node."""
         try:
@@ -145,16 +175,14 @@ class HtmlEmitter:
         except BaseException:
             return node.content or ''
 
-    def html_escape(self, text):
-        return escape(text)
-
-    def attr_escape(self, text):
-        return self.html_escape(text).replace('"', '&quot')
+    html_escape = staticmethod(html_escape)
+    attr_escape = staticmethod(attr_escape)
 
     # *_emit methods for emitting nodes of the document:
 
     def document_emit(self, node):
-        return self.emit_children(node)
+        content = yield node
+        return content
 
     def text_emit(self, node):
         return self.html_escape(node.content)
@@ -163,7 +191,11 @@ class HtmlEmitter:
         return '<hr />\n'
 
     def paragraph_emit(self, node):
-        return f'<p>{self.emit_children(node)}</p>\n'
+        content = yield node
+        if self.toc is not None and content == self.toc.html:
+            # Only the <<toc>> macro in this paragraph: Don't put the list into <p>
+            return f'{content}\n'
+        return f'<p>{content}</p>\n'
 
     def _list_emit(self, node, list_type):
         if node.parent.kind in ("document",):
@@ -181,9 +213,10 @@ class HtmlEmitter:
                 '%(i)s<%(t)s>%(c)s\n'
                 '%(i)s</%(t)s>'
             )
+        content = yield node
         return formatter % {
             "i": "\t" * node.level,
-            "c": self.emit_children(node),
+            "c": content,
             "t": list_type,
         }
 
@@ -197,23 +230,28 @@ class HtmlEmitter:
         return self._list_emit(node, list_type="li")
 
     def table_emit(self, node):
-        return f'<table>\n{self.emit_children(node)}</table>\n'
+        content = yield node
+        return f'<table>\n{content}</table>\n'
 
     def table_row_emit(self, node):
-        return f'<tr>\n{self.emit_children(node)}</tr>\n'
+        content = yield node
+        return f'<tr>\n{content}</tr>\n'
 
     def table_cell_emit(self, node):
-        return f'\t<td>{self.emit_children(node)}</td>\n'
+        content = yield node
+        return f'\t<td>{content}</td>\n'
 
     def table_head_emit(self, node):
-        return f'\t<th>{self.emit_children(node)}</th>\n'
+        content = yield node
+        return f'\t<th>{content}</th>\n'
 
     # --------------------------------------------------------------------------
 
     def _typeface(self, node, tag):
+        content = yield node
         return '<{tag}>{data}</{tag}>'.format(
             tag=tag,
-            data=self.emit_children(node),
+            data=content,
         )
 
     # TODO: How can we generalize that:
@@ -246,9 +284,8 @@ class HtmlEmitter:
     def header_emit(self, node):
         header = f'<h{node.level:d}>{self.html_escape(node.content)}</h{node.level:d}>'
         if self.toc is not None:
-            self.toc.add_headline(node.level, node.content)
             # add link attribute for toc navigation
-            header = f'<a name="{self.html_escape(node.content)}">{header}</a>'
+            header = f'<a name="{self.anchors[node]}">{header}</a>'
 
         header += "\n"
         return header
@@ -259,7 +296,7 @@ class HtmlEmitter:
     def link_emit(self, node):
         target = node.content
         if node.children:
-            inside = self.emit_children(node)
+            inside = yield node
         else:
             inside = self.html_escape(target)
 
@@ -277,7 +314,10 @@ class HtmlEmitter:
                     w_str, h_str = size_str.split("x", 1)
                     width = int(w_str.strip())
                     height = int(h_str.strip())
-                    return f'<img src="{self.attr_escape(target)}" title="{title}" alt="{title}" width="{width}" height="{height}" />'
+                    return (
+                        f'<img src="{self.attr_escape(target)}" title="{title}" alt="{title}"'
+                        f' width="{width}" height="{height}" />'
+                    )
             except BaseException:
                 pass
         return f'<img src="{self.attr_escape(target)}" title="{text}" alt="{text}" />'
@@ -290,8 +330,9 @@ class HtmlEmitter:
 
         args = node.macro_args
         try:
-            macro_kwargs = string2dict(args)
+            macro_kwargs = dict(parse_macro_args(args))
         except ValueError:
+            import json
             exc_info = sys.exc_info()
             return self.error(
                 f"Wrong macro arguments: {json.dumps(args)} for macro '{macro_name}' (maybe wrong macro tag syntax?)",
@@ -301,7 +342,9 @@ class HtmlEmitter:
         macro_kwargs["text"] = text
 
         exc_info = None
-        if isinstance(self.macros, dict):
+        if macro_name == "toc" and self.toc is not None:
+            macro = self.toc
+        elif isinstance(self.macros, dict):
             try:
                 macro = self.macros[macro_name]
             except KeyError:
@@ -319,7 +362,7 @@ class HtmlEmitter:
             )
 
         try:
-            result = macro(**macro_kwargs)
+            result = self.macro_runner.call(macro_name, macro, macro_kwargs)
         except TypeError as err:
             msg = f"Macro '{macro_name}' error: {err}"
             exc_info = sys.exc_info()
@@ -393,24 +436,49 @@ class HtmlEmitter:
         return ''.join(self.emit_node(child) for child in node.children)
 
     def emit_node(self, node):
-        """Emit a single node."""
+        """Emit a single node (with all of its children)."""
+        return emit_tree(node, self._emit_node)
+
+    def _emit_node(self, node):
+        """Emit a single node, used in emit_tree()"""
         #print("%s_emit: %r" % (node.kind, node.content))
-        emit = getattr(self, f'{node.kind}_emit', self.default_emit)
-        return emit(node)
+        try:
+            emit = self._emit_methods[node.kind]
+        except KeyError:
+            return self.default_emit(node)
+        return emit(self, node)
+
+    def iter_emit(self, nodes):
+        """
+        Emit the given top-level nodes (see: CreoleParser.iter_blocks())
+        and yield the html code for every one. The whitespace at the start
+        and the end of the document would be stripped, like emit() does it.
+
+        Note: The table of contents is not supported here.
+        """
+        started = False
+        pending = ""  # whitespace at the end of the last html chunk
+        for node in nodes:
+            html = pending + self.emit_node(node)
+            if not started:
+                html = html.lstrip()
+
+            stripped = html.rstrip()
+            pending = html[len(stripped):]
+            if stripped:
+                started = True
+                yield stripped
 
     def emit(self):
         """Emit the document represented by self.root DOM tree."""
-        document = self.emit_node(self.root).strip()
-        if self.toc is not None:
-            return self.toc.emit(document)
-        else:
-            return document
+        return self.emit_node(self.root).strip()
 
     def error(self, text, exc_info=None):
         """
         Error Handling.
         """
         if self.verbose > 1 and exc_info:
+            import traceback
             exc_type, exc_value, exc_traceback = exc_info
             exception = "".join(traceback.format_exception(exc_type, exc_value, exc_traceback))
             self.stderr.write(exception)
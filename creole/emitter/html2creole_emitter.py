@@ -46,7 +46,7 @@ class CreoleEmitter(BaseEmitter):
     # --------------------------------------------------------------------------
 
     def p_emit(self, node):
-        result = self.emit_children(node)
+        result = yield node
         if self._inner_list == "":
             result += "\n\n"
         return result
@@ -58,7 +58,8 @@ class CreoleEmitter(BaseEmitter):
             return "\n"
 
     def headline_emit(self, node):
-        return f"{'=' * node.level} {self.emit_children(node)}\n\n"
+        content = yield node
+        return f"{'=' * node.level} {content}\n\n"
 
     # --------------------------------------------------------------------------
 
@@ -96,7 +97,7 @@ class CreoleEmitter(BaseEmitter):
         return "----\n\n"
 
     def a_emit(self, node):
-        link_text = self.emit_children(node)
+        link_text = yield node
         try:
             url = node.attrs["href"]
         except KeyError:
@@ -14,6 +14,7 @@ from creole.parser.html_parser import HtmlParser
 from creole.shared.base_emitter import BaseEmitter
 from creole.shared.document_tree import DocNode
 from creole.shared.markup_table import MarkupTable
+from creole.shared.utils import DispatchTable
 
 
 def quote_link(uri):
@@ -34,6 +35,8 @@ class MarkdownEmitter(BaseEmitter):
     Build from a document_tree (html2creole.parser.HtmlParser instance) a
     Markdown markup text.
     """
+    # "list_emit" is only used for "ul" and "ol":
+    _emit_methods = DispatchTable(suffix="_emit", exclude=("list",))
 
     def __init__(self, document_tree, strict=False, *args, **kwargs):
         self.strict = strict
@@ -46,21 +49,25 @@ class MarkdownEmitter(BaseEmitter):
     # --------------------------------------------------------------------------
     def table_emit(self, node):
         self._table = MarkupTable(head_prefix='', debug_msg=self.debug_msg)
-        self.emit_children(node)
+        yield node
         content = self._table.get_markdown_table()
         return f'\n{content}\n'
 
     def tr_emit(self, node):
         self._table.add_tr()
-        self.emit_children(node)
+        yield node
         return ''
 
     def th_emit(self, node):
-        self._table.add_th(self.emit_children(node))
+        table = self._table
+        content = yield node
+        table.add_th(content)
         return ''
 
     def td_emit(self, node):
-        self._table.add_td(self.emit_children(node))
+        table = self._table
+        content = yield node
+        table.add_td(content)
         return ''
     # --------------------------------------------------------------------------
 
@@ -95,7 +102,8 @@ class MarkdownEmitter(BaseEmitter):
     # --------------------------------------------------------------------------
 
     def p_emit(self, node: DocNode):
-        return f'\n{self.emit_children(node)}\n'
+        content = yield node
+        return f'\n{content}\n'
 
     def br_emit(self, node: DocNode):
         return '\n'
@@ -104,7 +112,8 @@ class MarkdownEmitter(BaseEmitter):
         prefix = '#' * node.level
         if node.parent not in ('document', 'headline', 'p'):
             prefix = f'\n{prefix}'
-        return f'{prefix} {self.emit_children(node)}\n'
+        content = yield node
+        return f'{prefix} {content}\n'
 
     # --------------------------------------------------------------------------
 
@@ -123,7 +132,8 @@ class MarkdownEmitter(BaseEmitter):
         return self._typeface(node, key='##')
 
     def _typeface_html(self, node, tag):
-        return f'<{tag}>{self.emit_children(node)}</{tag}>'
+        content = yield node
+        return f'<{tag}>{content}</{tag}>'
 
     def sup_emit(self, node: DocNode):
         return self._typeface_html(node, tag='sup')
@@ -148,7 +158,7 @@ class MarkdownEmitter(BaseEmitter):
         return '\n----\n'
 
     def a_emit(self, node: DocNode):
-        link_text = self.emit_children(node)
+        link_text = yield node
 
         url = quote_link(node.attrs['href'])
 
@@ -171,7 +181,7 @@ class MarkdownEmitter(BaseEmitter):
     # --------------------------------------------------------------------------
 
     def list_emit(self, node: DocNode):
-        content = self.emit_children(node)
+        content = yield node
         if node.level == 1:
             return f'\n{content}\n'
         return content
@@ -193,7 +203,7 @@ class MarkdownEmitter(BaseEmitter):
 
         indent = '  ' * (list_level - 1)
 
-        content = self.emit_children(node)
+        content = yield node
         return f"\n{indent}{prefix} {content}"
 
     # --------------------------------------------------------------------------
@@ -205,7 +215,7 @@ class MarkdownEmitter(BaseEmitter):
         return node.content
 
     def code_emit(self, node: DocNode):
-        code_block = self._emit_content(node)
+        code_block = yield from self._emit_content(node)
         assert '\n' not in code_block
 
         if '`' in code_block:
@@ -12,6 +12,7 @@
 
 
 import posixpath
+from types import GeneratorType
 
 from creole.shared.base_emitter import BaseEmitter
 from creole.shared.markup_table import MarkupTable
@@ -70,17 +71,13 @@ class ReStructuredTextEmitter(BaseEmitter):
 
     # --------------------------------------------------------------------------
 
-    def emit_children(self, node):
-        """Emit all the children of a node."""
-        return "".join(self.emit_children_list(node))
-
     def emit(self):
         """Emit the document represented by self.root DOM tree."""
         return self.emit_node(self.root).rstrip()
 
     def document_emit(self, node):
         self.last = node
-        result = self.emit_children(node)
+        result = yield node
         if self._substitution_data:
             # add rest at the end
             if not result.endswith("\n\n"):
@@ -88,16 +85,21 @@ class ReStructuredTextEmitter(BaseEmitter):
             result += f"{self._get_block_data()}\n\n"
         return result
 
-    def emit_node(self, node):
-        result = ""
+    def _emit_node(self, node):
         if self._substitution_data and node.parent == self.root:
-            result += f"{self._get_block_data()}\n\n"
+            return self._emit_with_block_data(node)
+        return super()._emit_node(node)
 
-        result += super().emit_node(node)
-        return result
+    def _emit_with_block_data(self, node):
+        result = f"{self._get_block_data()}\n\n"
+        content = super()._emit_node(node)
+        if isinstance(content, GeneratorType):
+            content = yield from content
+        return result + content
 
     def p_emit(self, node):
-        return f"{self.emit_children(node)}\n\n"
+        content = yield node
+        return f"{content}\n\n"
 
     HEADLINE_DATA = {
         1: ("=", True),
@@ -109,7 +111,7 @@ class ReStructuredTextEmitter(BaseEmitter):
     }
 
     def headline_emit(self, node):
-        text = self.emit_children(node)
+        text = yield node
 
         level = node.level
         if level > 6:
@@ -128,7 +130,8 @@ class ReStructuredTextEmitter(BaseEmitter):
     # --------------------------------------------------------------------------
 
     def _typeface(self, node, key):
-        return key + self.emit_children(node) + key
+        content = yield node
+        return key + content + key
 
     def strong_emit(self, node):
         return self._typeface(node, key="**")
@@ -148,7 +151,8 @@ class ReStructuredTextEmitter(BaseEmitter):
 
     def small_emit(self, node):
         # FIXME: Is there no small in ReSt???
-        return self.emit_children(node)
+        content = yield node
+        return content
 
 #    def sup_emit(self, node):
 #        return self._typeface(node, key="^")
@@ -202,7 +206,7 @@ class ReStructuredTextEmitter(BaseEmitter):
                 raise Html2restException(msg)
 
     def a_emit(self, node):
-        link_text = self.emit_children(node)
+        link_text = yield node
         url = node.attrs["href"]
 
         old_url = self._get_old_substitution(self._used_substitution_links, link_text, url)
@@ -252,18 +256,20 @@ class ReStructuredTextEmitter(BaseEmitter):
     # --------------------------------------------------------------------------
 
     def code_emit(self, node):
-        return f"``{self._emit_content(node)}``"
+        content = yield from self._emit_content(node)
+        return f"``{content}``"
 
     # --------------------------------------------------------------------------
 
     def li_emit(self, node):
-        content = self.emit_children(node).strip("\n")
+        content = yield node
+        content = content.strip("\n")
         result = f"\n{'    ' * (node.level - 1)}{self._list_markup} {content}\n"
         return result
 
     def _list_emit(self, node, list_type):
         self._list_markup = list_type
-        content = self.emit_children(node)
+        content = yield node
 
         if node.level == 1:
             # FIXME: This should be made ​​easier and better
@@ -287,6 +293,6 @@ class ReStructuredTextEmitter(BaseEmitter):
             auto_width=True,
             debug_msg=self.debug_msg
         )
-        self.emit_children(node)
+        yield node
         content = self._table.get_rest_table()
         return f"{content}\n\n"
@@ -45,15 +45,18 @@ class TextileEmitter(BaseEmitter):
     # --------------------------------------------------------------------------
 
     def p_emit(self, node):
-        return f"{self.emit_children(node)}\n\n"
+        content = yield node
+        return f"{content}\n\n"
 
     def headline_emit(self, node):
-        return f"h{node.level:d}. {self.emit_children(node)}\n\n"
+        content = yield node
+        return f"h{node.level:d}. {content}\n\n"
 
     # --------------------------------------------------------------------------
 
     def _typeface(self, node, key):
-        return key + self.emit_children(node) + key
+        content = yield node
+        return key + content + key
 
     def strong_emit(self, node):
         return self._typeface(node, key="*")
@@ -95,7 +98,7 @@ class TextileEmitter(BaseEmitter):
         return "----\n\n"
 
     def a_emit(self, node):
-        link_text = self.emit_children(node)
+        link_text = yield node
         url = node.attrs["href"]
         return f'"{link_text}":{url}'
 
@@ -11,17 +11,28 @@
 import re
 from html import entities
 
+from creole.shared.utils import DispatchTable
 
+
+# The named groups are the last groups of every rule: The "lastgroup" of
+# a match selects the Deentity.replace_* method.
 entities_rules = '|'.join([
-    r"(&\#(?P<number>\d+);)",
-    r"(&\#x(?P<hex>[a-fA-F0-9]+);)",
-    r"(&(?P<named>[a-zA-Z]+);)",
+    r"&\#(?P<number>\d+);",
+    r"&\#x(?P<hex>[a-fA-F0-9]+);",
+    r"&(?P<named>[a-zA-Z][a-zA-Z0-9]*);",
 ])
 # print(entities_rules)
 entities_regex = re.compile(
     entities_rules, re.VERBOSE | re.UNICODE | re.MULTILINE
 )
 
+# All named html entities (HTML5, without the trailing ";") -> text
+NAMED_ENTITIES = {
+    name[:-1]: text for name, text in entities.html5.items() if name.endswith(";")
+}
+# Non breaking spaces are replaced with normal spaces:
+NAMED_ENTITIES["nbsp"] = " "
+
 
 class Deentity:
     """
@@ -40,8 +51,18 @@ class Deentity:
     '~'
     >>> d.replace_named("amp")
     '&'
+    >>> d.replace_named("frac12")  # a HTML5 entity
+    '\xbd'
+
+    Unknown named entities are not replaced:
+
+    >>> d.replace_all("&unknown; &amp;")
+    '&unknown; &'
     """
 
+    # Maps the group names of entities_regex to the replace_* methods:
+    _replace_methods = DispatchTable(prefix="replace_", exclude=("all",))
+
     def replace_number(self, text):
         """ unicode number entity """
         unicode_no = int(text)
@@ -53,29 +74,30 @@ class Deentity:
         return chr(unicode_no)
 
     def replace_named(self, text):
-        """ named entity """
-        if text == "nbsp":
-            # Non breaking spaces is not in htmlentitydefs
-            return " "
-        else:
-            codepoint = entities.name2codepoint[text]
-            return chr(codepoint)
+        """ named entity, raises KeyError if it's unknown """
+        return NAMED_ENTITIES[text]
 
     def replace_all(self, content):
         """ replace all html entities form the given text. """
-        def replace_entity(match):
-            groups = match.groupdict()
-            for name, text in groups.items():
-                if text is not None:
-                    replace_method = getattr(self, f'replace_{name}')
-                    return replace_method(text)
+        if "&" not in content:
+            return content
+
+        replace_methods = self._replace_methods
 
-            # Should never happen:
-            raise RuntimeError("deentitfy re rules wrong!")
+        def replace_entity(match):
+            name = match.lastgroup
+            try:
+                return replace_methods[name](self, match[name])
+            except KeyError:  # unknown named entity
+                return match[0]
 
         return entities_regex.sub(replace_entity, content)
 
 
+# Deentity has no state, so all emitters can use this instance:
+deentity = Deentity()
+
+
 if __name__ == '__main__':
     import doctest
     print(doctest.testmod())
@@ -13,20 +13,49 @@ import re
 from creole.parser.html_parser_config import BLOCK_TAGS
 
 
+# Matches a tag with the whitespace around it. The tag ends at the first ">"
 strip_html_regex = re.compile(
     r"""
-        \s*
-        <
-            (?P<end>/{0,1})       # end tag e.g.: </end>
-            (?P<tag>[^ >]+)       # tag name
-            .*?
-            (?P<startend>/{0,1})  # closed tag e.g.: <closed />
-        >
-        \s*
+        (?P<before>\s*)
+        (?P<tag_code>
+            <
+                (?P<end>/{0,1})       # end tag e.g.: </end>
+                (?P<tag>[^ >]+)       # tag name
+                (?P<attrs>[^>]*)      # ends with "/" in a closed tag e.g.: <closed />
+            >
+        )
+        (?P<after>\s*)
     """,
-    re.VERBOSE | re.MULTILINE | re.UNICODE
+    re.VERBOSE | re.UNICODE
 )
 
+BLOCK_TAG_SET = frozenset(BLOCK_TAGS)
+
+
+def strip_tag(match):
+    before, tag_code, end_tag, tag, attrs, after = match.groups()
+    if not (before or after) or tag in BLOCK_TAG_SET:
+        return tag_code
+
+    space_start = before[:1] == " "  # there was space before the tag
+    space_end = after[-1:] == " "  # there was space after the tag
+
+    if end_tag:
+        # It's a normal end tag e.g.: </strong>
+        if space_start or space_end:
+            return tag_code + " "
+    elif attrs[-1:] == "/":
+        # It's a closed start tag e.g.: <br />
+        if space_start:
+            tag_code = " " + tag_code
+        if space_end:
+            tag_code += " "
+    elif space_start or space_end:
+        # a start tag e.g.: <strong>
+        return " " + tag_code
+
+    return tag_code
+
 
 def strip_html(html_code):
     """
@@ -53,48 +82,11 @@ def strip_html(html_code):
 
     >>> strip_html('<p>a <img src="/image.jpg" /> image.</p>')
     '<p>a <img src="/image.jpg" /> image.</p>'
-    """
-
-    def strip_tag(match):
-        block = match.group(0)
-        end_tag = match.group("end") in ("/", "/")
-        startend_tag = match.group("startend") in ("/", "/")
-        tag = match.group("tag")
-
-#        print("_"*40)
-#        print(match.groupdict())
-#        print("block.......: %r" % block)
-#        print("end_tag.....:", end_tag)
-#        print("startend_tag:", startend_tag)
-#        print("tag.........: %r" % tag)
-
-        if tag in BLOCK_TAGS:
-            return block.strip()
-
-        space_start = block.startswith(" ")
-        space_end = block.endswith(" ")
-
-        result = block.strip()
-
-        if end_tag:
-            # It's a normal end tag e.g.: </strong>
-            if space_start or space_end:
-                result += " "
-        elif startend_tag:
-            # It's a closed start tag e.g.: <br />
-
-            if space_start:  # there was space before the tag
-                result = " " + result
-
-            if space_end:  # there was space after the tag
-                result += " "
-        else:
-            # a start tag e.g.: <strong>
-            if space_start or space_end:
-                result = " " + result
-
-        return result
 
+    FIXME: "<br/>" without space is handled like a start tag:
+    >>> strip_html('<p>a <br/> b <br /> c</p>')
+    '<p>a <br/>b<br />c</p>'
+    """
     data = html_code.strip()
     clean_data = " ".join(line.strip() for line in data.split("\n"))
     clean_data = strip_html_regex.sub(strip_tag, clean_data)
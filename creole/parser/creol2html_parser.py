@@ -20,45 +20,54 @@
 """
 
 import re
-from pprint import pformat
+from bisect import bisect_left
 
 from creole.parser.creol2html_rules import (
     INLINE_FLAGS,
     INLINE_RULES,
     BlockRules,
     InlineRules,
+    LazyRules,
     SpecialRules,
+    compile_rules,
 )
 from creole.shared.document_tree import DocNode
+from creole.shared.utils import DispatchTable
 
 
 class CreoleParser:
     """
     Parse the raw text and create a document object
     that can be converted into output using Emitter.
+
+    With track_spans=True the offsets of every node in the raw text are
+    stored in DocNode.start and DocNode.end (see: DocNode.span)
     """
+    # The regexes are compiled on first use, see: LazyRules
+
     # For pre escaping, in creole 1.0 done with ~:
-    pre_escape_re = re.compile(
-        SpecialRules.pre_escape, re.MULTILINE | re.VERBOSE | re.UNICODE
+    pre_escape_re = LazyRules(
+        [SpecialRules.pre_escape], re.MULTILINE | re.VERBOSE | re.UNICODE
     )
 
     # for link descriptions:
-    link_re = re.compile(
-        '|'.join([InlineRules.image, InlineRules.linebreak, InlineRules.char]),
+    link_re = LazyRules(
+        [InlineRules.image, InlineRules.linebreak, InlineRules.char],
         re.VERBOSE | re.UNICODE
     )
     # for list items:
-    item_re = re.compile(
-        SpecialRules.item, re.VERBOSE | re.UNICODE | re.MULTILINE
+    item_re = LazyRules(
+        [SpecialRules.item], re.VERBOSE | re.UNICODE | re.MULTILINE
     )
 
     # for table cells:
-    cell_re = re.compile(SpecialRules.cell, re.VERBOSE | re.UNICODE)
+    cell_re = LazyRules([SpecialRules.cell], re.VERBOSE | re.UNICODE)
 
     # For inline elements:
-    inline_re = re.compile('|'.join(INLINE_RULES), INLINE_FLAGS)
+    inline_re = LazyRules(INLINE_RULES, INLINE_FLAGS)
 
-    def __init__(self, raw, block_rules=None, blog_line_breaks=True, debug=False):
+    def __init__(self, raw, block_rules=None, blog_line_breaks=True, debug=False,
+                 *, track_spans=False):
         assert isinstance(raw, str)
         self.raw = raw
 
@@ -68,16 +77,80 @@ class CreoleParser:
         self.blog_line_breaks = blog_line_breaks
         self.debug = debug  # TODO: use logging
 
-        # setup block element rules:
-        self.block_re = re.compile('|'.join(block_rules.rules), block_rules.re_flags)
+        # setup block element rules (compiled only once per rule set):
+        self.block_re = compile_rules(tuple(block_rules.rules), block_rules.re_flags)
 
         self.root = DocNode('document', None)
         self.cur = self.root        # The most recent document node
         self.text = None            # The node to add inline characters to
+        self.text_parts = []        # The content of self.text, see: _add_text()
         self.last_text_break = None  # Last break node, inserted by _text_repl()
 
         # Filled with all macros that's in the text
         self.root.used_macros = set()
+        # All header nodes, e.g. for the table of contents:
+        self.root.headlines = []
+
+        self.track_spans = track_spans
+        self.offset = 0  # Offset of the text that is currently scanned
+        self.untracked = []  # New nodes without a span, see: _replace_tracked()
+        if track_spans:
+            self.root.start = self.root.end = None
+            # Positions of all \r\n line endings in the text with \n line
+            # endings, see: finish_spans()
+            self.crlf_positions = []
+            index = raw.find("\r\n")
+            while index != -1:
+                self.crlf_positions.append(index - len(self.crlf_positions))
+                index = raw.find("\r\n", index + 2)
+
+    # --------------------------------------------------------------------------
+    # Source span bookkeeping, only used with track_spans=True
+
+    def _new_node(self, kind, parent, content=None):
+        """ Used to create all nodes while parsing """
+        node = DocNode(kind, parent, content)
+        if self.track_spans:
+            node.start = node.end = None
+            self.untracked.append(node)
+        return node
+
+    def _set_spans(self, first, start, end):
+        """
+        Set the span of all nodes created since len(self.untracked) was first
+        """
+        if self.track_spans:
+            untracked = self.untracked
+            for node in untracked[first:]:
+                node.start = start
+                node.end = end
+            del untracked[first:]
+
+    def finish_spans(self, node):
+        """
+        Extend the spans of the node and all of its children to cover
+        their children and convert them into offsets in self.raw
+        (The offsets of the matches are in the text with \\n line endings)
+        """
+        nodes = []
+        stack = [node]
+        while stack:
+            node = stack.pop()
+            nodes.append(node)
+            stack.extend(node.children)
+
+        for node in reversed(nodes):  # all children before their parent
+            for child in node.children:
+                if node.start is None or child.start < node.start:
+                    node.start = child.start
+                if node.end is None or child.end > node.end:
+                    node.end = child.end
+
+        crlf_positions = self.crlf_positions
+        if crlf_positions:
+            for node in nodes:
+                node.start += bisect_left(crlf_positions, node.start)
+                node.end += bisect_left(crlf_positions, node.end)
 
     # --------------------------------------------------------------------------
 
@@ -111,91 +184,96 @@ class CreoleParser:
         self.cur = self._upto(self.cur, ('document',))  # 'section', 'blockquote'))
 
     # __________________________________________________________________________
-    # The _*_repl methods called for matches in regexps. Sometimes the
-    # same method needs several names, because of group names in regexps.
+    # The _*_repl methods called for matches in regexps. The outermost named
+    # group of every rule is the "lastgroup" of the match and selects the method.
 
-    def _text_repl(self, groups):
+    # Maps the rule group names to the _*_repl methods:
+    _repl_methods = DispatchTable(prefix="_", suffix="_repl")
+
+    def _text_repl(self, match):
         #        print("_text_repl()", self.cur.kind)
+        # The "space" and "break" groups exists only in one of the text rules:
+        groups = match.groupdict()
         #        self.debug_groups(groups)
 
         if self.cur.kind in ('table', 'table_row', 'bullet_list', 'number_list'):
             self._upto_block()
 
         if self.cur.kind in ('document', 'section', 'blockquote'):
-            self.cur = DocNode('paragraph', self.cur)
+            self.cur = self._new_node('paragraph', self.cur)
 
         text = groups.get('text', "")
+        offset = self.offset + match.start('text')
 
         if groups.get('space') and self.cur.children:
             # use wikipedia style line breaks and seperate a new line with one space
             text = " " + text
+            offset -= 1  # the space stands for the line break
 
-        self.parse_inline(text)
+        self.parse_inline(text, offset)
 
         if groups.get('break') and self.cur.kind in ('paragraph',
                                                      'emphasis', 'strong', 'pre_inline'):
-            self.last_text_break = DocNode('break', self.cur, "")
+            first = len(self.untracked)
+            self.last_text_break = self._new_node('break', self.cur, "")
+            self._set_spans(
+                first, self.offset + match.start('break'), self.offset + match.end('break')
+            )
 
-        self.text = None
+        self._close_text()
     _break_repl = _text_repl
-    _space_repl = _text_repl
 
-    def _url_repl(self, groups):
+    def _url_repl(self, match):
         """Handle raw urls in text."""
-        if not groups.get('escaped_url'):
+        if not match['escaped_url']:
             # this url is NOT escaped
-            target = groups.get('url_target', "")
-            node = DocNode('link', self.cur)
+            target = match['url_target']
+            node = self._new_node('link', self.cur)
             node.content = target
-            DocNode('text', node, node.content)
-            self.text = None
+            self._new_node('text', node, node.content)
+            self._close_text()
         else:
             # this url is escaped, we render it as text
-            if self.text is None:
-                self.text = DocNode('text', self.cur, "")
-            self.text.content += groups.get('url_target')
-    _url_target_repl = _url_repl
-    _url_proto_repl = _url_repl
-    _escaped_url_repl = _url_repl
-
-    def _link_repl(self, groups):
+            self._add_text(match['url_target'])
+
+    def _link_repl(self, match):
         """Handle all kinds of links."""
-        target = groups.get('link_target', "")
-        text = (groups.get('link_text', "") or "").strip()
+        target = match['link_target']
+        raw_text = match['link_text'] or ""
+        text = raw_text.strip()
+        offset = self.offset + match.start('link_text') + len(raw_text) - len(raw_text.lstrip())
         parent = self.cur
-        self.cur = DocNode('link', self.cur)
+        self.cur = self._new_node('link', self.cur)
         self.cur.content = target
-        self.text = None
-        re.sub(self.link_re, self._replace, text)
+        self._close_text()
+        self._scan(self.link_re, text, offset)
         self.cur = parent
-        self.text = None
-    _link_target_repl = _link_repl
-    _link_text_repl = _link_repl
+        self._close_text()
 
     # --------------------------------------------------------------------------
 
-    def _add_macro(self, groups, macro_type, name_key, args_key, text_key=None):
+    def _add_macro(self, match, macro_type, name_key, args_key, text_key=None):
         """
         generic method to handle the macro, used for all variants:
         inline, inline-tag, block
         """
-        # self.debug_groups(groups)
+        # self.debug_groups(match.groupdict())
         assert macro_type in ("macro_inline", "macro_block")
 
         if text_key:
-            macro_text = groups.get(text_key, "").strip()
+            macro_text = match[text_key].strip()
         else:
             macro_text = None
 
-        node = DocNode(macro_type, self.cur, macro_text)
-        macro_name = groups[name_key]
+        node = self._new_node(macro_type, self.cur, macro_text)
+        macro_name = match[name_key]
         node.macro_name = macro_name
         self.root.used_macros.add(macro_name)
-        node.macro_args = groups.get(args_key, "").strip()
+        node.macro_args = match[args_key].strip()
 
-        self.text = None
+        self._close_text()
 
-    def _macro_block_repl(self, groups):
+    def _macro_block_repl(self, match):
         """
         block macro, e.g:
         <<macro args="foo">>
@@ -206,65 +284,62 @@ class CreoleParser:
         self._upto_block()
         self.cur = self.root
         self._add_macro(
-            groups,
+            match,
             macro_type="macro_block",
             name_key="macro_block_start",
             args_key="macro_block_args",
             text_key="macro_block_text",
         )
-    _macro_block_start_repl = _macro_block_repl
-    _macro_block_args_repl = _macro_block_repl
-    _macro_block_text_repl = _macro_block_repl
 
-    def _macro_tag_repl(self, groups):
+    def _macro_tag_repl(self, match):
         """
         A single macro tag, e.g.: <<macro-a foo="bar">> or <<macro />>
         """
         self._add_macro(
-            groups,
+            match,
             macro_type="macro_inline",
             name_key="macro_tag_name",
             args_key="macro_tag_args",
             text_key=None,
         )
-    _macro_tag_name_repl = _macro_tag_repl
-    _macro_tag_args_repl = _macro_tag_repl
 
-    def _macro_inline_repl(self, groups):
+    def _macro_inline_repl(self, match):
         """
         inline macro tag with data, e.g.: <<macro>>text<</macro>>
         """
         self._add_macro(
-            groups,
+            match,
             macro_type="macro_inline",
             name_key="macro_inline_start",
             args_key="macro_inline_args",
             text_key="macro_inline_text",
         )
-    _macro_inline_start_repl = _macro_inline_repl
-    _macro_inline_args_repl = _macro_inline_repl
-    _macro_inline_text_repl = _macro_inline_repl
 
     # --------------------------------------------------------------------------
 
-    def _image_repl(self, groups):
+    def _image_repl(self, match):
         """Handles images and attachemnts included in the page."""
-        target = groups.get('image_target', "").strip()
-        text = (groups.get('image_text', "") or "").strip()
-        node = DocNode("image", self.cur, target)
-        DocNode('text', node, text or node.content)
-        self.text = None
-    _image_target_repl = _image_repl
-    _image_text_repl = _image_repl
+        target = match['image_target'].strip()
+        text = (match['image_text'] or "").strip()
+        node = self._new_node("image", self.cur, target)
+        self._new_node('text', node, text or node.content)
+        self._close_text()
 
-    def _separator_repl(self, groups):
+    def _separator_repl(self, match):
         self._upto_block()
-        DocNode('separator', self.cur)
+        self._new_node('separator', self.cur)
 
-    def _item_repl(self, groups):
+    def _item_repl(self, match):
         """ List item """
-        bullet = groups.get('item_head', "")
-        text = groups.get('item_text', "")
+        first = len(self.untracked)
+        self._new_list_item(match['item_head'])
+        # The match contains the leading white space and line breaks:
+        self._set_spans(first, self.offset + match.start('item'), self.offset + match.end('item'))
+        self.parse_inline(match['item_text'], self.offset + match.start('item_text'))
+        self._close_text()
+
+    def _new_list_item(self, bullet):
+        """ Add a list item and, if needed, a new list for it """
         if bullet[-1] == '#':
             kind = 'number_list'
         else:
@@ -287,180 +362,293 @@ class CreoleParser:
             # Create a new level of list
             self.cur = self._upto(self.cur,
                                   ('list_item', 'document', 'section', 'blockquote'))
-            self.cur = DocNode(kind, self.cur)
+            self.cur = self._new_node(kind, self.cur)
             self.cur.level = level
-        self.cur = DocNode('list_item', self.cur)
+        self.cur = self._new_node('list_item', self.cur)
         self.cur.level = level + 1
-        self.parse_inline(text)
-        self.text = None
-    _item_text_repl = _item_repl
-    _item_head_repl = _item_repl
 
-    def _list_repl(self, groups):
+    def _list_repl(self, match):
         """ complete list """
-        self.item_re.sub(self._replace, groups["list"])
+        self._scan(self.item_re, match["list"], self.offset + match.start("list"))
 
-    def _head_repl(self, groups):
+    def _head_repl(self, match):
         self._upto_block()
-        node = DocNode('header', self.cur, groups['head_text'].strip())
-        node.level = len(groups['head_head'])
-        self.text = None
-    _head_head_repl = _head_repl
-    _head_text_repl = _head_repl
-
-    def _table_repl(self, groups):
-        row = groups.get('table', '|').strip()
-        self.cur = self._upto(self.cur, (
-            'table', 'document', 'section', 'blockquote'))
-        if self.cur.kind != 'table':
-            self.cur = DocNode('table', self.cur)
-        tb = self.cur
-        tr = DocNode('table_row', tb)
+        node = self._new_node('header', self.cur, match['head_text'].strip())
+        node.level = len(match['head_head'])
+        self.root.headlines.append(node)
+        self._close_text()
+
+    def _table_repl(self, match):
+        raw_row = match['table']
+        row = raw_row.strip()
+        row_offset = self.offset + match.start('table') + len(raw_row) - len(raw_row.lstrip())
+        first = len(self.untracked)
+        tr = self._new_table_row()
+        tb = tr.parent
+        # The match contains the leading white space and line breaks:
+        self._set_spans(first, row_offset, row_offset + len(row))
 
         for m in self.cell_re.finditer(row):
-            cell = m.group('cell')
-            if cell:
-                text = cell.strip()
-                self.cur = DocNode('table_cell', tr)
-                self.text = None
-            else:
-                text = m.group('head').strip('= ')
-                self.cur = DocNode('table_head', tr)
-                self.text = DocNode('text', self.cur, "")
-            self.parse_inline(text)
+            self._close_text()
+            first = len(self.untracked)
+            text, offset = self._new_table_cell(m, tr)
+            # The new cell spans only the cell, not the complete row:
+            self._set_spans(first, row_offset + m.start(), row_offset + m.end())
+            if self.track_spans and self.text is not None:
+                # The text node of a table head, extended by the inline matches
+                self.text.start = self.text.end = row_offset + offset
+            self.parse_inline(text, row_offset + offset)
 
         self.cur = tb
-        self.text = None
+        self._close_text()
 
-    def _pre_block_repl(self, groups):
+    def _new_table_row(self):
+        """ Add a table row and, if needed, a new table. Returns the row """
+        self.cur = self._upto(self.cur, (
+            'table', 'document', 'section', 'blockquote'))
+        if self.cur.kind != 'table':
+            self.cur = self._new_node('table', self.cur)
+        return self._new_node('table_row', self.cur)
+
+    def _new_table_cell(self, match, tr):
+        """
+        Add the cell of the cell_re match to the row.
+        Returns its text and the offset of the text in the row.
+        """
+        cell = match.group('cell')
+        if cell:
+            self.cur = self._new_node('table_cell', tr)
+            return cell.strip(), match.start('cell') + len(cell) - len(cell.lstrip())
+
+        head = match.group('head')
+        offset = match.start('head') + len(head) - len(head.lstrip('= '))
+        self.cur = self._new_node('table_head', tr)
+        self.text = self._new_node('text', self.cur, "")
+        return head.strip('= '), offset
+
+    def _pre_block_repl(self, match):
         self._upto_block()
-        kind = groups.get('pre_block_kind', None)
-        text = groups.get('pre_block_text', "")
+        kind = match['pre_block_kind']
+        text = match['pre_block_text']
 
         def remove_tilde(m):
             return m.group('indent') + m.group('rest')
         text = self.pre_escape_re.sub(remove_tilde, text)
-        node = DocNode('pre_block', self.cur, text)
+        node = self._new_node('pre_block', self.cur, text)
         node.sect = kind or ''
-        self.text = None
-    _pre_block_text_repl = _pre_block_repl
-    _pre_block_head_repl = _pre_block_repl
-    _pre_block_kind_repl = _pre_block_repl
+        self._close_text()
 
-    def _line_repl(self, groups):
+    def _line_repl(self, match):
         """ Transfer newline from the original markup into the html code """
         self._upto_block()
-        DocNode('line', self.cur, "")
+        self._new_node('line', self.cur, "")
 
-    def _pre_inline_repl(self, groups):
-        text = groups.get('pre_inline_text', "")
-        DocNode('pre_inline', self.cur, text)
-        self.text = None
-    _pre_inline_text_repl = _pre_inline_repl
-    _pre_inline_head_repl = _pre_inline_repl
+    def _pre_inline_repl(self, match):
+        text = match['pre_inline_text']
+        self._new_node('pre_inline', self.cur, text)
+        self._close_text()
 
     # --------------------------------------------------------------------------
 
-    def _inline_mark(self, groups, key):
-        self.cur = DocNode(key, self.cur)
+    def _inline_mark(self, match, key):
+        self.cur = self._new_node(key, self.cur)
 
-        self.text = None
-        text = groups[f"{key}_text"]
-        self.parse_inline(text)
+        self._close_text()
+        text_key = f"{key}_text"
+        self.parse_inline(match[text_key], self.offset + match.start(text_key))
 
         self.cur = self._upto(self.cur, (key,)).parent
-        self.text = None
+        self._close_text()
 
     # TODO: How can we generalize that:
 
-    def _emphasis_repl(self, groups):
-        self._inline_mark(groups, key='emphasis')
-    _emphasis_text_repl = _emphasis_repl
+    def _emphasis_repl(self, match):
+        self._inline_mark(match, key='emphasis')
 
-    def _strong_repl(self, groups):
-        self._inline_mark(groups, key='strong')
-    _strong_text_repl = _strong_repl
+    def _strong_repl(self, match):
+        self._inline_mark(match, key='strong')
 
-    def _monospace_repl(self, groups):
-        self._inline_mark(groups, key='monospace')
-    _monospace_text_repl = _monospace_repl
+    def _monospace_repl(self, match):
+        self._inline_mark(match, key='monospace')
 
-    def _superscript_repl(self, groups):
-        self._inline_mark(groups, key='superscript')
-    _superscript_text_repl = _superscript_repl
+    def _superscript_repl(self, match):
+        self._inline_mark(match, key='superscript')
 
-    def _subscript_repl(self, groups):
-        self._inline_mark(groups, key='subscript')
-    _subscript_text_repl = _subscript_repl
+    def _subscript_repl(self, match):
+        self._inline_mark(match, key='subscript')
 
-    def _underline_repl(self, groups):
-        self._inline_mark(groups, key='underline')
-    _underline_text_repl = _underline_repl
+    def _underline_repl(self, match):
+        self._inline_mark(match, key='underline')
 
-    def _small_repl(self, groups):
-        self._inline_mark(groups, key='small')
-    _small_text_repl = _small_repl
+    def _small_repl(self, match):
+        self._inline_mark(match, key='small')
 
-    def _delete_repl(self, groups):
-        self._inline_mark(groups, key='delete')
-    _delete_text_repl = _delete_repl
+    def _delete_repl(self, match):
+        self._inline_mark(match, key='delete')
 
     # --------------------------------------------------------------------------
 
-    def _linebreak_repl(self, groups):
-        DocNode('break', self.cur, None)
-        self.text = None
+    def _linebreak_repl(self, match):
+        self._new_node('break', self.cur, None)
+        self._close_text()
 
-    def _escape_repl(self, groups):
-        if self.text is None:
-            self.text = DocNode('text', self.cur, "")
-        self.text.content += groups.get('escaped_char', "")
-    _escaped_char_repl = _escape_repl
+    def _escape_repl(self, match):
+        self._add_text(match['escaped_char'])
 
-    def _char_repl(self, groups):
+    def _char_repl(self, match):
+        """ A run of plain text characters (see InlineRules.char) """
+        self._add_text(match.group())
+
+    def _add_text(self, text):
+        """
+        Add text to the current text node. The parts are only collected
+        here and joined once in _close_text(): Adding them one by one to
+        the node content would copy the whole content again and again.
+        """
         if self.text is None:
-            self.text = DocNode('text', self.cur, "")
-        self.text.content += groups.get('char', "")
+            self.text = self._new_node('text', self.cur, "")
+        self.text_parts.append(text)
+
+    def _close_text(self):
+        """ Set the content of the current text node and start a new one. """
+        if self.text_parts:
+            self.text.content = "".join(self.text_parts)
+            self.text_parts.clear()
+        self.text = None
 
     # --------------------------------------------------------------------------
 
     def _replace(self, match):
-        """Invoke appropriate _*_repl method. Called for every matched group."""
-
-        def debug(groups):
+        """Invoke appropriate _*_repl method. Called for every match."""
+        name = match.lastgroup
+        if self.debug and name != "char":
+            # TODO: use logging
             data = dict([
-                group for group in groups.items() if group[1] is not None
+                group for group in match.groupdict().items() if group[1] is not None
             ])
+            from pprint import pformat
             print(pformat(data))
 
-        groups = match.groupdict()
-        for name, text in groups.items():
-            if text is not None:
-                if self.debug and name != "char":
-                    # TODO: use logging
-                    debug(groups)
-                replace_method = getattr(self, f'_{name}_repl')
-                replace_method(groups)
-                return
-
-    def parse_inline(self, raw):
+        if self.track_spans:
+            self._replace_tracked(name, match)
+        else:
+            self._repl_methods[name](self, match)
+
+    def _replace_tracked(self, name, match):
+        """
+        Invoke the _*_repl method and set the span of all nodes created
+        for this match (Nodes created by nested matches have already their
+        own span)
+        """
+        start = self.offset + match.start()
+        end = self.offset + match.end()
+        untracked = self.untracked
+        first = len(untracked)
+        text = self.text
+
+        self._repl_methods[name](self, match)
+
+        for node in untracked[first:]:
+            if node.start is None:
+                node.start = start
+                node.end = end
+        del untracked[first:]
+
+        if text is not None and text is self.text:
+            # The match was added to the current text node
+            if text.start is None:
+                text.start = start
+            text.end = end
+
+    def _scan(self, regex, raw, offset=0):
+        """
+        Call the _*_repl method for every match of the given regex.
+        Text between the matches is ignored (like re.sub() would do it,
+        but without building a new string)
+        offset is the position of raw in the complete text.
+        """
+        outer_offset = self.offset
+        self.offset = offset
+        replace = self._replace
+        for match in regex.finditer(raw):
+            replace(match)
+        self.offset = outer_offset
+
+    def parse_inline(self, raw, offset=0):
         """Recognize inline elements inside blocks."""
-        re.sub(self.inline_re, self._replace, raw)
+        self._scan(self.inline_re, raw, offset)
 
     def parse_block(self, raw):
         """Recognize block elements."""
-        re.sub(self.block_re, self._replace, raw)
+        self._scan(self.block_re, raw)
 
-    def parse(self):
-        """Parse the text given as self.raw and return DOM tree."""
-        # convert all lineendings to \n
+    def get_text(self):
+        """ Returns self.raw with all line endings converted to \\n """
         text = self.raw.replace("\r\n", "\n").replace("\r", "\n")
         if self.debug:
             # TODO: use logging
             print(repr(text))
+        if self.track_spans:
+            self.root.start = 0
+            self.root.end = len(text)
+        return text
+
+    def parse(self):
+        """Parse the text given as self.raw and return DOM tree."""
+        text = self.get_text()
         self.parse_block(text)
+        self._close_text()
+        if self.track_spans:
+            self.finish_spans(self.root)
+        return self.root
+
+    def parse_matches(self, matches):
+        """
+        Build the DOM tree from the given block_re matches.
+        Used to parse only a part of a text, see IncrementalCreole2HtmlConverter
+        """
+        replace = self._replace
+        for match in matches:
+            replace(match)
+        self._close_text()
+        if self.track_spans:
+            self.finish_spans(self.root)
         return self.root
 
+    def close_block(self):
+        """
+        Finish the current top-level block, like the next
+        block element would do it (e.g.: remove unused end line breaks)
+        """
+        self._upto_block()
+
+    def iter_blocks(self):
+        """
+        Parse the text given as self.raw and yield the top-level nodes of the
+        DOM tree one by one, as soon as they are complete.
+        The yielded nodes are removed from the children of the root node.
+
+        A top-level node is complete if the next one was started: The parser
+        only adds new nodes to the last top-level node.
+        """
+        text = self.get_text()
+        replace = self._replace
+        # The real list, that the parser appends to:
+        root_children = self.root.children = list(self.root.children)
+        for match in self.block_re.finditer(text):
+            replace(match)
+            while len(root_children) > 1:
+                yield self._finish_block(root_children.pop(0))
+
+        self._close_text()
+        while root_children:
+            yield self._finish_block(root_children.pop(0))
+
+    def _finish_block(self, node):
+        if self.track_spans:
+            self.finish_spans(node)
+        return node
+
     # --------------------------------------------------------------------------
 
     def debug_tree(self, start_node=None):
@@ -7,6 +7,7 @@
 """
 
 
+import functools
 import re
 
 
@@ -91,12 +92,66 @@ class InlineRules:
 
     linebreak = r'(?P<linebreak> \\\\ )'
     escape = r'(?P<escape> ~ (?P<escaped_char>\S) )'
-    char = r'(?P<char> . )'
+
+    # Plain text: Consume a whole run of characters that can't start any of
+    # the rules above (or whitespace, after that a url may start) in one match.
+    # Only the remaining single characters fall back to "." one by one.
+    char = r'(?P<char> [^\s\[{<*/\#^,_~\\-]+ | [^\S\n]+ | . )'
+
+
+@functools.lru_cache(maxsize=32)
+def compile_rules(rules, flags):
+    """
+    Merge the given rules (must be a tuple) into one compiled regex.
+    The result is cached, so every rule variant would be only compiled once.
+
+    >>> block_rules = BlockRules()
+    >>> block_re = compile_rules(tuple(block_rules.rules), block_rules.re_flags)
+    >>> block_re is BlockRules().compile()
+    True
+    >>> block_re is BlockRules(blog_line_breaks=False).compile()
+    False
+    """
+    return re.compile('|'.join(rules), flags)
+
+
+class LazyRules:
+    """
+    A class attribute with the compiled rules, that would be compiled on
+    first access and not at import time. After the first access the
+    attribute is replaced with the compiled regex.
+
+    >>> class Example:
+    ...     foo_re = LazyRules(("foo", "bar"), re.UNICODE)
+    >>> isinstance(Example.__dict__["foo_re"], LazyRules)
+    True
+    >>> Example.foo_re.findall("foo bar")
+    ['foo', 'bar']
+    >>> isinstance(Example.__dict__["foo_re"], LazyRules)
+    False
+    """
+
+    def __init__(self, rules, flags):
+        self.rules = tuple(rules)
+        self.flags = flags
+
+    def __set_name__(self, owner, name):
+        self.owner = owner
+        self.name = name
+
+    def __get__(self, instance, owner):
+        regex = compile_rules(self.rules, self.flags)
+        setattr(self.owner, self.name, regex)
+        return regex
 
 
 class BlockRules:
     """
     All used block rules.
+
+    A BlockRules instance is the configuration for the CreoleParser and
+    can be reused for any number of documents. The merged regex is compiled
+    only once per rule set, see compile_rules()
     """
 #    macro_block = r'''(?P<macro_block>
 #            \s* << (?P<macro_block_start>\w+) \s* (?P<macro_block_args>.*?) >>
@@ -165,6 +220,10 @@ class BlockRules:
             self.table, self.text,
         )
 
+    def compile(self):
+        """ Returns the (cached) regex of all block rules """
+        return compile_rules(tuple(self.rules), self.re_flags)
+
 
 class SpecialRules:
     """
@@ -17,24 +17,113 @@ from creole.shared.document_tree import DebugList, DocNode
 
 # ------------------------------------------------------------------------------
 
-block_re = re.compile(r'''
+# "<pre>" and "</pre>", see: cut_pre_areas()
+pre_tag_re = re.compile(r"<(/?)pre>")
+
+# A <pre> block: "<pre>" and "</pre>" on their own lines, see: cut_pre_areas()
+pre_block_start_re = re.compile(r'''
     ^<pre> \s* $
-    (?P<pre_block>
-        (\n|.)*?
-    )
+''', re.VERBOSE | re.UNICODE | re.MULTILINE)
+
+pre_block_end_re = re.compile(r'''
     ^</pre> \s* $
     [\s\n]*
 ''', re.VERBOSE | re.UNICODE | re.MULTILINE)
 
-inline_re = re.compile(r'''
-    <pre>
-    (?P<pre_inline>
-        (\n|.)*?
-    )
-    </pre>
-''', re.VERBOSE | re.UNICODE)
+
+def iter_pre_areas(data):
+    """
+    Yields (cut_start, cut_end, content_start, content_end, is_block) for
+    all <pre> areas in data, in one left to right scan over the "<pre>"
+    and "</pre>" tags.
+
+    A block has "<pre>" and "</pre>" on their own lines, the whitespace
+    after the block belongs to it. Other areas are inline: from "<pre>"
+    to the next "</pre>", if there is no block between them.
+
+    >>> data = "<p>a <pre>inline</pre></p>\\n<pre>\\nblock\\n</pre>\\n\\n<p>b</p>"
+    >>> for cut_start, cut_end, start, end, is_block in iter_pre_areas(data):
+    ...     print(repr(data[cut_start:cut_end]), repr(data[start:end]), is_block)
+    '<pre>inline</pre>' 'inline' False
+    '<pre>\\nblock\\n</pre>\\n\\n' '\\nblock\\n' True
+
+    If a block is not closed, no later one can be closed either. The
+    tags from its "<pre>" on are inline areas then:
+
+    >>> data = "<pre>\\ntext <pre>x</pre>"
+    >>> [data[start:end] for _, _, start, end, _ in iter_pre_areas(data)]
+    ['\\ntext <pre>x']
+    """
+    block_start = None  # The pre_block_start_re match of the open block
+    inline_start = None  # The position of the open inline "<pre>"
+    block_tags = []  # All tags after the block_start
+    for tag in pre_tag_re.finditer(data):
+        is_end_tag = tag.group(1)
+        if block_start is not None:
+            if is_end_tag:
+                block_end = pre_block_end_re.match(data, tag.start())
+                if block_end is not None:
+                    yield block_start.start(), block_end.end(), block_start.end(), tag.start(), True
+                    block_start = None
+                    block_tags.clear()
+                    # A block ends the open inline area, its "<pre>" stays as it is
+                    inline_start = None
+                    continue
+            block_tags.append(tag)
+        elif is_end_tag:
+            if inline_start is not None:
+                yield inline_start, tag.end(), inline_start + 5, tag.start(), False
+                inline_start = None
+        else:
+            block_start = pre_block_start_re.match(data, tag.start())
+            if block_start is None and inline_start is None:
+                inline_start = tag.start()
+
+    if block_start is not None:
+        # Not closed: Take the tags seen since then as inline tags
+        if inline_start is None:
+            inline_start = block_start.start()
+        for tag in block_tags:
+            if tag.group(1):
+                if inline_start is not None:
+                    yield inline_start, tag.end(), inline_start + 5, tag.start(), False
+                    inline_start = None
+            elif inline_start is None:
+                inline_start = tag.start()
+
+
+def cut_pre_areas(data, cut_block, cut_inline):
+    """
+    Replace the <pre> areas with the return value of cut_block(start, end)
+    or cut_inline(start, end), e.g. a placeholder tag. start and end are
+    the offsets of the area content in data, see: iter_pre_areas()
+
+    >>> data = "<p>a <pre>inline</pre></p>\\n<pre>\\nblock\\n</pre>\\n\\n<p>b</p>"
+    >>> cut_pre_areas(
+    ...     data,
+    ...     cut_block=lambda start, end: f"[block {data[start:end]!r}]",
+    ...     cut_inline=lambda start, end: f"[inline {data[start:end]!r}]",
+    ... )
+    "<p>a [inline 'inline']</p>\\n[block '\\\\nblock\\\\n']<p>b</p>"
+    """
+    parts = []
+    pos = 0
+    for cut_start, cut_end, start, end, is_block in iter_pre_areas(data):
+        parts.append(data[pos:cut_start])
+        if is_block:
+            parts.append(cut_block(start, end))
+        else:
+            parts.append(cut_inline(start, end))
+        pos = cut_end
+    if not parts:
+        return data
+    parts.append(data[pos:])
+    return "".join(parts)
 
 
+# The placeholders of the <pre> areas, see: HtmlParser._feed_pre_areas()
+placeholder_re = re.compile(r"<(blockdata|inlinedata) />")
+
 headline_tag_re = re.compile(r"h(\d)", re.UNICODE)
 
 # ------------------------------------------------------------------------------
@@ -70,6 +159,21 @@ class HtmlParser(HTMLParser):
             data: "var foo='<em>BAR</em>';"
         data: ' html2'
     ********************************************************************************
+
+    >>> p = HtmlParser()
+    >>> p.feed("<p>a &amp<pre>x</pre> b</p>\\n<pre>\\nblock\\n</pre>")
+    <DocNode document: None>
+    >>> p.debug()
+    ________________________________________________________________________________
+      document tree:
+    ================================================================================
+    p
+        data: 'a '
+        entityref: 'amp'
+        inlinedata_pre: 'x'
+        data: ' b'
+    blockdata_pre: '\\nblock\\n'
+    ********************************************************************************
     """
     # placeholder html tag for pre cutout areas:
     _block_placeholder = "blockdata"
@@ -88,51 +192,62 @@ class HtmlParser(HTMLParser):
             self.result = []
 
         self.blockdata = []
+        self._pre_data = ""  # The data with the <pre> areas, see: _add_pre_area()
 
         self.root = DocNode("document", None)
         self.cur = self.root
 
         self.__list_level = 0
 
-    def _pre_cut(self, data, type, placeholder):
+    def _pre_cut(self, start, end, placeholder):
         # TODO: Check if we have a code block, e.g.: "<pre><code>...</code></pre>"
         if self.debugging:
-            print(f"append blockdata: {data!r}")
-        assert isinstance(data, str), "blockdata is not unicode"
-        self.blockdata.append(data)
-        id = len(self.blockdata) - 1
-        return f'<{placeholder} type="{type}" id="{id}" />'
+            print(f"append blockdata: {self._pre_data[start:end]!r}")
+        # Only the offsets in self._pre_data, see: _add_pre_area()
+        self.blockdata.append((start, end))
+        return f"<{placeholder} />"
 
-    def _pre_pre_inline_cut(self, groups):
-        return self._pre_cut(groups["pre_inline"], "pre", self._inline_placeholder)
+    def _pre_block_cut(self, start, end):
+        return self._pre_cut(start, end, self._block_placeholder)
 
-    def _pre_pre_block_cut(self, groups):
-        return self._pre_cut(groups["pre_block"], "pre", self._block_placeholder)
+    def _pre_inline_cut(self, start, end):
+        return self._pre_cut(start, end, self._inline_placeholder)
 
-    def _pre_pass_block_cut(self, groups):
-        content = groups["pass_block"].strip()
-        return self._pre_cut(content, "pass", self._block_placeholder)
+    def _add_pre_area(self, placeholder, id):
+        start, end = self.blockdata[id]
+        DocNode(f"{placeholder}_pre", self.cur, content=self._pre_data[start:end])
 
-    _pre_pass_block_start_cut = _pre_pass_block_cut
-
-    def _pre_cut_out(self, match):
-        groups = match.groupdict()
-        for name, text in groups.items():
-            if text is not None:
-                if self.debugging:
-                    print(f"{name:>15}: {text!r} ({match.group(0)!r})")
-                method = getattr(self, f'_pre_{name}_cut')
-                return method(groups)
+    def _feed_pre_areas(self, data, id):
+        """
+        Feed the data and add the <pre> areas at their placeholders.
+        id is the index in self.blockdata of the first placeholder.
 
-#        data = match.group("data")
+        The placeholders are only needed for strip_html(). The areas are
+        added directly, unless the HTMLParser waits for more data at
+        that point, e.g. for the end of "&amp" or of a <script> tag.
+        Then it gets a placeholder tag, see: handle_startendtag()
+        """
+        pos = 0
+        for match in placeholder_re.finditer(data):
+            HTMLParser.feed(self, data[pos:match.start()])
+            placeholder = match.group(1)
+            if self.rawdata or self.cdata_elem:
+                HTMLParser.feed(self, f'<{placeholder} type="pre" id="{id}" />')
+            else:
+                self.debug_msg("pre area", placeholder)
+                self._add_pre_area(placeholder, id)
+            id += 1
+            pos = match.end()
+        HTMLParser.feed(self, data[pos:])
 
     def feed(self, raw_data, preprocess=True) -> DocNode:
         assert isinstance(raw_data, str), "feed data must be unicode!"
         data = raw_data.strip()
         if preprocess:
-            # cut out <pre> and <tt> areas block tag areas
-            data = block_re.sub(self._pre_cut_out, data)
-            data = inline_re.sub(self._pre_cut_out, data)
+            # cut out <pre> areas
+            first_id = len(self.blockdata)
+            self._pre_data = data
+            data = cut_pre_areas(data, self._pre_block_cut, self._pre_inline_cut)
 
             # Delete whitespace from html code
             data = strip_html(data)
@@ -147,6 +262,10 @@ class HtmlParser(HTMLParser):
                 print("-" * 79)
                 # print(data.replace(">", ">\n"))
                 # print("-"*79)
+
+            self._feed_pre_areas(data, first_id)
+            return self.root
+
         elif self.debugging:
             print("_" * 79)
             print("data:")
@@ -221,14 +340,8 @@ class HtmlParser(HTMLParser):
         self.debug_msg("startendtag", f"{tag!r} atts: {attrs}")
         attr_dict = dict(attrs)
         if tag in (self._block_placeholder, self._inline_placeholder):
-            id = int(attr_dict["id"])
-#            block_type = attr_dict["type"]
-            DocNode(
-                f"{tag}_{attr_dict['type']}",
-                self.cur,
-                content=self.blockdata[id],
-                #                attrs = attr_dict
-            )
+            # A placeholder from _feed_pre_areas()
+            self._add_pre_area(tag, int(attr_dict["id"]))
         else:
             DocNode(tag, self.cur, None, attrs)
 
@@ -0,0 +1,299 @@
+"""
+    python-creole conversion server
+    ~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~
+
+    A long-running HTTP server that converts the POSTed document, so other
+    services don't have to start a new interpreter for every conversion:
+
+        $ creole-serve --port 8000 --workers 4
+        $ curl --data-binary "**bold**" http://127.0.0.1:8000/creole2html
+        <p><strong>bold</strong></p>
+
+    Or listen on a Unix socket:
+
+        $ creole-serve --unix-socket /tmp/creole.sock
+        $ curl --unix-socket /tmp/creole.sock --data-binary "**bold**" http://localhost/creole2html
+
+    The connections are persistent (HTTP/1.1 keep-alive) and pipelined
+    requests are answered in order. GET /metrics returns the number of
+    requests, requests per second and a latency histogram as JSON.
+
+    :copyleft: 2026 by python-creole team, see AUTHORS for more details.
+    :license: GNU GPL v3 or above, see LICENSE for more details.
+"""
+
+
+import errno
+import functools
+import json
+import os
+import socket
+import socketserver
+import stat
+import threading
+import time
+from concurrent.futures import ProcessPoolExecutor
+from http import HTTPStatus
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+from creole import VERSION_STRING
+from creole.batch import DIRECTIONS, get_converter
+
+
+MAX_CONTENT_LENGTH = 10 * 1024 * 1024
+
+# Upper bounds of the latency histogram buckets in seconds:
+LATENCY_BUCKETS = (0.001, 0.0025, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1, 2.5, 5, 10)
+
+CONTENT_TYPES = {
+    "creole2html": "text/html",
+}
+
+
+@functools.lru_cache(maxsize=None)
+def get_warm_converter(direction):
+    """ Returns the converter for the direction, created once per process """
+    return get_converter(direction)
+
+
+def convert(direction, document):
+    """
+    >>> convert("creole2html", "**bold**")
+    '<p><strong>bold</strong></p>'
+    """
+    return get_warm_converter(direction)(document)
+
+
+class Metrics:
+    """
+    Thread-safe request counter and latency histogram
+
+    >>> metrics = Metrics()
+    >>> metrics.add("creole2html", 0.003)
+    >>> metrics.add("creole2html", 20, error=True)
+    >>> data = metrics.as_dict()
+    >>> data["requests"], data["errors"], data["directions"]
+    (2, 1, {'creole2html': 2})
+    >>> data["latency_histogram"]["0.005"], data["latency_histogram"]["+Inf"]
+    (1, 1)
+    """
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self.start_time = time.monotonic()
+        self.requests = 0
+        self.errors = 0
+        self.directions = {}
+        self.latency_counts = [0] * (len(LATENCY_BUCKETS) + 1)
+        self.latency_sum = 0
+
+    def add(self, direction, seconds, error=False):
+        bucket = len(LATENCY_BUCKETS)
+        for index, upper_bound in enumerate(LATENCY_BUCKETS):
+            if seconds <= upper_bound:
+                bucket = index
+                break
+
+        with self._lock:
+            self.requests += 1
+            if error:
+                self.errors += 1
+            self.directions[direction] = self.directions.get(direction, 0) + 1
+            self.latency_counts[bucket] += 1
+            self.latency_sum += seconds
+
+    def as_dict(self):
+        with self._lock:
+            uptime = time.monotonic() - self.start_time
+            histogram = {
+                str(upper_bound): count
+                for upper_bound, count in zip(LATENCY_BUCKETS, self.latency_counts)
+            }
+            histogram["+Inf"] = self.latency_counts[-1]
+            return {
+                "python_creole": VERSION_STRING,
+                "uptime": uptime,
+                "requests": self.requests,
+                "errors": self.errors,
+                "requests_per_second": self.requests / uptime if uptime else 0,
+                "average_latency": self.latency_sum / self.requests if self.requests else 0,
+                "directions": dict(self.directions),
+                "latency_histogram": histogram,
+            }
+
+
+class ConversionRequestHandler(BaseHTTPRequestHandler):
+    """
+    POST /<direction> converts the request body (utf-8)
+    GET /metrics returns the metrics as JSON
+    """
+    protocol_version = "HTTP/1.1"  # keep-alive and pipelining
+    server_version = f"python-creole/{VERSION_STRING}"
+
+    def send_content(self, status, content, content_type="text/plain"):
+        body = content.encode("utf-8")
+        self.send_response(status)
+        self.send_header("Content-Type", f"{content_type}; charset=utf-8")
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def do_GET(self):
+        if self.path == "/metrics":
+            self.send_content(
+                HTTPStatus.OK,
+                json.dumps(self.server.metrics.as_dict(), indent=4),
+                "application/json",
+            )
+        else:
+            self.send_content(
+                HTTPStatus.NOT_FOUND, f"Use: GET /metrics or POST /{{{'|'.join(DIRECTIONS)}}}"
+            )
+
+    def do_POST(self):
+        start_time = time.monotonic()
+        direction = self.path.strip("/")
+        try:
+            length = int(self.headers.get("Content-Length", ""))
+        except ValueError:
+            self.send_content(HTTPStatus.LENGTH_REQUIRED, "Content-Length header missing")
+            self.close_connection = True
+            return
+        if length < 0:
+            # rfile.read(-1) would wait for the end of the connection
+            self.send_content(HTTPStatus.BAD_REQUEST, "Negative Content-Length")
+            self.close_connection = True
+            return
+        if length > MAX_CONTENT_LENGTH:
+            self.send_content(
+                HTTPStatus.REQUEST_ENTITY_TOO_LARGE, f"Max. {MAX_CONTENT_LENGTH} bytes"
+            )
+            self.close_connection = True
+            return
+
+        body = self.rfile.read(length)
+        if direction not in DIRECTIONS:
+            self.send_content(
+                HTTPStatus.NOT_FOUND, f"Unknown direction, use: {', '.join(DIRECTIONS)}"
+            )
+            return
+
+        content_type = "text/plain"
+        try:
+            document = body.decode("utf-8")
+        except UnicodeDecodeError as err:
+            status, content = HTTPStatus.BAD_REQUEST, f"{err.__class__.__name__}: {err}"
+        else:
+            try:
+                content = self.server.convert(direction, document)
+            except Exception as err:
+                status = HTTPStatus.INTERNAL_SERVER_ERROR
+                content = f"{err.__class__.__name__}: {err}"
+            else:
+                status = HTTPStatus.OK
+                content_type = CONTENT_TYPES.get(direction, content_type)
+
+        self.server.metrics.add(
+            direction, time.monotonic() - start_time, error=status != HTTPStatus.OK
+        )
+        self.send_content(status, content, content_type)
+
+    def address_string(self):
+        if isinstance(self.client_address, tuple):
+            return super().address_string()
+        return "unix-socket"  # client_address is "" for Unix sockets
+
+    def log_message(self, format, *args):
+        if self.server.verbose:
+            super().log_message(format, *args)
+
+
+class ConversionServerMixin:
+    """
+    Convert the documents in a pool of worker processes,
+    or in the request thread with workers=0
+    """
+    daemon_threads = True
+    executor = None  # if server_bind() fails, server_close() is called before init_conversion()
+
+    def init_conversion(self, workers=None, verbose=False):
+        self.metrics = Metrics()
+        self.verbose = verbose
+        if workers is None:
+            workers = os.cpu_count() or 1
+        if workers:
+            self.executor = ProcessPoolExecutor(max_workers=workers)
+        else:
+            self.executor = None
+
+    def convert(self, direction, document):
+        if self.executor is None:
+            return convert(direction, document)
+        return self.executor.submit(convert, direction, document).result()
+
+    def server_close(self):
+        super().server_close()
+        if self.executor is not None:
+            self.executor.shutdown()
+
+
+class ConversionHTTPServer(ConversionServerMixin, ThreadingHTTPServer):
+    pass
+
+
+if hasattr(socket, "AF_UNIX"):
+    class ConversionUnixServer(
+        ConversionServerMixin, socketserver.ThreadingMixIn, socketserver.UnixStreamServer
+    ):
+        socket_id = None  # (st_dev, st_ino) of the socket file created by this server
+
+        def server_bind(self):
+            try:
+                mode = os.lstat(self.server_address).st_mode
+            except FileNotFoundError:
+                pass
+            else:
+                if not stat.S_ISSOCK(mode):
+                    raise FileExistsError(f"{self.server_address!r} exists and is not a socket")
+                self.check_stale_socket()
+                os.remove(self.server_address)  # e.g. from a killed server
+            super().server_bind()
+            socket_stat = os.lstat(self.server_address)
+            self.socket_id = (socket_stat.st_dev, socket_stat.st_ino)
+
+        def check_stale_socket(self):
+            """ Raise an error, if a server is listening on the existing socket file """
+            with socket.socket(socket.AF_UNIX, socket.SOCK_STREAM) as sock:
+                try:
+                    sock.connect(self.server_address)
+                except ConnectionRefusedError:
+                    return  # Nobody is listening
+            raise OSError(
+                errno.EADDRINUSE, f"Address already in use: {self.server_address!r}"
+            )
+
+        def server_close(self):
+            super().server_close()
+            if self.socket_id is None:
+                return
+            try:
+                socket_stat = os.lstat(self.server_address)
+            except FileNotFoundError:
+                return
+            if (socket_stat.st_dev, socket_stat.st_ino) == self.socket_id:
+                os.remove(self.server_address)
+            self.socket_id = None
+
+
+def make_server(host="127.0.0.1", port=8000, unix_socket=None, workers=None, verbose=False):
+    """
+    Create the server, start it with serve_forever()
+    """
+    if unix_socket is not None:
+        if not hasattr(socket, "AF_UNIX"):
+            raise OSError(errno.EAFNOSUPPORT, "Unix sockets are not supported on this platform")
+        server = ConversionUnixServer(unix_socket, ConversionRequestHandler)
+    else:
+        server = ConversionHTTPServer((host, port), ConversionRequestHandler)
+    server.init_conversion(workers=workers, verbose=verbose)
+    return server
@@ -8,17 +8,96 @@
 """
 
 
-from creole.html_tools.deentity import Deentity
+from types import GeneratorType
+
+from creole.html_tools.deentity import deentity
 from creole.parser.html_parser_config import BLOCK_TAGS
 from creole.shared.markup_table import MarkupTable
 from creole.shared.unknown_tags import transparent_unknown_nodes
+from creole.shared.utils import DispatchTable
+
+
+def emit_tree(node, emit_node, enter_children=None):
+    """
+    Emit the given node and all of its children without recursion.
+
+    emit_node(node) returns the emitted content of a single node as string
+    or a generator. The generator yields a node to get the emitted content
+    of all its children sent back and returns the content of the node.
+    So the depth of the tree is not limited by the python call stack.
+
+    enter_children(node) will be called before the children of a node
+    would be emitted.
+
+    >>> from creole.shared.document_tree import DocNode
+    >>> def emit_node(node):
+    ...     if node.kind == "text":
+    ...         return node.content
+    ...     content = yield node
+    ...     return f"<{node.kind}>{content}</{node.kind}>"
+    >>> root = node = DocNode("document")
+    >>> for no in range(5000):
+    ...     node = DocNode("div", parent=node)
+    >>> text = DocNode("text", parent=node, content="foo")
+    >>> html = emit_tree(root, emit_node)
+    >>> html[:32]
+    '<document><div><div><div><div><d'
+    >>> html[-32:]
+    'iv></div></div></div></document>'
+    >>> len(html)
+    55024
+    """
+    content = emit_node(node)
+    if not isinstance(content, GeneratorType):
+        return content
+
+    generator = content
+    value = None
+    stack = []  # (generator, children iterator, emitted children) tuples
+    while True:
+        try:
+            parent = generator.send(value)
+        except StopIteration as err:
+            if not stack:
+                return err.value
+            generator, children, contents = stack[-1]
+            contents.append(err.value)
+        else:
+            if enter_children is not None:
+                enter_children(parent)
+            children = iter(parent.children)
+            contents = []
+            stack.append((generator, children, contents))
+
+        # emit the next child or send all emitted children to the generator:
+        for child in children:
+            content = emit_node(child)
+            if isinstance(content, GeneratorType):
+                generator = content
+                value = None
+                break
+            contents.append(content)
+        else:
+            generator = stack.pop()[0]
+            value = "".join(contents)
 
 
 class BaseEmitter:
     """
     Build from a document_tree (html2creole.parser.HtmlParser instance) a
     creole markup text.
+
+    The *_emit methods return a string or they are generators: they can
+    yield the node to get the emitted content of its children, e.g.:
+
+        def p_emit(self, node):
+            content = yield node
+            return f"{content}\n\n"
+
+    (see: emit_tree())
     """
+    _emit_methods = DispatchTable(suffix="_emit")  # node.kind -> *_emit method
+    deentity = deentity  # for replacing html entities, shared by all emitters
 
     def __init__(self, document_tree, unknown_emit=None, debug=False):
         self.root = document_tree
@@ -31,7 +110,6 @@ class BaseEmitter:
         self.last = None
         self.debugging = debug
 
-        self.deentity = Deentity()  # for replacing html entities
         self._inner_list = ""
         self._mask_linebreak = False
 
@@ -80,7 +158,8 @@ class BaseEmitter:
     # --------------------------------------------------------------------------
 
     def p_emit(self, node):
-        return f"{self.emit_children(node)}\n\n"
+        content = yield node
+        return f"{content}\n\n"
 
     def br_emit(self, node):
         if self._inner_list != "":
@@ -91,12 +170,13 @@ class BaseEmitter:
     # --------------------------------------------------------------------------
 
     def _typeface(self, node, key):
-        return key + self.emit_children(node) + key
+        content = yield node
+        return key + content + key
 
     # --------------------------------------------------------------------------
 
     def li_emit(self, node):
-        content = self.emit_children(node)
+        content = yield node
         return f"\n{self._inner_list} {content}"
 
     def _list_emit(self, node, list_type):
@@ -110,7 +190,7 @@ class BaseEmitter:
         else:
             self._inner_list += list_type
 
-        content = f"{self.emit_children(node)}"
+        content = yield node
 
         self._inner_list = self._inner_list[:-1]
 
@@ -130,13 +210,13 @@ class BaseEmitter:
             auto_width=self.table_auto_width,
             debug_msg=self.debug_msg
         )
-        self.emit_children(node)
+        yield node
         content = self._table.get_table_markup()
         return f"{content}\n"
 
     def tr_emit(self, node):
         self._table.add_tr()
-        self.emit_children(node)
+        yield node
         return ""
 
     def _escape_linebreaks(self, text):
@@ -149,13 +229,13 @@ class BaseEmitter:
         return content
 
     def th_emit(self, node):
-        content = self.emit_children(node)
+        content = yield node
         content = self._escape_linebreaks(content)
         self._table.add_th(content)
         return ""
 
     def td_emit(self, node):
-        content = self.emit_children(node)
+        content = yield node
         content = self._escape_linebreaks(content)
         self._table.add_td(content)
         return ""
@@ -163,7 +243,7 @@ class BaseEmitter:
     # --------------------------------------------------------------------------
 
     def _emit_content(self, node):
-        content = self.emit_children(node)
+        content = yield node
         content = self._escape_linebreaks(content)
         if node.kind in BLOCK_TAGS:
             content = f"{content}\n\n"
@@ -179,7 +259,8 @@ class BaseEmitter:
 
     def document_emit(self, node):
         self.last = node
-        return self.emit_children(node)
+        content = yield node
+        return content
 
     def emit_children(self, node):
         """Emit all the children of a node."""
@@ -188,41 +269,50 @@ class BaseEmitter:
     def emit_children_list(self, node):
         """Emit all the children of a node."""
         self.last = node
-        result = []
-        for child in node.children:
-            content = self.emit_node(child)
-            assert isinstance(content, str)
-            result.append(content)
-        return result
+        return [self.emit_node(child) for child in node.children]
 
     def emit_node(self, node):
-        """Emit a single node."""
-        def unicode_error(method_name, method, node, content):
-            node.debug()
-            raise AssertionError(
-                f"Method '{method_name}' ({method}) returns no unicode - returns: {repr(content)} ({type(content)})"
-            )
+        """Emit a single node (with all of its children)."""
+        return emit_tree(node, self._emit_node, enter_children=self._enter_children)
 
-        if node.level:
-            self.debug_msg("emit_node", f"{node.kind} (level: {node.level:d}): {node.content!r}")
-        else:
-            self.debug_msg("emit_node", f"{node.kind}: {node.content!r}")
+    def _enter_children(self, node):
+        self.last = node
 
-        method_name = f"{node.kind}_emit"
-        emit_method = getattr(self, method_name, None)
+    def _emit_node(self, node):
+        """Emit a single node, used in emit_tree()"""
+        if self.debugging:
+            if node.level:
+                self.debug_msg("emit_node", f"{node.kind} (level: {node.level:d}): {node.content!r}")
+            else:
+                self.debug_msg("emit_node", f"{node.kind}: {node.content!r}")
 
-        if emit_method:
-            content = emit_method(node)
-            if not isinstance(content, str):
-                unicode_error(method_name, emit_method, node, content)
-        else:
-            content = self._unknown_emit(self, node)
-            if not isinstance(content, str):
-                unicode_error(method_name, self._unknown_emit, node, content)
+        # The unknown_emit callable has the same signature as the unbound methods:
+        emit_method = self._emit_methods.get(node.kind, self._unknown_emit)
+        content = emit_method(self, node)
+
+        if isinstance(content, GeneratorType):
+            return self._emit_generator(node, emit_method, content)
 
+        if self.debugging:
+            self._check_content(node, emit_method, content)
         self.last = node
         return content
 
+    def _emit_generator(self, node, emit_method, generator):
+        content = yield from generator
+        if self.debugging:
+            self._check_content(node, emit_method, content)
+        self.last = node
+        return content
+
+    def _check_content(self, node, emit_method, content):
+        if not isinstance(content, str):
+            node.debug()
+            raise AssertionError(
+                f"Method '{node.kind}_emit' ({emit_method}) returns no unicode"
+                f" - returns: {repr(content)} ({type(content)})"
+            )
+
 #    def emit(self):
 #        """Emit the document represented by self.root DOM tree."""
 #        result = self.emit_node(self.root)
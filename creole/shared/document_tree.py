@@ -7,34 +7,168 @@
     :license: GNU GPL v3 or above, see LICENSE for more details.
 """
 
-import inspect
 import warnings
 
 from creole.shared.utils import dict2string
 
 
+_UNSET = object()
+
+
+class EmptyChildren(tuple):
+    """
+    The children of a DocNode without children. Shared by all nodes, so
+    it can't be changed: Use DocNode.add_child()
+
+    >>> EMPTY_CHILDREN.append(DocNode("text"))
+    Traceback (most recent call last):
+        ...
+    TypeError: The children of a node without children can't be changed, use DocNode.add_child()
+    """
+    __slots__ = ()
+
+    def _read_only(self, *args, **kwargs):
+        raise TypeError(
+            "The children of a node without children can't be changed, use DocNode.add_child()"
+        )
+
+    append = extend = insert = _read_only
+
+
+class EmptyAttrs(dict):
+    """
+    The attrs of a DocNode without attributes. Shared by all nodes, so
+    it can't be changed: Use DocNode.set_attr()
+
+    >>> EMPTY_ATTRS["href"] = "/"
+    Traceback (most recent call last):
+        ...
+    TypeError: The attrs of a node without attributes can't be changed, use DocNode.set_attr()
+    """
+    __slots__ = ()
+
+    def _read_only(self, *args, **kwargs):
+        raise TypeError(
+            "The attrs of a node without attributes can't be changed, use DocNode.set_attr()"
+        )
+
+    __setitem__ = __delitem__ = update = setdefault = _read_only
+    pop = popitem = clear = __ior__ = _read_only
+
+
+# Returned for nodes without children or attributes, see: DocNode
+EMPTY_CHILDREN = EmptyChildren()
+EMPTY_ATTRS = EmptyAttrs()
+
+
 class DocNode:
     """
     A node in the document tree for html2creole and creole2html.
 
     The Document tree would be created in the parser and used in the emitter.
+
+    There are many nodes in a tree, so they use __slots__ and the children
+    list and the attrs dict are only created when the first item is added
+    (see: add_child() and set_attr()). Until then, the children and attrs
+    properties return shared, read-only empty containers: Changing them
+    directly, e.g. with node.children.append(), raises a TypeError.
     """
+    __slots__ = (
+        "kind", "parent", "content", "level", "_children", "_attrs",
+        "start", "end",  # offsets in the source, see: CreoleParser(track_spans=True)
+
+        # Only set by the CreoleParser for some kind of nodes:
+        "macro_name", "macro_args",  # macro_inline and macro_block
+        "sect",  # pre_block
+        "used_macros", "headlines",  # document
+    )
 
-    def __init__(self, kind='', parent=None, content=None, attrs=[], level=None):
+    def __init__(self, kind='', parent=None, content=None, attrs=None, level=None):
         self.kind = kind
 
-        self.children = []
+        self._children = None
         self.parent = parent
-        if self.parent is not None:
-            self.parent.children.append(self)
+        if parent is not None:
+            parent.add_child(self)
+
+        if attrs:
+            self._attrs = dict(attrs)
+        else:
+            self._attrs = None
 
-        self.attrs = dict(attrs)
         if content:
             assert isinstance(content, str), f"Given content {content!r} is not unicode, it's type: {type(content)}"
 
         self.content = content
         self.level = level
 
+    @property
+    def children(self):
+        children = self._children
+        if children is None:
+            return EMPTY_CHILDREN
+        return children
+
+    @children.setter
+    def children(self, children):
+        self._children = children
+
+    @property
+    def attrs(self):
+        attrs = self._attrs
+        if attrs is None:
+            return EMPTY_ATTRS
+        return attrs
+
+    @attrs.setter
+    def attrs(self, attrs):
+        self._attrs = attrs
+
+    def add_child(self, child):
+        """
+        >>> node = DocNode("paragraph")
+        >>> node.children
+        ()
+        >>> node.add_child(DocNode("text", content="foo"))
+        >>> node.children
+        [<DocNode text: 'foo'>]
+        """
+        if self._children is None:
+            self._children = [child]
+        else:
+            self._children.append(child)
+
+    def set_attr(self, name, value):
+        """
+        >>> node = DocNode("link")
+        >>> node.set_attr("href", "/")
+        >>> node.attrs
+        {'href': '/'}
+        """
+        if self._attrs is None:
+            self._attrs = {name: value}
+        else:
+            self._attrs[name] = value
+
+    @property
+    def span(self):
+        """
+        The (start, end) offsets of the node in the source text, or None
+        if they are not tracked. The start and end slots are only set by
+        CreoleParser(track_spans=True)
+
+        >>> node = DocNode(kind="text", content="foo")
+        >>> node.span is None
+        True
+        >>> node.start, node.end = 4, 7
+        >>> node.span
+        (4, 7)
+        """
+        start = getattr(self, "start", None)
+        if start is None:
+            return None
+        return start, self.end
+
     def get_attrs_as_string(self):
         """
         FIXME: Find a better was to do this.
@@ -65,11 +199,12 @@ class DocNode:
         str(): <DocNode test: 'foo'>
         attributes:
                        attrs: {'a': 1}
-                    children: []
+                    children: ()
                      content: 'foo'
                         kind: 'test'
                        level: 0
                       parent: None
+                        span: None
         """
         print("_" * 80)
         print("\tDocNode - debug:")
@@ -78,9 +213,11 @@ class DocNode:
         for i in dir(self):
             if i.startswith("_") or i == "debug":
                 continue
-            if callable(getattr(self, i)):
+            value = getattr(self, i, _UNSET)
+            if value is _UNSET or callable(value):
+                # e.g.: a not used slot like "macro_name"
                 continue
-            print(f"{i:>20}: {getattr(self, i, '---')!r}")
+            print(f"{i:>20}: {value!r}")
 
 
 class DebugList(list):
@@ -89,6 +226,7 @@ class DebugList(list):
         super().__init__()
 
     def append(self, item):
+        import inspect
         #        for stack_frame in inspect.stack(): print(stack_frame)
 
         line, method = inspect.stack()[1][2:4]
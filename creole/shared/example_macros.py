@@ -10,9 +10,7 @@
 """
 
 
-from xml.sax.saxutils import escape
-
-from creole.shared.utils import get_pygments_formatter, get_pygments_lexer
+from creole.shared.utils import get_pygments_formatter, get_pygments_lexer, html_escape
 
 
 try:
@@ -35,7 +33,7 @@ def pre(text):
     Macro tag <<pre>>...<</pre>>.
     Put text between html pre tag.
     """
-    return f'<pre>{escape(text)}</pre>'
+    return f'<pre>{html_escape(text)}</pre>'
 
 
 def code(ext, text):
@@ -55,7 +53,7 @@ def code(ext, text):
     except IndexError:
         source_type = ''
 
-    lexer = get_pygments_lexer(source_type, code)
+    lexer = get_pygments_lexer(source_type, text)
     formatter = get_pygments_formatter()
 
     try:
@@ -0,0 +1,180 @@
+"""
+    python-creole macro runner
+    ~~~~~~~~~~~~~~~~~~~~~~~~~~
+
+    The HtmlEmitter calls all macros through a MacroRunner, that:
+
+     * caches the parsed macro arguments (see: parse_macro_args())
+     * memoizes the results of macros marked with @pure
+     * counts the calls and measures the time of every macro
+
+    e.g.:
+
+        from creole.shared.macro_runner import default_runner, pure
+
+        @pure
+        def upper(text):
+            return text.upper()
+
+        html = creole2html(markup, macros={"upper": upper})
+        print(default_runner.report())
+
+    The default_runner is shared by all conversions without an own
+    macro_runner in the process, e.g.:
+
+        converter = Creole2HtmlConverter(macros=macros, macro_runner=MacroRunner())
+
+    :copyleft: 2026 by python-creole team, see AUTHORS for more details.
+    :license: GNU GPL v3 or above, see LICENSE for more details.
+"""
+
+
+import functools
+import threading
+import time
+from collections import OrderedDict
+
+from creole.shared.utils import string2dict
+
+
+@functools.lru_cache(maxsize=1024)
+def parse_macro_args(raw_args):
+    """
+    cached string2dict(), returns the items as a tuple,
+    because the result is shared between all callers:
+
+    >>> parse_macro_args('ext=".py" lines=True')
+    (('ext', '.py'), ('lines', True))
+    """
+    return tuple(string2dict(raw_args).items())
+
+
+def pure(macro):
+    """
+    Decorator for macros, whose result depends only on the arguments
+    and the text. The MacroRunner would call them only once per input:
+
+    >>> @pure
+    ... def upper(text):
+    ...     return text.upper()
+    >>> is_pure(upper)
+    True
+    """
+    macro.pure = True
+    return macro
+
+
+def is_pure(macro):
+    return getattr(macro, "pure", False)
+
+
+class MacroStats:
+    """ Calls and time of one macro """
+    __slots__ = ("calls", "memo_hits", "errors", "total_time", "max_time")
+
+    def __init__(self):
+        self.calls = 0
+        self.memo_hits = 0
+        self.errors = 0
+        self.total_time = 0.0
+        self.max_time = 0.0
+
+    def as_dict(self):
+        return {name: getattr(self, name) for name in self.__slots__}
+
+
+class MacroRunner:
+    """
+    Call the macros and collect the statistics.
+    The results of max. memo_size calls of pure macros are stored.
+
+    >>> runner = MacroRunner()
+    >>> runner.call("upper", lambda text: text.upper(), {"text": "foo"})
+    'FOO'
+    >>> stats = runner.get_stats()["upper"]
+    >>> stats["calls"], stats["errors"], stats["total_time"] > 0
+    (1, 0, True)
+    """
+
+    def __init__(self, memo_size=1024):
+        self.memo_size = memo_size
+        self._lock = threading.Lock()
+        self._memo = OrderedDict()  # (macro, sorted kwargs items) -> result
+        self._stats = {}  # macro name -> MacroStats
+
+    def _get_stats(self, macro_name):
+        try:
+            return self._stats[macro_name]
+        except KeyError:
+            stats = self._stats[macro_name] = MacroStats()
+            return stats
+
+    def call(self, macro_name, macro, macro_kwargs):
+        """ returns macro(**macro_kwargs), exceptions are raised """
+        key = None
+        if self.memo_size and is_pure(macro):
+            key = (macro, tuple(sorted(macro_kwargs.items())))
+            with self._lock:
+                stats = self._get_stats(macro_name)
+                stats.calls += 1
+                try:
+                    result = self._memo[key]
+                except KeyError:
+                    pass
+                else:
+                    self._memo.move_to_end(key)
+                    stats.memo_hits += 1
+                    return result
+
+        error = True
+        start_time = time.perf_counter()
+        try:
+            result = macro(**macro_kwargs)
+            error = False
+        finally:
+            duration = time.perf_counter() - start_time
+            with self._lock:
+                stats = self._get_stats(macro_name)
+                if key is None:
+                    stats.calls += 1
+                if error:
+                    stats.errors += 1
+                stats.total_time += duration
+                stats.max_time = max(stats.max_time, duration)
+
+                if key is not None and not error and isinstance(result, str):
+                    self._memo[key] = result
+                    if len(self._memo) > self.memo_size:
+                        self._memo.popitem(last=False)
+        return result
+
+    def get_stats(self):
+        """ returns a dict: macro name -> dict with calls, memo hits, errors and times """
+        with self._lock:
+            return {name: stats.as_dict() for name, stats in self._stats.items()}
+
+    def report(self):
+        """ The statistics as text, the slowest macro first """
+        lines = [
+            f"{'macro':<20} {'calls':>8} {'memo hits':>10} {'errors':>7}"
+            f" {'total':>10} {'max':>10}"
+        ]
+        stats = sorted(
+            self.get_stats().items(), key=lambda item: item[1]["total_time"], reverse=True
+        )
+        for name, data in stats:
+            lines.append(
+                f"{name:<20} {data['calls']:>8} {data['memo_hits']:>10} {data['errors']:>7}"
+                f" {data['total_time'] * 1000:>8.2f}ms {data['max_time'] * 1000:>8.2f}ms"
+            )
+        return "\n".join(lines)
+
+    def clear(self):
+        """ Remove the memoized results and the statistics """
+        with self._lock:
+            self._memo.clear()
+            self._stats.clear()
+
+
+# Used by the HtmlEmitter, if no other runner is given:
+default_runner = MacroRunner()
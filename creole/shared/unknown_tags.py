@@ -2,13 +2,28 @@
     python-creole
     ~~~~~~~~~~~~~
 
+    The unknown_emit callables for the html2* emitters, e.g.:
+
+        html2creole(html, unknown_emit=escape_unknown_nodes)
+
+    Like the *_emit methods they return a string or they are generators,
+    that yield the node to get the emitted content of its children (see:
+    creole.shared.base_emitter.emit_tree()). All callables in this module
+    are generators, so they don't return a string if you call them in your
+    own unknown_emit callable: Return their result or use "yield from", e.g.:
+
+        def my_unknown_emit(emitter, node):
+            if node.kind == "foo":
+                return "bar"
+            content = yield from escape_unknown_nodes(emitter, node)
+            return content.upper()
 
     :copyleft: 2008-2011 by python-creole team, see AUTHORS for more details.
     :license: GNU GPL v3 or above, see LICENSE for more details.
 """
 
 
-from xml.sax.saxutils import escape
+from html import escape
 
 
 def _mask_content(emitter, node, mask_tag):
@@ -22,7 +37,7 @@ def _mask_content(emitter, node, mask_tag):
         "mask_tag": mask_tag,
     }
 
-    content = emitter.emit_children(node)
+    content = yield node
     if not content:
         # single tag
         return f"<<{tag_data['mask_tag']}>><{tag_data['tag']}{tag_data['attrs']} /><</{tag_data['mask_tag']}>>"
@@ -39,7 +54,7 @@ def raise_unknown_node(emitter, node):
 
     Raise NotImplementedError on unknown tags.
     """
-    content = emitter.emit_children(node)
+    content = yield node
     raise NotImplementedError(
         f"Node from type '{node.kind}' is not implemented! (child content: {content!r})"
     )
@@ -78,13 +93,13 @@ def escape_unknown_nodes(emitter, node):
         "attrs": attrs,
     }
 
-    content = emitter.emit_children(node)
+    content = yield node
     if not content:
         # single tag
-        return escape(f"<{tag_data['tag']}{tag_data['attrs']} />")
+        return escape(f"<{tag_data['tag']}{tag_data['attrs']} />", quote=False)
 
-    start_tag = escape(f"<{tag_data['tag']}{tag_data['attrs']}>")
-    end_tag = escape(f"</{tag_data['tag']}>")
+    start_tag = escape(f"<{tag_data['tag']}{tag_data['attrs']}>", quote=False)
+    end_tag = escape(f"</{tag_data['tag']}>", quote=False)
 
     return start_tag + content + end_tag
 
@@ -7,16 +7,15 @@
 """
 
 
+import functools
 import json
+import re
 import shlex
+from importlib.util import find_spec
 
 
-try:
-    from pygments import lexers
-    from pygments.formatters import HtmlFormatter
-    PYGMENTS = True
-except ImportError:
-    PYGMENTS = False
+# pygments would be imported on first use:
+PYGMENTS = find_spec("pygments") is not None
 
 
 # For string2dict()
@@ -60,6 +59,104 @@ def string2dict(raw_content):
     return result
 
 
+def html_escape(text):
+    """
+    Escape the text for html code. Most texts contain none of the special
+    characters, they are returned without creating a new string:
+
+    >>> html_escape('a < b & "c"')
+    'a &lt; b &amp; "c"'
+    >>> text = "nothing to escape"
+    >>> html_escape(text) is text
+    True
+    """
+    if "&" in text or "<" in text or ">" in text:
+        return text.replace("&", "&amp;").replace("<", "&lt;").replace(">", "&gt;")
+    return text
+
+
+def attr_escape(text):
+    """
+    Escape the text for a html attribute value in double quotes:
+
+    >>> attr_escape('a < b & "c"')
+    'a &lt; b &amp; &quot;c&quot;'
+    """
+    if "&" in text or "<" in text or ">" in text or '"' in text:
+        return (
+            text.replace("&", "&amp;").replace("<", "&lt;").replace(">", "&gt;")
+            .replace('"', "&quot;")
+        )
+    return text
+
+
+def slugify(text):
+    """
+    Create a URL-safe anchor name, e.g. for a headline:
+
+    >>> slugify("Sub-Headline 1.1")
+    'sub-headline-1.1'
+    >>> slugify("Q & A: <why?>")
+    'q-a-why'
+    >>> slugify("!?")
+    'section'
+    """
+    words = re.findall(r"[\w.]+", text.lower())
+    return "-".join(words) or "section"
+
+
+class DispatchTable:
+    """
+    Class attribute that maps names to the methods "<prefix><name><suffix>".
+    The mapping would be created only once per class. Used to find the
+    handler method for the "lastgroup" of a regex match, e.g.:
+
+    >>> class Handler:
+    ...     methods = DispatchTable(prefix="_", suffix="_repl", exclude=("all",))
+    ...     def _foo_repl(self):
+    ...         return "foo called"
+    ...     def _repl(self):
+    ...         return "helper"
+    ...     def _all_repl(self):
+    ...         return "helper"
+    >>> Handler.methods  # doctest: +ELLIPSIS
+    {'foo': <function Handler._foo_repl at ...>}
+    >>> Handler.methods["foo"](Handler())
+    'foo called'
+
+    Empty names, names that starts with "_" and the excluded names are
+    not in the mapping: They are helper methods, e.g.: "_list_emit()"
+    """
+
+    def __init__(self, prefix="", suffix="", exclude=()):
+        self.prefix = prefix
+        self.suffix = suffix
+        self.exclude = frozenset(exclude)
+        self._tables = {}
+
+    def build(self, cls):
+        start = len(self.prefix)
+        end = len(self.suffix)
+        table = {}
+        for attr_name in dir(cls):
+            if not attr_name.startswith(self.prefix) or not attr_name.endswith(self.suffix):
+                continue
+            name = attr_name[start:len(attr_name) - end]
+            if not name or name.startswith("_") or name in self.exclude:
+                continue
+            method = getattr(cls, attr_name)
+            if callable(method):
+                table[name] = method
+        return table
+
+    def __get__(self, instance, owner):
+        try:
+            return self._tables[owner]
+        except KeyError:
+            table = self._tables[owner] = self.build(owner)
+            return table
+
+
 def dict2string(d):
     """
     FIXME: Find a better was to do this.
@@ -79,19 +176,33 @@ def dict2string(d):
     return " ".join(attr_list)
 
 
+@functools.lru_cache(maxsize=None)
 def get_pygments_formatter():
     if PYGMENTS:
+        from pygments.formatters import HtmlFormatter
         return HtmlFormatter(lineos=True, encoding='utf-8',
                              style='colorful', outencoding='utf-8',
                              cssclass='pygments')
 
 
+@functools.lru_cache(maxsize=128)
+def get_pygments_lexer_by_name(source_type):
+    """ cached lexer lookup, returns None for unknown source types """
+    from pygments import lexers
+    from pygments.util import ClassNotFound
+    try:
+        return lexers.get_lexer_by_name(source_type)
+    except ClassNotFound:
+        return None
+
+
 def get_pygments_lexer(source_type, code):
     if PYGMENTS:
-        try:
-            return lexers.get_lexer_by_name(source_type)
-        except BaseException:
-            return lexers.guess_lexer(code)
+        lexer = get_pygments_lexer_by_name(source_type)
+        if lexer is None:
+            from pygments import lexers
+            lexer = lexers.guess_lexer(code)
+        return lexer
     else:
         return None
 
@@ -0,0 +1,95 @@
+"""
+    unittest for the async API
+    ~~~~~~~~~~~~~~~~~~~~~~~~~~
+
+    :copyleft: 2026 by python-creole team, see AUTHORS for more details.
+    :license: GNU GPL v3 or above, see LICENSE for more details.
+"""
+
+
+import asyncio
+import threading
+import unittest
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+
+import creole
+from creole import aio, creole2html, html2creole, html2markdown, html2rest, html2textile
+
+
+class TestAsyncAPI(unittest.TestCase):
+    def tearDown(self):
+        aio.configure()
+
+    def test_same_results(self):
+        html = "<p>This is <strong>bold</strong> and <i>italic</i>!</p>"
+
+        async def convert_all():
+            return await asyncio.gather(
+                creole.acreole2html("This is **bold**!", blog_line_breaks=False),
+                creole.ahtml2creole(html),
+                creole.ahtml2textile(html),
+                creole.ahtml2markdown(html),
+                creole.ahtml2rest(html),
+            )
+
+        for inline_threshold in (0, aio.INLINE_THRESHOLD):
+            aio.configure(inline_threshold=inline_threshold)
+            self.assertEqual(asyncio.run(convert_all()), [
+                creole2html("This is **bold**!", blog_line_breaks=False),
+                html2creole(html),
+                html2textile(html),
+                html2markdown(html),
+                html2rest(html),
+            ])
+
+    def test_inline_threshold(self):
+        threads = []
+
+        def convert(text):
+            threads.append(threading.current_thread())
+            return text
+
+        async def run():
+            converter = aio.AsyncConverter(inline_threshold=10)
+            await converter.run(convert, "small")
+            await converter.run(convert, "a larger document")
+
+        asyncio.run(run())
+        self.assertIs(threads[0], threading.main_thread())
+        self.assertIsNot(threads[1], threading.main_thread())
+
+    def test_process_executor(self):
+        with ProcessPoolExecutor(max_workers=1) as executor:
+            aio.configure(executor=executor, inline_threshold=0)
+            self.assertEqual(
+                asyncio.run(creole.acreole2html("**bold**")),
+                "<p><strong>bold</strong></p>"
+            )
+
+    def test_cancel(self):
+        started = threading.Event()
+        release = threading.Event()
+        calls = []
+
+        def blocking(text):
+            calls.append(text)
+            started.set()
+            release.wait(5)
+            return text
+
+        async def run():
+            converter = aio.AsyncConverter(executor=executor, inline_threshold=0)
+            running = asyncio.ensure_future(converter.run(blocking, "running"))
+            queued = asyncio.ensure_future(converter.run(blocking, "queued"))
+            await asyncio.get_running_loop().run_in_executor(None, started.wait, 5)
+
+            queued.cancel()
+            with self.assertRaises(asyncio.CancelledError):
+                await queued
+            release.set()
+            return await running
+
+        with ThreadPoolExecutor(max_workers=1) as executor:
+            self.assertEqual(asyncio.run(run()), "running")
+        # The queued conversion was never started:
+        self.assertEqual(calls, ["running"])
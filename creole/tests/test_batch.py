@@ -0,0 +1,106 @@
+"""
+    unittest for creole.batch
+    ~~~~~~~~~~~~~~~~~~~~~~~~~
+
+    :copyleft: 2026 by python-creole team, see AUTHORS for more details.
+    :license: GNU GPL v3 or above, see LICENSE for more details.
+"""
+
+
+import os
+import threading
+import unittest
+
+from creole import creole2html, html2creole
+from creole.batch import BatchResult, convert_many
+from creole.tests import test_macros
+
+
+# The macros must be picklable for the worker processes:
+MACROS = {"unittest_macro1": test_macros.unittest_macro1}
+
+
+def exit_macro(text):
+    os._exit(1)  # e.g. killed by the OOM killer
+
+
+DOCUMENTS = [f"= Page {no}\n\nSome **bold** text <<unittest_macro1>>" for no in range(20)]
+
+
+class TestConvertMany(unittest.TestCase):
+    def assert_converted(self, results, documents=DOCUMENTS, **options):
+        self.assertEqual(
+            [result.output for result in results],
+            [creole2html(document, **options) for document in documents],
+        )
+
+    def test_in_process(self):
+        results = list(convert_many(DOCUMENTS, workers=1, chunksize=3, macros=MACROS))
+        self.assertEqual([result.index for result in results], list(range(len(DOCUMENTS))))
+        self.assertEqual({result.error for result in results}, {None})
+        self.assert_converted(results, macros=MACROS)
+
+    def test_worker_pool(self):
+        results = list(convert_many(iter(DOCUMENTS), workers=2, chunksize=3, macros=MACROS))
+        self.assertEqual([result.index for result in results], list(range(len(DOCUMENTS))))
+        self.assert_converted(results, macros=MACROS)
+
+    def test_unordered(self):
+        results = convert_many(DOCUMENTS, workers=2, chunksize=2, ordered=False)
+        results = sorted(results, key=lambda result: result.index)
+        self.assert_converted(results)
+
+    def test_other_direction(self):
+        html = ["<p><strong>one</strong></p>", "<p><i>two</i></p>"]
+        results = convert_many(html, direction="html2creole", workers=1)
+        self.assertEqual(
+            [result.output for result in results], [html2creole(code) for code in html]
+        )
+
+    def test_errors_are_isolated(self):
+        for workers in (1, 2):
+            results = list(convert_many(["**one**", None, "**three**"], workers=workers))
+            self.assertEqual(results[0], BatchResult(0, "<p><strong>one</strong></p>", None))
+            self.assertEqual(results[1].index, 1)
+            self.assertIsNone(results[1].output)
+            self.assertIn("AssertionError", results[1].error)
+            self.assertEqual(results[2], BatchResult(2, "<p><strong>three</strong></p>", None))
+
+    def test_unpicklable_document(self):
+        documents = ["**one**", threading.Lock(), "**three**"]
+        results = list(convert_many(documents, workers=2, chunksize=1))
+        self.assertEqual([result.index for result in results], [0, 1, 2])
+        self.assertEqual(results[0].output, "<p><strong>one</strong></p>")
+        self.assertIsNone(results[1].output)
+        self.assertIn("pickle", results[1].error)
+        self.assertEqual(results[2].output, "<p><strong>three</strong></p>")
+
+    def test_broken_process_pool(self):
+        documents = ["**one**", "<<exit_macro>>", "**three**", "**four**"]
+        results = list(
+            convert_many(documents, workers=2, chunksize=1, macros={"exit_macro": exit_macro})
+        )
+        # One result for every document:
+        self.assertEqual([result.index for result in results], [0, 1, 2, 3])
+        self.assertIsNone(results[1].output)
+        self.assertIn("BrokenProcessPool", results[1].error)
+        for result in results:
+            if result.error is None:
+                self.assertEqual(result.output, creole2html(documents[result.index]))
+
+    def test_progress(self):
+        calls = []
+        list(convert_many(
+            DOCUMENTS[:3], workers=1, progress=lambda done, total: calls.append((done, total))
+        ))
+        self.assertEqual(calls, [(1, 3), (2, 3), (3, 3)])
+
+        calls = []
+        list(convert_many(
+            iter(DOCUMENTS[:2]), workers=1, progress=lambda done, total: calls.append((done, total))
+        ))
+        self.assertEqual(calls, [(1, None), (2, None)])
+
+    def test_unknown_direction(self):
+        with self.assertRaises(ValueError):
+            convert_many(DOCUMENTS, direction="creole2pdf")
@@ -0,0 +1,61 @@
+"""
+    creole-bench tests
+    ~~~~~~~~~~~~~~~~~~
+
+    :copyleft: 2026 by python-creole team, see AUTHORS for more details.
+    :license: GNU GPL v3 or above, see LICENSE for more details.
+"""
+
+
+import io
+import json
+import tempfile
+import unittest
+from contextlib import redirect_stdout
+from pathlib import Path
+
+from creole import VERSION_STRING
+from creole.benchmarks.suite import DIRECTIONS, cli_bench
+
+
+class TestCreoleBench(unittest.TestCase):
+    def bench(self, *args):
+        stdout = io.StringIO()
+        with redirect_stdout(stdout):
+            cli_bench(["--size", "1", "--number", "1", "--repeat", "1", *args])
+        return stdout.getvalue()
+
+    def test_all_directions(self):
+        report = json.loads(self.bench("--corpus", "paragraphs"))
+        self.assertEqual(report["python_creole"], VERSION_STRING)
+        self.assertEqual(report["size_kb"], 1)
+        self.assertEqual(
+            [result["direction"] for result in report["results"]],
+            list(DIRECTIONS)
+        )
+        for result in report["results"]:
+            self.assertGreaterEqual(result["bytes"], 1024)
+            self.assertGreater(result["mb_per_second"], 0)
+            self.assertGreater(result["docs_per_second"], 0)
+            self.assertGreater(result["peak_memory"], 0)
+
+    def test_output_and_compare(self):
+        with tempfile.TemporaryDirectory() as temp_dir:
+            report_path = Path(temp_dir, "report.json")
+            output = self.bench(
+                "--direction", "html2creole", "--corpus", "nested", "--output", str(report_path)
+            )
+            self.assertIn("html2creole nested", output)
+
+            report = json.loads(report_path.read_text(encoding="utf-8"))
+            self.assertEqual(len(report["results"]), 1)
+
+            output = self.bench(
+                "--direction", "html2creole", "--corpus", "nested", "--compare", str(report_path)
+            )
+            self.assertIn(f"Compare python-creole v{VERSION_STRING} with v{VERSION_STRING}", output)
+            self.assertRegex(output, r"html2creole nested .+ \(x[0-9.]+\)")
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,227 @@
+"""
+    unittest for creole.cache
+    ~~~~~~~~~~~~~~~~~~~~~~~~~
+
+    :copyleft: 2026 by python-creole team, see AUTHORS for more details.
+    :license: GNU GPL v3 or above, see LICENSE for more details.
+"""
+
+
+import functools
+import os
+import tempfile
+import threading
+import unittest
+
+from creole import creole2html, html2creole, html2markdown, html2rest, html2textile
+from creole.cache import MemoryBackend, RenderCache, ShelveBackend, SqliteBackend, uncacheable
+
+
+CALLS = []
+
+
+def counting_macro(text):
+    CALLS.append(text)
+    return f"<span>{text}</span>"
+
+
+@uncacheable
+def uncacheable_macro(text):
+    CALLS.append(text)
+    return f"<span>{len(CALLS)}</span>"
+
+
+def word_macro(text, word):
+    return word
+
+
+class WordMacros:
+    def __init__(self, word):
+        self.word = word
+
+    def word_macro(self, text):
+        return self.word
+
+
+class LockedMacros(WordMacros):
+    def __init__(self, word):
+        super().__init__(word)
+        self.lock = threading.Lock()  # has no fingerprint
+
+
+MACROS = {"counting": counting_macro, "uncacheable": uncacheable_macro}
+
+
+class RenderCacheTestMixin:
+    def setUp(self):
+        super().setUp()
+        CALLS.clear()
+        self.temp_dir = tempfile.TemporaryDirectory()
+        self.addCleanup(self.temp_dir.cleanup)
+
+    def get_cache(self, **kwargs):
+        cache = RenderCache(backend=self.get_backend(), **kwargs)
+        self.addCleanup(cache.close)
+        return cache
+
+    def test_creole2html(self):
+        cache = self.get_cache()
+        markup = "<<counting>>foo<</counting>> **bar**"
+        for _ in range(3):
+            self.assertEqual(
+                cache.creole2html(markup, macros=MACROS), creole2html(markup, macros=MACROS)
+            )
+        # 1x by the cache + 3x by creole2html():
+        self.assertEqual(len(CALLS), 4)
+        self.assertEqual((cache.hits, cache.misses), (2, 1))
+
+    def test_options_in_key(self):
+        cache = self.get_cache()
+        markup = "one\ntwo"
+        self.assertEqual(cache.creole2html(markup), "<p>one<br />\ntwo</p>")
+        self.assertEqual(cache.creole2html(markup, blog_line_breaks=False), "<p>one two</p>")
+        self.assertEqual(cache.misses, 2)
+
+    def test_uncacheable_macro(self):
+        cache = self.get_cache()
+        markup = "<<uncacheable>>foo<</uncacheable>>"
+        self.assertEqual(cache.creole2html(markup, macros=MACROS), "<span>1</span>")
+        self.assertEqual(cache.creole2html(markup, macros=MACROS), "<span>2</span>")
+        stats = cache.stats()
+        self.assertEqual((stats["hits"], stats["uncacheable"], stats["entries"]), (0, 2, 0))
+
+    def test_partial_macro_in_key(self):
+        cache = self.get_cache()
+        markup = "x <<word_macro>>foo<</word_macro>>"
+        for word in ("A", "B", "A"):
+            macros = {"word_macro": functools.partial(word_macro, word=word)}
+            self.assertEqual(cache.creole2html(markup, macros=macros), f"<p>x {word}</p>")
+        self.assertEqual((cache.hits, cache.misses), (1, 2))
+
+    def test_bound_method_macro_in_key(self):
+        cache = self.get_cache()
+        markup = "x <<word_macro>>foo<</word_macro>>"
+        for word in ("one", "two", "one"):
+            macros = {"word_macro": WordMacros(word).word_macro}
+            self.assertEqual(cache.creole2html(markup, macros=macros), f"<p>x {word}</p>")
+        self.assertEqual((cache.hits, cache.misses), (1, 2))
+
+    def test_instance_macros_in_key(self):
+        cache = self.get_cache()
+        markup = "x <<word_macro>>foo<</word_macro>>"
+        for word in ("three", "four", "three"):
+            macros = WordMacros(word)
+            self.assertEqual(cache.creole2html(markup, macros=macros), f"<p>x {word}</p>")
+        self.assertEqual((cache.hits, cache.misses), (1, 2))
+
+    def test_unstable_fingerprint_not_cached(self):
+        cache = self.get_cache()
+        markup = "x <<word_macro>>foo<</word_macro>>"
+        for word in ("five", "six"):
+            macros = LockedMacros(word)
+            self.assertEqual(cache.creole2html(markup, macros=macros), f"<p>x {word}</p>")
+        stats = cache.stats()
+        self.assertEqual((stats["hits"], stats["uncacheable"], stats["entries"]), (0, 2, 0))
+
+    def test_closure_macros_not_cached(self):
+        def make_macros(name):
+            def greet(text):
+                return f"Hello {name}"
+            return {"greet": greet}
+
+        cache = self.get_cache()
+        markup = "<<greet>><</greet>>"
+        # The first closure is garbage collected before the second is created,
+        # so both may get the same id():
+        self.assertEqual(cache.creole2html(markup, macros=make_macros("alice")), "Hello alice")
+        self.assertEqual(cache.creole2html(markup, macros=make_macros("bob")), "Hello bob")
+        self.assertEqual(
+            cache.creole2html(markup, macros={"greet": lambda text: "Hello lambda"}),
+            "Hello lambda"
+        )
+        stats = cache.stats()
+        self.assertEqual((stats["hits"], stats["uncacheable"], stats["entries"]), (0, 3, 0))
+
+    def test_html2markup(self):
+        cache = self.get_cache()
+        html = "<p><strong>bold</strong> and <i>italic</i></p>"
+        for func in (html2creole, html2markdown, html2rest, html2textile):
+            cached_func = getattr(cache, func.__name__)
+            self.assertEqual(cached_func(html), func(html))
+            self.assertEqual(cached_func(html), func(html))
+        self.assertEqual((cache.hits, cache.misses), (4, 4))
+
+    def test_max_entries(self):
+        cache = self.get_cache(max_entries=2)
+        cache.creole2html("one")
+        cache.creole2html("two")
+        cache.creole2html("one")  # "two" is now the least recently used
+        cache.creole2html("three")
+        self.assertEqual(cache.evictions, 1)
+        self.assertEqual(len(cache.backend), 2)
+        cache.creole2html("one")
+        self.assertEqual(cache.hits, 2)
+        cache.creole2html("two")
+        self.assertEqual(cache.hits, 2)
+
+    def test_max_bytes(self):
+        cache = self.get_cache(max_bytes=30)
+        cache.creole2html("one")  # <p>one</p> = 10 bytes
+        cache.creole2html("two")
+        cache.creole2html("three")
+        self.assertEqual(cache.stats()["bytes"], 22)
+        self.assertEqual(cache.evictions, 1)
+        cache.creole2html("x" * 100)  # bigger than max_bytes: not stored
+        self.assertEqual(cache.stats()["entries"], 2)
+
+    def test_ttl(self):
+        cache = self.get_cache(ttl=0)
+        cache.creole2html("one")
+        cache.creole2html("one")
+        self.assertEqual((cache.hits, cache.misses), (0, 2))
+
+    def test_clear(self):
+        cache = self.get_cache()
+        cache.creole2html("one")
+        cache.clear()
+        self.assertEqual(cache.stats()["entries"], 0)
+        self.assertEqual(cache.stats()["bytes"], 0)
+
+
+class TestMemoryBackend(RenderCacheTestMixin, unittest.TestCase):
+    def get_backend(self):
+        return MemoryBackend()
+
+
+class PersistentBackendTestMixin(RenderCacheTestMixin):
+    def test_persistent(self):
+        cache = self.get_cache()
+        cache.creole2html("<<counting>>foo<</counting>>", macros=MACROS)
+        cache.close()
+
+        cache = self.get_cache()
+        cache.creole2html("<<counting>>foo<</counting>>", macros=MACROS)
+        self.assertEqual(cache.hits, 1)
+        self.assertEqual(CALLS, ["foo"])
+
+    def test_persistent_size(self):
+        cache = self.get_cache()
+        cache.creole2html("one")
+        cache.creole2html("two")
+        cache.close()
+
+        cache = self.get_cache(max_bytes=25)
+        self.assertEqual(cache.stats()["bytes"], 20)
+        cache.creole2html("three")
+        self.assertEqual(cache.evictions, 1)
+        self.assertEqual(cache.stats()["bytes"], 22)
+
+
+class TestShelveBackend(PersistentBackendTestMixin, unittest.TestCase):
+    def get_backend(self):
+        return ShelveBackend(os.path.join(self.temp_dir.name, "cache"))
+
+
+class TestSqliteBackend(PersistentBackendTestMixin, unittest.TestCase):
+    def get_backend(self):
+        return SqliteBackend(os.path.join(self.temp_dir.name, "cache.sqlite"))
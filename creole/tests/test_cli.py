@@ -7,9 +7,13 @@
 """
 
 
+import io
+import os
 import sys
 import tempfile
 import unittest
+from pathlib import Path
+from unittest import mock
 
 from creole import VERSION_STRING, cmdline
 from creole.tests.utils.base_unittest import BaseCreoleTest
@@ -126,5 +130,151 @@ class CreoleCLITestsDirect(BaseCreoleTest, CliTestMixins):
         self.assertEqual(result_content, dest_content)
 
 
+class StreamTests(BaseCreoleTest):
+    def setUp(self):
+        super().setUp()
+        self._old_sys_argv = sys.argv[:]
+
+    def tearDown(self):
+        sys.argv = self._old_sys_argv
+
+    def call_cli(self, cli_str, argv, stdin):
+        stdin = io.TextIOWrapper(io.BytesIO(stdin))
+        stdout = io.TextIOWrapper(io.BytesIO())
+        stderr = io.StringIO()
+        sys.argv = [cli_str] + argv
+        with mock.patch.object(sys, "stdin", stdin), mock.patch.object(sys, "stdout", stdout), \
+                mock.patch.object(sys, "stderr", stderr):
+            getattr(cmdline, f"cli_{cli_str}")()
+        return stdout.buffer.getvalue(), stderr.getvalue()
+
+    def test_stdin_to_stdout(self):
+        stdout, stderr = self.call_cli("creole2html", ["-", "-"], stdin=b"= test")
+        self.assertEqual(stdout, b"<h1>test</h1>")
+        self.assertIn("done. 1 document(s) written to '-'.", stderr)
+
+    def test_nul_separated(self):
+        stdout, stderr = self.call_cli(
+            "creole2html", ["-", "-", "--separator", "nul"], stdin=b"= one\0**two**\0"
+        )
+        self.assertEqual(stdout, b"<h1>one</h1>\0<p><strong>two</strong></p>\0")
+        self.assertIn("done. 2 document(s) written to '-'.", stderr)
+
+    def test_formfeed_separated_file(self):
+        with tempfile.TemporaryDirectory() as temp_dir:
+            sourcefilepath = os.path.join(temp_dir, "source.html")
+            with open(sourcefilepath, "wb") as f:
+                f.write("<h1>one</h1>\f<p>tw\xf6</p>".encode("utf-8"))
+            stdout, stderr = self.call_cli(
+                "html2creole", [sourcefilepath, "-", "--separator", "formfeed"], stdin=b""
+            )
+        self.assertEqual(stdout, "= one\ftw\xf6\f".encode("utf-8"))
+
+    def test_iter_stream_documents(self):
+        stream = io.BytesIO("\xe4\xf6\xfc\0\0last".encode("utf-8"))
+        # small chunks that split the multibyte characters:
+        documents = cmdline.iter_stream_documents(stream, "\0", chunk_size=1)
+        self.assertEqual(list(documents), ["\xe4\xf6\xfc", "", "last"])
+
+
+class BulkConvertTests(BaseCreoleTest):
+    def setUp(self):
+        super().setUp()
+        self._old_sys_argv = sys.argv[:]
+        self.temp_dir = tempfile.TemporaryDirectory()
+        self.source = Path(self.temp_dir.name, "source")
+        self.destination = Path(self.temp_dir.name, "destination")
+        (self.source / "sub").mkdir(parents=True)
+        (self.source / "one.creole").write_text("= one", encoding="utf-8")
+        (self.source / "sub" / "two.creole").write_text("**two**", encoding="utf-8")
+        (self.source / "ignored.txt").write_text("not a creole file", encoding="utf-8")
+
+    def tearDown(self):
+        sys.argv = self._old_sys_argv
+        self.temp_dir.cleanup()
+
+    def get_files(self, path):
+        return {
+            str(filepath.relative_to(path)): filepath.read_text(encoding="utf-8")
+            for filepath in sorted(path.rglob("*")) if filepath.is_file()
+        }
+
+    def bulk_convert(self, source, **kwargs):
+        stdout = io.StringIO()
+        stderr = io.StringIO()
+        bulk_convert = cmdline.BulkConvert(
+            "creole2html", str(self.destination), stdout=stdout, stderr=stderr, **kwargs
+        )
+        errors = bulk_convert(str(source))
+        return errors, stdout.getvalue(), stderr.getvalue()
+
+    def test_cli_directory(self):
+        sys.argv = ["creole2html", str(self.source), str(self.destination)]
+        cmdline.cli_creole2html()
+        self.assertEqual(
+            self.get_files(self.destination),
+            {"one.html": "<h1>one</h1>", os.path.join("sub", "two.html"): "<p><strong>two</strong></p>"},
+        )
+
+    def test_cli_file_with_glob_characters(self):
+        sourcefile = self.source / "n[1].creole"
+        sourcefile.write_text("= n1", encoding="utf-8")
+        destination = Path(self.temp_dir.name, "n1.html")
+        sys.argv = ["creole2html", str(sourcefile), str(destination)]
+        with mock.patch.object(sys, "stdout", io.StringIO()):
+            cmdline.cli_creole2html()
+        self.assertEqual(destination.read_text(encoding="utf-8"), "<h1>n1</h1>")
+        self.assertFalse(self.destination.exists())
+
+    def test_glob_pattern(self):
+        errors, stdout, stderr = self.bulk_convert(self.source / "**" / "t*.creole", extension=".htm")
+        self.assertEqual(errors, 0)
+        self.assertEqual(
+            self.get_files(self.destination),
+            {os.path.join("sub", "two.htm"): "<p><strong>two</strong></p>"},
+        )
+        self.assertIn("1 files converted, 0 skipped, 0 errors", stdout)
+
+    def test_parallel(self):
+        errors, stdout, stderr = self.bulk_convert(self.source, jobs=2)
+        self.assertEqual(errors, 0)
+        self.assertEqual(len(self.get_files(self.destination)), 2)
+
+    def test_skip_mtime(self):
+        self.bulk_convert(self.source)
+        errors, stdout, stderr = self.bulk_convert(self.source)
+        self.assertIn("0 files converted, 2 skipped, 0 errors", stdout)
+
+        source_file = self.source / "one.creole"
+        source_file.write_text("= changed", encoding="utf-8")
+        mtime = os.path.getmtime(self.destination / "one.html") + 1
+        os.utime(source_file, (mtime, mtime))
+        errors, stdout, stderr = self.bulk_convert(self.source)
+        self.assertIn("1 files converted, 1 skipped, 0 errors", stdout)
+        self.assertEqual(self.get_files(self.destination)["one.html"], "<h1>changed</h1>")
+
+    def test_skip_hash(self):
+        errors, stdout, stderr = self.bulk_convert(self.source, skip="hash")
+        self.assertIn("2 files converted, 0 skipped, 0 errors", stdout)
+        self.assertTrue((self.destination / cmdline.BulkConvert.HASH_FILENAME).is_file())
+
+        (self.source / "sub" / "two.creole").write_text("**changed**", encoding="utf-8")
+        errors, stdout, stderr = self.bulk_convert(self.source, skip="hash")
+        self.assertIn("1 files converted, 1 skipped, 0 errors", stdout)
+
+        errors, stdout, stderr = self.bulk_convert(self.source, skip="none")
+        self.assertIn("2 files converted, 0 skipped, 0 errors", stdout)
+
+    def test_errors(self):
+        (self.source / "broken.creole").write_bytes(b"\xff\xfe")
+        errors, stdout, stderr = self.bulk_convert(self.source)
+        self.assertEqual(errors, 1)
+        self.assertIn("broken.creole", stderr)
+        self.assertIn("UnicodeDecodeError", stderr)
+        self.assertIn("2 files converted, 0 skipped, 1 errors", stdout)
+        # No temporary files are left:
+        self.assertEqual(sorted(self.get_files(self.destination)), ["one.html", os.path.join("sub", "two.html")])
+
+
 if __name__ == '__main__':
     unittest.main()
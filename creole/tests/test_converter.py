@@ -0,0 +1,198 @@
+"""
+    Creole2HtmlConverter unittest
+    ~~~~~~~~~~~~~~~~~~~~~~~~~~~~~
+
+    :copyleft: 2026 by python-creole team, see AUTHORS for more details.
+    :license: GNU GPL v3 or above, see LICENSE for more details.
+"""
+
+
+import unittest
+from concurrent.futures import ThreadPoolExecutor
+
+from creole import Creole2HtmlConverter, creole2html, iter_creole2html
+from creole.converter import IncrementalCreole2HtmlConverter
+from creole.parser.creol2html_parser import CreoleParser
+from creole.shared import example_macros
+from creole.tests import test_macros
+from creole.tests.utils.base_unittest import BaseCreoleTest
+
+
+TOC_DOCUMENT = """\
+<<toc>>
+= headline 1
+== headline 2
+"""
+
+TOC_HTML = """\
+<ul>
+\t<li><a href="#headline-1">headline 1</a></li>
+\t<ul>
+\t\t<li><a href="#headline-2">headline 2</a></li>
+\t</ul>
+</ul>
+<a name="headline-1"><h1>headline 1</h1></a>
+<a name="headline-2"><h2>headline 2</h2></a>"""
+
+
+class TestCreole2HtmlConverter(BaseCreoleTest):
+    def test_same_as_creole2html(self):
+        markup = self._prepare_text("""
+            = Headline
+
+            Text with **bold** and a <<unittest_macro1 foo="bar">> macro.
+
+            * one
+            ** two
+
+            |= head |= head |
+            | cell  | cell  |
+        """)
+        for blog_line_breaks in (True, False):
+            conv = Creole2HtmlConverter(macros=test_macros, blog_line_breaks=blog_line_breaks)
+            self.assertEqual(
+                conv(markup),
+                creole2html(markup, macros=test_macros, blog_line_breaks=blog_line_breaks)
+            )
+
+    def test_callable_macros(self):
+        with self.assertRaises(TypeError):
+            Creole2HtmlConverter(macros=lambda: None)
+
+    def test_reuse_with_toc(self):
+        macros = {"html": example_macros.html}
+        conv = Creole2HtmlConverter(macros=macros)
+        self.assertEqual(conv(TOC_DOCUMENT), TOC_HTML)
+        self.assertEqual(conv(TOC_DOCUMENT), TOC_HTML)
+
+        # The given macros would not be changed:
+        self.assertEqual(macros, {"html": example_macros.html})
+
+    def test_threads(self):
+        conv = Creole2HtmlConverter(macros=test_macros)
+        documents = [
+            f"= Page {no}\n\n<<toc>>\n\n**bold {no}** <<unittest_macro1 no={no}>>\n== sub {no}"
+            for no in range(50)
+        ]
+        expected = [creole2html(document, macros=test_macros) for document in documents]
+
+        with ThreadPoolExecutor(max_workers=8) as executor:
+            results = list(executor.map(conv, documents * 4))
+
+        self.assertEqual(results, expected * 4)
+
+
+class TestStreaming(BaseCreoleTest):
+    MARKUP = """
+        = Headline
+
+        A paragraph
+        with **two** lines.\\\\
+
+        * item 1
+        ** item 1.1
+        * item 2
+        ----
+        |= head |= head |
+        | cell  | cell  |
+        {{{
+        preformatted
+        }}}
+        <<unittest_macro1 foo="bar">>
+
+        <<unittest_macro2 char="|">>
+        a b c
+        <</unittest_macro2>>
+        last line
+    """
+
+    def test_same_as_creole2html(self):
+        markup = self._prepare_text(self.MARKUP)
+        for blog_line_breaks in (True, False):
+            chunks = list(iter_creole2html(
+                markup, macros=test_macros, blog_line_breaks=blog_line_breaks
+            ))
+            self.assertGreater(len(chunks), 3)
+            self.assertEqual(
+                "".join(chunks),
+                creole2html(markup, macros=test_macros, blog_line_breaks=blog_line_breaks)
+            )
+
+    def test_iter_blocks(self):
+        markup = self._prepare_text(self.MARKUP)
+        parser = CreoleParser(markup)
+        kinds = []
+        for node in parser.iter_blocks():
+            # Only the current top-level block is in the tree:
+            self.assertLessEqual(len(parser.root.children), 1)
+            self.assertIs(node.parent, parser.root)
+            kinds.append(node.kind)
+
+        self.assertEqual(kinds, [
+            'header', 'line', 'paragraph', 'line', 'bullet_list', 'separator',
+            'table', 'pre_block', 'paragraph', 'line', 'macro_block', 'paragraph',
+        ])
+
+    def test_empty(self):
+        self.assertEqual(list(iter_creole2html("")), [])
+        self.assertEqual(list(iter_creole2html("\n \n")), [])
+
+    def test_toc_fallback(self):
+        conv = Creole2HtmlConverter()
+        chunks = list(conv.iter_convert(TOC_DOCUMENT))
+        self.assertEqual(chunks, [TOC_HTML])
+
+
+class TestIncremental(BaseCreoleTest):
+    def assert_convert(self, conv, markup, hits, misses):
+        old_hits, old_misses = conv.hits, conv.misses
+        self.assertEqual(conv(markup), creole2html(markup, macros=test_macros))
+        self.assertEqual(conv.hits - old_hits, hits, "hits")
+        self.assertEqual(conv.misses - old_misses, misses, "misses")
+
+    def test_only_changed_blocks(self):
+        conv = IncrementalCreole2HtmlConverter(macros=test_macros)
+        paragraphs = [f"paragraph **{no}**\nsecond line" for no in range(10)]
+        self.assert_convert(conv, "\n\n".join(paragraphs), hits=0, misses=10)
+        self.assert_convert(conv, "\n\n".join(paragraphs), hits=10, misses=0)
+
+        paragraphs[5] = "changed"
+        self.assert_convert(conv, "\n\n".join(paragraphs), hits=9, misses=1)
+
+        # insert a new paragraph:
+        paragraphs.insert(2, "new paragraph")
+        self.assert_convert(conv, "\n\n".join(paragraphs), hits=10, misses=1)
+
+    def test_last_block(self):
+        conv = IncrementalCreole2HtmlConverter()
+        # The "\\\\" line break would be removed before the next block:
+        self.assert_convert(conv, "one\\\\\n\ntwo\\\\", hits=0, misses=2)
+        self.assert_convert(conv, "two\\\\\n\none\\\\", hits=0, misses=2)
+        self.assert_convert(conv, "one\\\\\n\none\\\\", hits=2, misses=0)
+
+    def test_macros_not_cached(self):
+        conv = IncrementalCreole2HtmlConverter(macros=test_macros)
+        markup = "text\n\n<<unittest_macro1 foo=1>>\n\n<<unittest_macro2 char=\"|\">>a b<</unittest_macro2>>"
+        self.assert_convert(conv, markup, hits=0, misses=3)
+        self.assert_convert(conv, markup, hits=1, misses=2)
+
+    def test_toc(self):
+        conv = IncrementalCreole2HtmlConverter()
+        self.assert_convert(conv, TOC_DOCUMENT, hits=0, misses=0)
+        self.assertEqual(conv(TOC_DOCUMENT), TOC_HTML)
+
+    def test_max_blocks(self):
+        conv = IncrementalCreole2HtmlConverter(max_blocks=2)
+        self.assert_convert(conv, "one\n\ntwo", hits=0, misses=2)
+        self.assert_convert(conv, "one\n\ntwo", hits=2, misses=0)
+        self.assert_convert(conv, "three\n\nfour", hits=0, misses=2)
+        self.assertEqual(len(conv._cache), 2)
+        self.assert_convert(conv, "one\n\ntwo", hits=0, misses=2)
+
+        conv.clear()
+        self.assertEqual((conv.hits, conv.misses), (0, 0))
+        self.assertEqual(len(conv._cache), 0)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -459,9 +459,9 @@ class TestCreole2htmlMarkup(BaseCreoleTest):
             = Headline
         """, """
             <ul>
-                <li><a href="#Headline">Headline</a></li>
+                <li><a href="#headline">Headline</a></li>
             </ul>
-            <a name="Headline"><h1>Headline</h1></a>
+            <a name="headline"><h1>Headline</h1></a>
         """)
 
     def test_toc_more_headlines(self):
@@ -479,23 +479,23 @@ class TestCreole2htmlMarkup(BaseCreoleTest):
             <p>Between text and toc must be a newline.</p>
 
             <ul>
-                <li><a href="#Headline 1">Headline 1</a></li>
+                <li><a href="#headline-1">Headline 1</a></li>
                 <ul>
-                    <li><a href="#Sub-Headline 1.1">Sub-Headline 1.1</a></li>
-                    <li><a href="#Sub-Headline 1.2">Sub-Headline 1.2</a></li>
+                    <li><a href="#sub-headline-1.1">Sub-Headline 1.1</a></li>
+                    <li><a href="#sub-headline-1.2">Sub-Headline 1.2</a></li>
                 </ul>
-                <li><a href="#Headline 2">Headline 2</a></li>
+                <li><a href="#headline-2">Headline 2</a></li>
                 <ul>
-                    <li><a href="#Sub-Headline 2.1">Sub-Headline 2.1</a></li>
-                    <li><a href="#Sub-Headline 2.2">Sub-Headline 2.2</a></li>
+                    <li><a href="#sub-headline-2.1">Sub-Headline 2.1</a></li>
+                    <li><a href="#sub-headline-2.2">Sub-Headline 2.2</a></li>
                 </ul>
             </ul>
-            <a name="Headline 1"><h1>Headline 1</h1></a>
-            <a name="Sub-Headline 1.1"><h2>Sub-Headline 1.1</h2></a>
-            <a name="Sub-Headline 1.2"><h2>Sub-Headline 1.2</h2></a>
-            <a name="Headline 2"><h1>Headline 2</h1></a>
-            <a name="Sub-Headline 2.1"><h2>Sub-Headline 2.1</h2></a>
-            <a name="Sub-Headline 2.2"><h2>Sub-Headline 2.2</h2></a>
+            <a name="headline-1"><h1>Headline 1</h1></a>
+            <a name="sub-headline-1.1"><h2>Sub-Headline 1.1</h2></a>
+            <a name="sub-headline-1.2"><h2>Sub-Headline 1.2</h2></a>
+            <a name="headline-2"><h1>Headline 2</h1></a>
+            <a name="sub-headline-2.1"><h2>Sub-Headline 2.1</h2></a>
+            <a name="sub-headline-2.2"><h2>Sub-Headline 2.2</h2></a>
         """)
 
     def test_toc_chaotic_headlines(self):
@@ -508,25 +508,25 @@ class TestCreole2htmlMarkup(BaseCreoleTest):
             = level 1
         """, """
             <ul>
-                <li><a href="#level 1">level 1</a></li>
+                <li><a href="#level-1">level 1</a></li>
                 <ul>
                     <ul>
-                        <li><a href="#level 3">level 3</a></li>
+                        <li><a href="#level-3">level 3</a></li>
                     </ul>
-                    <li><a href="#level 2">level 2</a></li>
+                    <li><a href="#level-2">level 2</a></li>
                     <ul>
                         <ul>
-                            <li><a href="#level 4">level 4</a></li>
+                            <li><a href="#level-4">level 4</a></li>
                         </ul>
                     </ul>
                 </ul>
-                <li><a href="#level 1">level 1</a></li>
+                <li><a href="#level-1-1">level 1</a></li>
             </ul>
-            <a name="level 1"><h1>level 1</h1></a>
-            <a name="level 3"><h3>level 3</h3></a>
-            <a name="level 2"><h2>level 2</h2></a>
-            <a name="level 4"><h4>level 4</h4></a>
-            <a name="level 1"><h1>level 1</h1></a>
+            <a name="level-1"><h1>level 1</h1></a>
+            <a name="level-3"><h3>level 3</h3></a>
+            <a name="level-2"><h2>level 2</h2></a>
+            <a name="level-4"><h4>level 4</h4></a>
+            <a name="level-1-1"><h1>level 1</h1></a>
         """)
 
     def test_toc_depth_1(self):
@@ -543,18 +543,18 @@ class TestCreole2htmlMarkup(BaseCreoleTest):
             === Sub-Sub-Headline 2.2.1
         """, """
             <ul>
-                <li><a href="#Headline 1">Headline 1</a></li>
-                <li><a href="#Headline 2">Headline 2</a></li>
+                <li><a href="#headline-1">Headline 1</a></li>
+                <li><a href="#headline-2">Headline 2</a></li>
             </ul>
-            <a name="Headline 1"><h1>Headline 1</h1></a>
-            <a name="Sub-Headline 1.1"><h2>Sub-Headline 1.1</h2></a>
-            <a name="Sub-Sub-Headline 1.1.1"><h3>Sub-Sub-Headline 1.1.1</h3></a>
-            <a name="Sub-Sub-Headline 1.1.2"><h3>Sub-Sub-Headline 1.1.2</h3></a>
-            <a name="Sub-Headline 1.2"><h2>Sub-Headline 1.2</h2></a>
-            <a name="Headline 2"><h1>Headline 2</h1></a>
-            <a name="Sub-Headline 2.1"><h2>Sub-Headline 2.1</h2></a>
-            <a name="Sub-Headline 2.2"><h2>Sub-Headline 2.2</h2></a>
-            <a name="Sub-Sub-Headline 2.2.1"><h3>Sub-Sub-Headline 2.2.1</h3></a>
+            <a name="headline-1"><h1>Headline 1</h1></a>
+            <a name="sub-headline-1.1"><h2>Sub-Headline 1.1</h2></a>
+            <a name="sub-sub-headline-1.1.1"><h3>Sub-Sub-Headline 1.1.1</h3></a>
+            <a name="sub-sub-headline-1.1.2"><h3>Sub-Sub-Headline 1.1.2</h3></a>
+            <a name="sub-headline-1.2"><h2>Sub-Headline 1.2</h2></a>
+            <a name="headline-2"><h1>Headline 2</h1></a>
+            <a name="sub-headline-2.1"><h2>Sub-Headline 2.1</h2></a>
+            <a name="sub-headline-2.2"><h2>Sub-Headline 2.2</h2></a>
+            <a name="sub-sub-headline-2.2.1"><h3>Sub-Sub-Headline 2.2.1</h3></a>
         """)
 
     def test_toc_depth_2(self):
@@ -571,26 +571,26 @@ class TestCreole2htmlMarkup(BaseCreoleTest):
             === Sub-Sub-Headline 2.2.1
         """, """
             <ul>
-                <li><a href="#Headline 1">Headline 1</a></li>
+                <li><a href="#headline-1">Headline 1</a></li>
                 <ul>
-                    <li><a href="#Sub-Headline 1.1">Sub-Headline 1.1</a></li>
-                    <li><a href="#Sub-Headline 1.2">Sub-Headline 1.2</a></li>
+                    <li><a href="#sub-headline-1.1">Sub-Headline 1.1</a></li>
+                    <li><a href="#sub-headline-1.2">Sub-Headline 1.2</a></li>
                 </ul>
-                <li><a href="#Headline 2">Headline 2</a></li>
+                <li><a href="#headline-2">Headline 2</a></li>
                 <ul>
-                    <li><a href="#Sub-Headline 2.1">Sub-Headline 2.1</a></li>
-                    <li><a href="#Sub-Headline 2.2">Sub-Headline 2.2</a></li>
+                    <li><a href="#sub-headline-2.1">Sub-Headline 2.1</a></li>
+                    <li><a href="#sub-headline-2.2">Sub-Headline 2.2</a></li>
                 </ul>
             </ul>
-            <a name="Headline 1"><h1>Headline 1</h1></a>
-            <a name="Sub-Headline 1.1"><h2>Sub-Headline 1.1</h2></a>
-            <a name="Sub-Sub-Headline 1.1.1"><h3>Sub-Sub-Headline 1.1.1</h3></a>
-            <a name="Sub-Sub-Headline 1.1.2"><h3>Sub-Sub-Headline 1.1.2</h3></a>
-            <a name="Sub-Headline 1.2"><h2>Sub-Headline 1.2</h2></a>
-            <a name="Headline 2"><h1>Headline 2</h1></a>
-            <a name="Sub-Headline 2.1"><h2>Sub-Headline 2.1</h2></a>
-            <a name="Sub-Headline 2.2"><h2>Sub-Headline 2.2</h2></a>
-            <a name="Sub-Sub-Headline 2.2.1"><h3>Sub-Sub-Headline 2.2.1</h3></a>
+            <a name="headline-1"><h1>Headline 1</h1></a>
+            <a name="sub-headline-1.1"><h2>Sub-Headline 1.1</h2></a>
+            <a name="sub-sub-headline-1.1.1"><h3>Sub-Sub-Headline 1.1.1</h3></a>
+            <a name="sub-sub-headline-1.1.2"><h3>Sub-Sub-Headline 1.1.2</h3></a>
+            <a name="sub-headline-1.2"><h2>Sub-Headline 1.2</h2></a>
+            <a name="headline-2"><h1>Headline 2</h1></a>
+            <a name="sub-headline-2.1"><h2>Sub-Headline 2.1</h2></a>
+            <a name="sub-headline-2.2"><h2>Sub-Headline 2.2</h2></a>
+            <a name="sub-sub-headline-2.2.1"><h3>Sub-Sub-Headline 2.2.1</h3></a>
         """)
 
     def test_toc_depth_3(self):
@@ -607,33 +607,33 @@ class TestCreole2htmlMarkup(BaseCreoleTest):
             === Sub-Sub-Headline 2.2.1
         """, """
             <ul>
-                <li><a href="#Headline 1">Headline 1</a></li>
+                <li><a href="#headline-1">Headline 1</a></li>
                 <ul>
-                    <li><a href="#Sub-Headline 1.1">Sub-Headline 1.1</a></li>
+                    <li><a href="#sub-headline-1.1">Sub-Headline 1.1</a></li>
                     <ul>
-                        <li><a href="#Sub-Sub-Headline 1.1.1">Sub-Sub-Headline 1.1.1</a></li>
-                        <li><a href="#Sub-Sub-Headline 1.1.2">Sub-Sub-Headline 1.1.2</a></li>
+                        <li><a href="#sub-sub-headline-1.1.1">Sub-Sub-Headline 1.1.1</a></li>
+                        <li><a href="#sub-sub-headline-1.1.2">Sub-Sub-Headline 1.1.2</a></li>
                     </ul>
-                    <li><a href="#Sub-Headline 1.2">Sub-Headline 1.2</a></li>
+                    <li><a href="#sub-headline-1.2">Sub-Headline 1.2</a></li>
                 </ul>
-                <li><a href="#Headline 2">Headline 2</a></li>
+                <li><a href="#headline-2">Headline 2</a></li>
                 <ul>
-                    <li><a href="#Sub-Headline 2.1">Sub-Headline 2.1</a></li>
-                    <li><a href="#Sub-Headline 2.2">Sub-Headline 2.2</a></li>
+                    <li><a href="#sub-headline-2.1">Sub-Headline 2.1</a></li>
+                    <li><a href="#sub-headline-2.2">Sub-Headline 2.2</a></li>
                     <ul>
-                        <li><a href="#Sub-Sub-Headline 2.2.1">Sub-Sub-Headline 2.2.1</a></li>
+                        <li><a href="#sub-sub-headline-2.2.1">Sub-Sub-Headline 2.2.1</a></li>
                     </ul>
                 </ul>
             </ul>
-            <a name="Headline 1"><h1>Headline 1</h1></a>
-            <a name="Sub-Headline 1.1"><h2>Sub-Headline 1.1</h2></a>
-            <a name="Sub-Sub-Headline 1.1.1"><h3>Sub-Sub-Headline 1.1.1</h3></a>
-            <a name="Sub-Sub-Headline 1.1.2"><h3>Sub-Sub-Headline 1.1.2</h3></a>
-            <a name="Sub-Headline 1.2"><h2>Sub-Headline 1.2</h2></a>
-            <a name="Headline 2"><h1>Headline 2</h1></a>
-            <a name="Sub-Headline 2.1"><h2>Sub-Headline 2.1</h2></a>
-            <a name="Sub-Headline 2.2"><h2>Sub-Headline 2.2</h2></a>
-            <a name="Sub-Sub-Headline 2.2.1"><h3>Sub-Sub-Headline 2.2.1</h3></a>
+            <a name="headline-1"><h1>Headline 1</h1></a>
+            <a name="sub-headline-1.1"><h2>Sub-Headline 1.1</h2></a>
+            <a name="sub-sub-headline-1.1.1"><h3>Sub-Sub-Headline 1.1.1</h3></a>
+            <a name="sub-sub-headline-1.1.2"><h3>Sub-Sub-Headline 1.1.2</h3></a>
+            <a name="sub-headline-1.2"><h2>Sub-Headline 1.2</h2></a>
+            <a name="headline-2"><h1>Headline 2</h1></a>
+            <a name="sub-headline-2.1"><h2>Sub-Headline 2.1</h2></a>
+            <a name="sub-headline-2.2"><h2>Sub-Headline 2.2</h2></a>
+            <a name="sub-sub-headline-2.2.1"><h3>Sub-Sub-Headline 2.2.1</h3></a>
         """)
 
     def test_toc_with_no_toc(self):
@@ -645,9 +645,9 @@ class TestCreole2htmlMarkup(BaseCreoleTest):
             """,
             """
             <ul>
-                <li><a href="#This is the Headline">This is the Headline</a></li>
+                <li><a href="#this-is-the-headline">This is the Headline</a></li>
             </ul>
-            <a name="This is the Headline"><h1>This is the Headline</h1></a>
+            <a name="this-is-the-headline"><h1>This is the Headline</h1></a>
             <p>Use <code>&lt;&lt;toc&gt;&gt;</code> to insert a table of contents.</p>
             """,
         )
@@ -676,16 +676,16 @@ class TestCreole2htmlMarkup(BaseCreoleTest):
             <p>and onle the first:</p>
 
             <ul>
-                <li><a href="#Headline">Headline</a></li>
+                <li><a href="#headline">Headline</a></li>
                 <ul>
-                    <li><a href="#Sub-Headline">Sub-Headline</a></li>
+                    <li><a href="#sub-headline">Sub-Headline</a></li>
                 </ul>
             </ul>
 
             <p>&lt;&lt;toc&gt;&gt;<br />
             &lt;&lt;toc&gt;&gt;</p>
-            <a name="Headline"><h1>Headline</h1></a>
-            <a name="Sub-Headline"><h2>Sub-Headline</h2></a>
+            <a name="headline"><h1>Headline</h1></a>
+            <a name="sub-headline"><h2>Sub-Headline</h2></a>
         """)
 
     def test_toc_headline_before_toc(self):
@@ -698,18 +698,54 @@ class TestCreole2htmlMarkup(BaseCreoleTest):
             ok?
         """, """
             <a name="headline"><h1>headline</h1></a>
-            <a name="sub headline"><h2>sub headline</h2></a>
+            <a name="sub-headline"><h2>sub headline</h2></a>
 
             <ul>
                 <li><a href="#headline">headline</a></li>
                 <ul>
-                    <li><a href="#sub headline">sub headline</a></li>
+                    <li><a href="#sub-headline">sub headline</a></li>
                 </ul>
             </ul>
 
             <p>ok?</p>
         """)
 
+    def test_toc_depth_headline_before_toc(self):
+        self.assert_creole2html(r"""
+            == sub headline
+            <<toc depth=1>>
+            = headline
+        """, """
+            <a name="sub-headline"><h2>sub headline</h2></a>
+            <ul>
+                <li><a href="#headline">headline</a></li>
+            </ul>
+            <a name="headline"><h1>headline</h1></a>
+        """)
+
+    def test_toc_unique_anchors(self):
+        self.assert_creole2html(r"""
+            <<toc>>
+            = A & <B>
+            = a b
+            = A b-1
+            = A b
+            = !!
+        """, """
+            <ul>
+                <li><a href="#a-b">A &amp; &lt;B&gt;</a></li>
+                <li><a href="#a-b-1">a b</a></li>
+                <li><a href="#a-b-1-1">A b-1</a></li>
+                <li><a href="#a-b-2">A b</a></li>
+                <li><a href="#section">!!</a></li>
+            </ul>
+            <a name="a-b"><h1>A &amp; &lt;B&gt;</h1></a>
+            <a name="a-b-1"><h1>a b</h1></a>
+            <a name="a-b-1-1"><h1>A b-1</h1></a>
+            <a name="a-b-2"><h1>A b</h1></a>
+            <a name="section"><h1>!!</h1></a>
+        """)
+
     def test_image(self):
         """ test image tag with different picture text """
         self.assert_creole2html(r"""
@@ -722,6 +758,15 @@ class TestCreole2htmlMarkup(BaseCreoleTest):
             <img src="/path1/path2/foobar3.jpg" title="foobar3.jpg" alt="foobar3.jpg" /></p>
         """)
 
+    def test_image_escape_attributes(self):
+        self.assert_creole2html(r"""
+            {{/image.jpg|"x" & <b>}}
+            [[http://domain.tld/?q="x"&a=<b>|link]]
+        """, """
+            <p><img src="/image.jpg" title="&quot;x&quot; &amp; &lt;b&gt;" alt="&quot;x&quot; &amp; &lt;b&gt;" /><br />
+            <a href="http://domain.tld/?q=&quot;x&quot;&amp;a=&lt;b&gt;">link</a></p>
+        """)
+
     def test_image_with_size(self):
         """ test image tag with size dimention (good and bad) """
         self.assert_creole2html(r"""
@@ -0,0 +1,305 @@
+"""
+    CreoleParser unittest
+    ~~~~~~~~~~~~~~~~~~~~~
+
+    Tests around the document tree created by the creole parser.
+
+    :copyleft: 2026 by python-creole team, see AUTHORS for more details.
+    :license: GNU GPL v3 or above, see LICENSE for more details.
+"""
+
+
+import unittest
+
+from creole.benchmarks.long_paragraph import long_paragraph
+from creole.parser.creol2html_parser import CreoleParser
+from creole.parser.creol2html_rules import BlockRules
+from creole.shared.document_tree import DocNode
+
+
+class CountingParser(CreoleParser):
+    """ Counts the text parts and the characters joined into text nodes """
+
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.added_parts = 0
+        self.joined_chars = 0
+
+    def _add_text(self, text):
+        self.added_parts += 1
+        super()._add_text(text)
+
+    def _close_text(self):
+        self.joined_chars += sum(len(part) for part in self.text_parts)
+        super()._close_text()
+
+
+def tree2list(node):
+    """ flat list of (level, kind, content) of all nodes in the tree """
+    result = []
+
+    def walk(node, depth):
+        for child in node.children:
+            result.append((depth, child.kind, child.content))
+            walk(child, depth + 1)
+    walk(node, 0)
+    return result
+
+
+class TestCreoleParser(unittest.TestCase):
+    def assert_tree(self, markup, reference, **parser_kwargs):
+        document = CreoleParser(markup, **parser_kwargs).parse()
+        self.assertEqual(tree2list(document), reference)
+
+    def test_plain_text_is_one_text_node(self):
+        self.assert_tree(
+            "Only plain text, with some: special chars! (and a \\ backslash)",
+            [
+                (0, 'paragraph', None),
+                (1, 'text', "Only plain text, with some: special chars! (and a \\ backslash)"),
+            ]
+        )
+
+    def test_markup_chars_without_markup(self):
+        self.assert_tree(
+            "a*b/c#d^e,f_g-h~ [x] {y} <z>",
+            [
+                (0, 'paragraph', None),
+                (1, 'text', "a*b/c#d^e,f_g-h~ [x] {y} <z>"),
+            ]
+        )
+
+    def test_text_around_markup(self):
+        self.assert_tree(
+            "one **two** three  http://four.tld/ ~http://five.tld/",
+            [
+                (0, 'paragraph', None),
+                (1, 'text', "one "),
+                (1, 'strong', None),
+                (2, 'text', "two"),
+                (1, 'text', " three  "),
+                (1, 'link', "http://four.tld/"),
+                (2, 'text', "http://four.tld/"),
+                (1, 'text', " http://five.tld/"),
+            ]
+        )
+
+
+class TestBlockRulesCache(unittest.TestCase):
+    def test_block_re_compiled_once(self):
+        parser1 = CreoleParser("one")
+        parser2 = CreoleParser("two", block_rules=BlockRules())
+        self.assertIs(parser1.block_re, parser2.block_re)
+
+        parser3 = CreoleParser("three", blog_line_breaks=False)
+        self.assertIsNot(parser1.block_re, parser3.block_re)
+        self.assertIs(parser3.block_re, BlockRules(blog_line_breaks=False).compile())
+
+    def test_custom_block_rules(self):
+        class NoTableRules(BlockRules):
+            def __init__(self, *args, **kwargs):
+                super().__init__(*args, **kwargs)
+                self.rules = tuple(rule for rule in self.rules if rule is not self.table)
+
+        block_rules = NoTableRules()
+        parser = CreoleParser("|no|table|", block_rules=block_rules)
+        self.assertIs(parser.block_re, block_rules.compile())
+        self.assertIsNot(parser.block_re, BlockRules().compile())
+
+        document = parser.parse()
+        self.assertEqual(tree2list(document), [
+            (0, 'paragraph', None),
+            (1, 'text', "|no|table|"),
+        ])
+
+
+class TestTextNodes(unittest.TestCase):
+    def test_text_parts(self):
+        parser = CreoleParser("one ~**two~** three http://four ~http://five")
+        document = parser.parse()
+        self.assertEqual(tree2list(document), [
+            (0, 'paragraph', None),
+            (1, 'text', "one **two** three "),
+            (1, 'link', "http://four"),
+            (2, 'text', "http://four"),
+            (1, 'text', " http://five"),
+        ])
+        self.assertIsNone(parser.text)
+        self.assertEqual(parser.text_parts, [])
+
+    def test_long_paragraph(self):
+        text = long_paragraph(size=1024 * 1024)
+        document = CreoleParser(text).parse()
+        self.assertEqual(tree2list(document), [
+            (0, 'paragraph', None),
+            (1, 'text', text),
+        ])
+
+    def test_linear_parse(self):
+        # Count instead of measuring the time (see benchmarks.long_paragraph):
+        # The text parts grow linear with the size and every character is
+        # copied only once into the text node.
+        for size in (64 * 1024, 8 * 64 * 1024):
+            parser = CountingParser(long_paragraph(size))
+            parser.parse()
+            self.assertLessEqual(parser.added_parts, size // 2)
+            self.assertEqual(parser.joined_chars, size)
+
+
+class TestDocNode(unittest.TestCase):
+    def test_slots(self):
+        node = DocNode("paragraph")
+        self.assertFalse(hasattr(node, "__dict__"))
+        with self.assertRaises(AttributeError):
+            node.foo = "bar"
+
+    def test_lazy_children_and_attrs(self):
+        node = DocNode("paragraph")
+        self.assertIsNone(node._children)
+        self.assertIsNone(node._attrs)
+
+        # Reading doesn't create the containers:
+        self.assertEqual(node.children, ())
+        self.assertEqual(dict(node.attrs), {})
+        with self.assertRaisesRegex(TypeError, r"use DocNode\.set_attr\(\)"):
+            node.attrs["class"] = "bar"
+        with self.assertRaisesRegex(TypeError, r"use DocNode\.add_child\(\)"):
+            node.children.append(DocNode("text"))
+        self.assertIsNone(node._children)
+        self.assertIsNone(node._attrs)
+
+        child = DocNode("text", parent=node, content="foo")
+        self.assertEqual(node.children, [child])
+        self.assertIsNone(child._children)
+
+        node.set_attr("class", "bar")
+        self.assertEqual(node.attrs, {"class": "bar"})
+
+    def test_attrs_are_copied(self):
+        attrs = {"href": "/"}
+        node = DocNode("link", attrs=attrs)
+        node.attrs["href"] = "/foo/"
+        self.assertEqual(attrs, {"href": "/"})
+
+
+class TestSourceSpans(unittest.TestCase):
+    def get_sources(self, raw, **parser_kwargs):
+        """
+        returns (kind, source) for all nodes, the source is the part of raw
+        given by the span of the node.
+        """
+        root = CreoleParser(raw, track_spans=True, **parser_kwargs).parse()
+        sources = []
+        stack = [root]
+        while stack:
+            node = stack.pop()
+            sources.append((node.kind, raw[node.start:node.end]))
+            stack.extend(reversed(node.children))
+        return sources
+
+    def test_inline(self):
+        self.assertEqual(
+            self.get_sources("Some **bold //x//** and [[url| a link]]."),
+            [
+                ("document", "Some **bold //x//** and [[url| a link]]."),
+                ("paragraph", "Some **bold //x//** and [[url| a link]]."),
+                ("text", "Some "),
+                ("strong", "**bold //x//**"),
+                ("text", "bold "),
+                ("emphasis", "//x//"),
+                ("text", "x"),
+                ("text", " and "),
+                ("link", "[[url| a link]]"),
+                ("text", "a link"),
+                ("text", "."),
+            ]
+        )
+
+    def test_blocks(self):
+        raw = "= Head =\n* one\n** two\n\n|= h | c |\n{{{\npre\n}}}"
+        self.assertEqual(
+            self.get_sources(raw),
+            [
+                ("document", raw),
+                ("header", "= Head ="),
+                ("bullet_list", "* one\n** two"),
+                ("list_item", "* one\n** two"),
+                ("text", "one"),
+                ("bullet_list", "** two"),
+                ("list_item", "** two"),
+                ("text", "two"),
+                ("line", ""),
+                ("table", "|= h | c |"),
+                ("table_row", "|= h | c |"),
+                ("table_head", "|= h "),
+                ("text", "h"),
+                ("table_cell", "| c "),
+                ("text", "c"),
+                ("pre_block", "{{{\npre\n}}}"),
+            ]
+        )
+
+    def test_line_breaks(self):
+        self.assertEqual(
+            self.get_sources("line one\r\n**line two**\r\n"),
+            [
+                ("document", "line one\r\n**line two**\r\n"),
+                ("paragraph", "line one\r\n**line two**"),
+                ("text", "line one"),
+                ("break", "\r\n"),
+                ("strong", "**line two**"),
+                ("text", "line two"),
+                ("line", ""),
+            ]
+        )
+
+    def test_iter_blocks(self):
+        raw = "= Head =\r\n\r\nparagraph"
+        blocks = CreoleParser(raw, track_spans=True).iter_blocks()
+        self.assertEqual(
+            [(node.kind, raw[node.start:node.end]) for node in blocks],
+            [("header", "= Head ="), ("line", ""), ("paragraph", "paragraph")]
+        )
+
+    def test_parser_subclass(self):
+        class MyParser(CreoleParser):
+            def __init__(self, raw, **kwargs):
+                super().__init__(raw, **kwargs)
+                self.headers = 0
+
+            def _head_repl(self, match):
+                self.headers += 1
+                super()._head_repl(match)
+
+        parser = MyParser("= Head =\ntext", track_spans=True)
+        self.assertIs(type(parser), MyParser)
+        root = parser.parse()
+        self.assertEqual(parser.headers, 1)
+        self.assertEqual([node.span for node in root.children], [(0, 8), (9, 13)])
+
+    def test_parse_matches(self):
+        raw = "= Head =\r\ntext"
+        parser = CreoleParser(raw, track_spans=True)
+        root = parser.parse_matches(parser.block_re.finditer(parser.get_text()))
+        self.assertEqual(root.span, (0, len(raw)))
+        self.assertEqual([raw[node.start:node.end] for node in root.children], ["= Head =", "text"])
+
+    def test_iter_blocks_crlf(self):
+        raw = "\r\n\r\n".join(f"paragraph {no}\r\nline" for no in range(3))
+        blocks = CreoleParser(raw, track_spans=True).iter_blocks()
+        self.assertEqual(
+            [raw[node.start:node.end] for node in blocks if node.kind == "paragraph"],
+            [f"paragraph {no}\r\nline" for no in range(3)]
+        )
+
+    def test_not_tracked(self):
+        root = CreoleParser("= Head =\n**text**").parse()
+        stack = [root]
+        while stack:
+            node = stack.pop()
+            self.assertIsNone(node.span)
+            stack.extend(node.children)
+
+
+if __name__ == '__main__':
+    unittest.main()
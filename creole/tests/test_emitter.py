@@ -0,0 +1,108 @@
+"""
+    emitter tests
+    ~~~~~~~~~~~~~
+
+    The emitters use a explicit stack and not recursion.
+
+    :copyleft: 2026 by python-creole team, see AUTHORS for more details.
+    :license: GNU GPL v3 or above, see LICENSE for more details.
+"""
+
+
+import sys
+import unittest
+
+from creole import html2creole, html2markdown, html2rest, html2textile
+from creole.benchmarks.deep_nesting import nested_html, nested_typeface_tree
+from creole.emitter.creol2html_emitter import HtmlEmitter
+from creole.emitter.html2creole_emitter import CreoleEmitter
+from creole.emitter.html2markdown_emitter import MarkdownEmitter
+from creole.parser.html_parser import HtmlParser
+from creole.shared.unknown_tags import escape_unknown_nodes
+
+
+DEPTH = 10000
+
+
+class TestDeepNesting(unittest.TestCase):
+    def setUp(self):
+        self.assertGreater(DEPTH, sys.getrecursionlimit())
+
+    def test_creole2html(self):
+        html = HtmlEmitter(nested_typeface_tree(DEPTH)).emit()
+        self.assertTrue(html.startswith("<p><strong><i><strong><i>"))
+        self.assertIn("<strong><i>deep</i></strong>", html)
+        self.assertTrue(html.endswith("</strong></i></strong></p>"))
+        self.assertEqual(html.count("<strong>"), DEPTH // 2)
+
+    def test_html2markup(self):
+        html = nested_html(DEPTH)
+        for html2markup in (html2creole, html2rest, html2textile, html2markdown):
+            self.assertEqual(html2markup(html), "deep")
+
+    def test_nested_lists(self):
+        html = "<ul><li>" * 2000 + "deep" + "</li></ul>" * 2000
+        lines = html2creole(html).splitlines()
+        self.assertEqual(len(lines), 2000)
+        self.assertEqual(lines[0], "* ")
+        self.assertEqual(lines[-1], "*" * 2000 + " deep")
+
+
+class TestEmitChildren(unittest.TestCase):
+    """
+    emit_children() still works in *_emit methods and unknown_emit
+    callables, that doesn't use the generator protocol.
+    """
+
+    def test_unknown_emit(self):
+        def unknown_emit(emitter, node):
+            return f"[{node.kind}:{emitter.emit_children(node)}]"
+
+        creole = html2creole("<p><foo>a <strong>b</strong></foo></p>", unknown_emit=unknown_emit)
+        self.assertEqual(creole, "[foo:a **b**]")
+
+    def test_unknown_emit_uses_generator(self):
+        def unknown_emit(emitter, node):
+            if node.kind == "bar":
+                return "BAR"
+            content = yield from escape_unknown_nodes(emitter, node)
+            return content.upper()
+
+        creole = html2creole("<p><foo>a <bar>b</bar></foo></p>", unknown_emit=unknown_emit)
+        self.assertEqual(creole, "&LT;FOO&GT;A BAR&LT;/FOO&GT;")
+
+    def test_emit_method(self):
+        class UpperEmitter(CreoleEmitter):
+            def strong_emit(self, node):
+                return self.emit_children(node).upper()
+
+        document = HtmlParser().feed("<p>a <strong>b <i>c</i></strong></p>")
+        self.assertEqual(UpperEmitter(document).emit(), "a B //C//")
+
+
+class TestEmitMethods(unittest.TestCase):
+    def test_dispatch_table(self):
+        self.assertIs(CreoleEmitter._emit_methods["strong"], CreoleEmitter.strong_emit)
+        self.assertIs(CreoleEmitter._emit_methods["b"], CreoleEmitter.strong_emit)
+        self.assertIs(HtmlEmitter._emit_methods["paragraph"], HtmlEmitter.paragraph_emit)
+        self.assertNotIn("foo", CreoleEmitter._emit_methods)
+
+    def test_dispatch_table_helpers(self):
+        # Helper methods are not used for nodes with the same kind:
+        self.assertNotIn("_list", CreoleEmitter._emit_methods)
+        self.assertNotIn("iter", HtmlEmitter._emit_methods)
+        self.assertNotIn("list", MarkdownEmitter._emit_methods)
+        self.assertIs(MarkdownEmitter._emit_methods["ul"], MarkdownEmitter.list_emit)
+
+    def test_type_check_in_debug_mode(self):
+        class WrongEmitter(CreoleEmitter):
+            def hr_emit(self, node):
+                return None
+
+        document = HtmlParser().feed("<hr />")
+        with self.assertRaises(AssertionError):
+            WrongEmitter(document, debug=True).emit()
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -201,6 +201,13 @@ class TestHtml2CreoleMarkup(BaseCreoleTest):
             <pre><code>&#x7B;% lucidTag RSS url="http url" %&#x7D;</code></pre>
         """)
 
+    def test_html5_and_unknown_entity_in_pre(self):
+        self.assert_html2creole2(
+            "{{{1\u00bd \u2242\u0338 &unknown;}}}",
+            "<pre>1&frac12; &NotEqualTilde; &unknown;</pre>",
+            debug=False,
+        )
+
     def test_unknown_entity(self):
         """
         Test a unknown html entity.
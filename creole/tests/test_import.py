@@ -0,0 +1,90 @@
+"""
+    unittest for the lazy imports
+    ~~~~~~~~~~~~~~~~~~~~~~~~~~~~~
+
+    :copyleft: 2026 by python-creole team, see AUTHORS for more details.
+    :license: GNU GPL v3 or above, see LICENSE for more details.
+"""
+
+
+import subprocess
+import sys
+import unittest
+
+import creole
+from creole.benchmarks.startup import import_times
+from creole.parser.creol2html_parser import CreoleParser
+
+
+# Imported on first use, not by "import creole":
+HEAVY_MODULES = (
+    "creole.converter",
+    "creole.parser.creol2html_parser",
+    "creole.parser.html_parser",
+    "creole.emitter.creol2html_emitter",
+    "creole.emitter.html2creole_emitter",
+    "creole.emitter.html2markdown_emitter",
+    "creole.emitter.html2rest_emitter",
+    "creole.emitter.html2textile_emitter",
+    "pygments",
+)
+
+
+class TestLazyImport(unittest.TestCase):
+    def get_modules(self, statement):
+        return {module_name for module_name, cumulative, level in import_times(statement)}
+
+    def assert_not_imported(self, statement, module_names):
+        modules = self.get_modules(statement)
+        for module_name in module_names:
+            self.assertNotIn(module_name, modules, f"{statement!r} imports {module_name!r}")
+
+    def test_import_creole(self):
+        self.assert_not_imported("import creole", HEAVY_MODULES)
+
+    def test_creole2html(self):
+        self.assert_not_imported("from creole import creole2html; creole2html('**x**')", (
+            "creole.parser.html_parser",
+            "creole.emitter.html2creole_emitter",
+            "pygments",
+            "xml.sax.saxutils",
+            "pprint",
+        ))
+
+    def get_sys_modules(self, statement):
+        """ sys.modules after the statement, in a new interpreter """
+        process = subprocess.run(
+            [sys.executable, "-c", f"import sys; {statement}; print('\\n'.join(sys.modules))"],
+            stdout=subprocess.PIPE,
+            universal_newlines=True,
+            check=True,
+        )
+        return set(process.stdout.splitlines())
+
+    def test_sys_modules(self):
+        # The import time depends on the machine, so check what is imported:
+        modules = self.get_sys_modules("import creole")
+        self.assertIn("creole", modules)
+        for module_name in HEAVY_MODULES:
+            self.assertNotIn(module_name, modules)
+
+    def test_cmdline(self):
+        # The bulk mode imports the batch module and multiprocessing on first use:
+        modules = self.get_sys_modules("import creole.cmdline")
+        self.assertIn("creole.cmdline", modules)
+        self.assertNotIn("creole.batch", modules)
+        self.assertNotIn("multiprocessing", modules)
+
+    def test_lazy_attributes(self):
+        self.assertIs(creole.CreoleParser, CreoleParser)
+        self.assertIn("CreoleParser", dir(creole))
+        self.assertIn("HtmlEmitter", dir(creole))
+        with self.assertRaises(AttributeError):
+            creole.DoesNotExist
+
+    def test_lazy_rules(self):
+        self.assertEqual(
+            CreoleParser.inline_re.pattern,
+            "|".join(creole.parser.creol2html_rules.INLINE_RULES)
+        )
+        self.assertIs(CreoleParser.inline_re, CreoleParser.inline_re)
@@ -0,0 +1,114 @@
+"""
+    unittest for creole.shared.macro_runner
+    ~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~
+
+    :copyleft: 2026 by python-creole team, see AUTHORS for more details.
+    :license: GNU GPL v3 or above, see LICENSE for more details.
+"""
+
+
+import unittest
+from io import StringIO
+from unittest import mock
+
+from creole.converter import Creole2HtmlConverter
+from creole.shared import example_macros
+from creole.shared.macro_runner import MacroRunner, default_runner, parse_macro_args, pure
+from creole.shared.utils import PYGMENTS
+
+
+CALLS = []
+
+
+@pure
+def pure_macro(text, prefix=""):
+    CALLS.append(text)
+    return f"<span>{prefix}{text}</span>"
+
+
+def impure_macro(text):
+    CALLS.append(text)
+    return f"<span>{len(CALLS)}</span>"
+
+
+def broken_macro(text):
+    raise RuntimeError("broken")
+
+
+MACROS = {"pure": pure_macro, "impure": impure_macro, "broken": broken_macro}
+
+
+class MacroRunnerTests(unittest.TestCase):
+    def setUp(self):
+        CALLS.clear()
+        self.runner = MacroRunner()
+        self.converter = Creole2HtmlConverter(
+            macros=MACROS, stderr=StringIO(), verbose=1, macro_runner=self.runner
+        )
+
+    def test_parse_macro_args(self):
+        self.assertEqual(parse_macro_args('a=1 b="x y"'), (("a", 1), ("b", "x y")))
+        self.assertIs(parse_macro_args('a=1 b="x y"'), parse_macro_args('a=1 b="x y"'))
+        with self.assertRaises(ValueError):
+            parse_macro_args('a="1')
+
+    def test_pure_macro_memoized(self):
+        markup = 'x <<pure>>foo<</pure>> <<pure prefix="#">>foo<</pure>>'
+        self.assertEqual(
+            self.converter(markup),
+            "<p>x <span>foo</span> <span>#foo</span></p>"
+        )
+        self.assertEqual(
+            self.converter(markup),
+            "<p>x <span>foo</span> <span>#foo</span></p>"
+        )
+        self.assertEqual(CALLS, ["foo", "foo"])  # once per arguments
+
+        stats = self.runner.get_stats()["pure"]
+        self.assertEqual((stats["calls"], stats["memo_hits"], stats["errors"]), (4, 2, 0))
+
+    def test_impure_macro_not_memoized(self):
+        self.assertEqual(self.converter("x <<impure>>foo<</impure>>"), "<p>x <span>1</span></p>")
+        self.assertEqual(self.converter("x <<impure>>foo<</impure>>"), "<p>x <span>2</span></p>")
+
+        stats = self.runner.get_stats()["impure"]
+        self.assertEqual((stats["calls"], stats["memo_hits"]), (2, 0))
+        self.assertGreater(stats["total_time"], 0)
+        self.assertGreaterEqual(stats["total_time"], stats["max_time"])
+
+    def test_errors_counted(self):
+        html = self.converter("<<broken>>foo<</broken>>")
+        self.assertIn("Macro 'broken' error: broken", html)
+        self.assertEqual(self.runner.get_stats()["broken"]["errors"], 1)
+
+    def test_memo_size(self):
+        runner = MacroRunner(memo_size=2)
+        for text in ("a", "b", "c", "a"):
+            runner.call("pure", pure_macro, {"text": text})
+        self.assertEqual(CALLS, ["a", "b", "c", "a"])  # "a" was removed
+
+        runner = MacroRunner(memo_size=0)
+        for text in ("a", "a"):
+            runner.call("pure", pure_macro, {"text": text})
+        self.assertEqual(CALLS[4:], ["a", "a"])
+
+    def test_report_and_clear(self):
+        self.converter("<<impure>>foo<</impure>>")
+        report = self.runner.report()
+        self.assertIn("impure", report.splitlines()[1])
+        self.runner.clear()
+        self.assertEqual(self.runner.get_stats(), {})
+
+    def test_default_runner(self):
+        converter = Creole2HtmlConverter(macros=MACROS)
+        calls = default_runner.get_stats().get("impure", {}).get("calls", 0)
+        converter("<<impure>>foo<</impure>>")
+        self.assertEqual(default_runner.get_stats()["impure"]["calls"], calls + 1)
+
+    @unittest.skipUnless(PYGMENTS, "pygments is not installed")
+    def test_code_macro_guess_lexer(self):
+        # Without a known extension the lexer would be guessed from the code:
+        converter = Creole2HtmlConverter(macros=example_macros)
+        with mock.patch.object(example_macros, "PYGMENTS", True):
+            html = converter('<<code ext="">>\n<?php echo "foo"; ?>\n<</code>>')
+        self.assertIn('<div class="pygments">', html)
@@ -0,0 +1,212 @@
+"""
+    unittest for the conversion server
+    ~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~
+
+    :copyleft: 2026 by python-creole team, see AUTHORS for more details.
+    :license: GNU GPL v3 or above, see LICENSE for more details.
+"""
+
+
+import errno
+import http.client
+import json
+import os
+import socket
+import tempfile
+import threading
+import unittest
+from unittest import mock
+
+from creole.server import make_server
+
+
+class ServerTestMixin:
+    workers = 0
+
+    def setUp(self):
+        super().setUp()
+        self.server = self.make_server()
+        self.thread = threading.Thread(
+            target=self.server.serve_forever, kwargs={"poll_interval": 0.05}
+        )
+        self.thread.start()
+
+    def tearDown(self):
+        self.server.shutdown()
+        self.server.server_close()
+        self.thread.join()
+        super().tearDown()
+
+    def request(self, method, path, body=None):
+        connection = self.get_connection()
+        try:
+            connection.request(method, path, body=body)
+            response = connection.getresponse()
+            return response.status, response.read().decode("utf-8")
+        finally:
+            connection.close()
+
+    def test_convert(self):
+        self.assertEqual(
+            self.request("POST", "/creole2html", "**bold**".encode("utf-8")),
+            (200, "<p><strong>bold</strong></p>"),
+        )
+        self.assertEqual(
+            self.request("POST", "/html2creole", "<p><i>\xfc</i></p>".encode("utf-8")),
+            (200, "//\xfc//"),
+        )
+
+    def test_errors(self):
+        status, content = self.request("POST", "/creole2pdf", b"**bold**")
+        self.assertEqual(status, 404)
+        self.assertIn("creole2html", content)
+
+        status, content = self.request("POST", "/creole2html", b"\xff")
+        self.assertEqual(status, 400)
+        self.assertIn("UnicodeDecodeError", content)
+
+    def test_negative_content_length(self):
+        sock = self.get_socket()
+        try:
+            sock.sendall(
+                b"POST /creole2html HTTP/1.1\r\nHost: localhost\r\nContent-Length: -1\r\n\r\n"
+            )
+            response = b""
+            while True:
+                data = sock.recv(4096)
+                if not data:
+                    break  # The server closed the connection
+                response += data
+        finally:
+            sock.close()
+        self.assertTrue(response.startswith(b"HTTP/1.1 400 "), response)
+        self.assertIn(b"Negative Content-Length", response)
+
+    def test_keep_alive(self):
+        connection = self.get_connection()
+        try:
+            for no in range(3):
+                connection.request("POST", "/creole2html", body=f"= {no}".encode("utf-8"))
+                response = connection.getresponse()
+                self.assertEqual(response.read(), f"<h1>{no}</h1>".encode("utf-8"))
+        finally:
+            connection.close()
+
+    def test_pipelining(self):
+        sock = self.get_socket()
+        try:
+            requests = b"".join(
+                b"POST /creole2html HTTP/1.1\r\nHost: localhost\r\nContent-Length: 3\r\n\r\n= " + no
+                for no in (b"1", b"2")
+            )
+            sock.sendall(requests)
+            responses = b""
+            while responses.count(b"</h1>") < 2:
+                data = sock.recv(4096)
+                if not data:
+                    break
+                responses += data
+        finally:
+            sock.close()
+        self.assertEqual(responses.count(b"HTTP/1.1 200 OK"), 2)
+        self.assertLess(responses.index(b"<h1>1</h1>"), responses.index(b"<h1>2</h1>"))
+
+    def test_metrics(self):
+        self.request("POST", "/creole2html", b"**bold**")
+        self.request("POST", "/html2rest", b"<p>x</p>")
+        status, content = self.request("GET", "/metrics")
+        self.assertEqual(status, 200)
+        metrics = json.loads(content)
+        self.assertEqual(metrics["requests"], 2)
+        self.assertEqual(metrics["errors"], 0)
+        self.assertEqual(metrics["directions"], {"creole2html": 1, "html2rest": 1})
+        self.assertEqual(sum(metrics["latency_histogram"].values()), 2)
+        self.assertGreater(metrics["requests_per_second"], 0)
+
+
+class TestHTTPServer(ServerTestMixin, unittest.TestCase):
+    def make_server(self):
+        return make_server(port=0, workers=self.workers)
+
+    def get_connection(self):
+        host, port = self.server.server_address[:2]
+        return http.client.HTTPConnection(host, port, timeout=10)
+
+    def get_socket(self):
+        sock = socket.create_connection(self.server.server_address[:2], timeout=10)
+        return sock
+
+    def test_unix_socket_not_supported(self):
+        with mock.patch("creole.server.socket") as socket_mock:
+            del socket_mock.AF_UNIX  # e.g. on Windows
+            with self.assertRaises(OSError) as cm:
+                make_server(unix_socket="creole.sock", workers=0)
+        self.assertEqual(cm.exception.errno, errno.EAFNOSUPPORT)
+        self.assertIn("Unix sockets are not supported", str(cm.exception))
+
+
+class TestWorkerPool(TestHTTPServer):
+    workers = 2
+
+
+@unittest.skipUnless(hasattr(socket, "AF_UNIX"), "Unix sockets not supported")
+class TestUnixServer(ServerTestMixin, unittest.TestCase):
+    def make_server(self):
+        self.temp_dir = tempfile.TemporaryDirectory()
+        self.socket_path = os.path.join(self.temp_dir.name, "creole.sock")
+        return make_server(unix_socket=self.socket_path, workers=self.workers)
+
+    def tearDown(self):
+        super().tearDown()
+        self.assertFalse(os.path.exists(self.socket_path))
+        self.temp_dir.cleanup()
+
+    def test_stale_socket_replaced(self):
+        # e.g. left over by a killed server:
+        path = os.path.join(self.temp_dir.name, "stale.sock")
+        with socket.socket(socket.AF_UNIX, socket.SOCK_STREAM) as stale:
+            stale.bind(path)
+        server = make_server(unix_socket=path, workers=0)
+        server.server_close()
+        self.assertFalse(os.path.exists(path))
+
+    def test_used_socket_not_replaced(self):
+        with self.assertRaises(OSError) as cm:
+            make_server(unix_socket=self.socket_path, workers=0)
+        self.assertEqual(cm.exception.errno, errno.EADDRINUSE)
+        # The first server is still listening:
+        self.assertEqual(
+            self.request("POST", "/creole2html", b"**bold**"),
+            (200, "<p><strong>bold</strong></p>"),
+        )
+
+    def test_no_socket_not_removed(self):
+        path = os.path.join(self.temp_dir.name, "important.txt")
+        with open(path, "w") as f:
+            f.write("data")
+        with self.assertRaises(FileExistsError) as cm:
+            make_server(unix_socket=path, workers=0)
+        self.assertIn("is not a socket", str(cm.exception))
+        with open(path) as f:
+            self.assertEqual(f.read(), "data")
+
+    def test_foreign_socket_not_removed(self):
+        path = os.path.join(self.temp_dir.name, "other.sock")
+        server = make_server(unix_socket=path, workers=0)
+        # Another server was started on the same path:
+        os.remove(path)
+        with socket.socket(socket.AF_UNIX, socket.SOCK_STREAM) as other:
+            other.bind(path)
+            server.server_close()
+            self.assertTrue(os.path.exists(path))
+
+    def get_socket(self):
+        sock = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+        sock.settimeout(10)
+        sock.connect(self.socket_path)
+        return sock
+
+    def get_connection(self):
+        connection = http.client.HTTPConnection("localhost", timeout=10)
+        connection.sock = self.get_socket()
+        return connection